@@ -0,0 +1,58 @@
+"""
+Benchmark the batch mode against one process per pipeline
+
+Pipelines of the calc example are run by starting the app once per pipeline,
+or once for all of them with `--batch`.
+
+Usage:
+    python benchmarks/bench_batch.py [NUM_LINES ...]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+APP = [sys.executable, "-m", "examples.calc.calc"]
+
+
+def get_lines(num_lines: int, tmpdir: str) -> list[list[str]]:
+    return [
+        [f"-range,0,{i % 100 + 1}", os.path.join(tmpdir, f"output{i}.json")]
+        for i in range(num_lines)
+    ]
+
+
+def bench(num_lines: int, jobs: int) -> tuple[float, float]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        lines = get_lines(num_lines, tmpdir)
+        start = time.perf_counter()
+        for line in lines:
+            subprocess.run([*APP, *line], check=True)
+        separate = time.perf_counter() - start
+
+        path = os.path.join(tmpdir, "batch.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(" ".join(line) for line in lines))
+        start = time.perf_counter()
+        subprocess.run(
+            [*APP, "--batch", path, "--jobs", str(jobs)],
+            check=True,
+            stderr=subprocess.DEVNULL,
+        )
+        batch = time.perf_counter() - start
+    return separate, batch
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'lines':>8} {'processes':>12} {'batch':>12}")  # noqa: T201
+    for num_lines in sizes:
+        separate, batch = bench(num_lines, jobs=4)
+        print(  # noqa: T201
+            f"{num_lines:>8} {separate * 1e3:>9.0f} ms {batch * 1e3:>9.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100])
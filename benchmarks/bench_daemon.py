@@ -0,0 +1,80 @@
+"""
+Benchmark the latency of a trivial pipeline run by the daemon
+
+The pipeline of the calc example is run by a cold process of the application,
+by a process of the client sending it to the daemon, and by a round trip to the
+daemon from a running process.
+
+Usage:
+    python benchmarks/bench_daemon.py [NUM_RUNS]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+
+from clios.cli.client import run
+
+ARGS = ["-print", "-add", "1", "2"]
+
+
+def measure(func: t.Callable[[], t.Any], num_runs: int) -> list[float]:
+    durations = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main(num_runs: int) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "clios.sock")
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "examples.calc.calc", "--serve", path],
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+            with open(os.devnull, "w") as devnull:
+                fds = (0, devnull.fileno(), devnull.fileno())
+
+                def cold() -> None:
+                    subprocess.run(
+                        [sys.executable, "-m", "examples.calc.calc", *ARGS],
+                        check=True,
+                        stdout=devnull,
+                    )
+
+                def client() -> None:
+                    subprocess.run(
+                        [sys.executable, "-m", "clios.cli.client", path, *ARGS],
+                        check=True,
+                        stdout=devnull,
+                    )
+
+                results = {
+                    "cold CLI": measure(cold, num_runs),
+                    "client": measure(client, num_runs),
+                    "round trip": measure(lambda: run(path, ARGS, fds=fds), num_runs),
+                }
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    print(f"{'':>12} {'median':>10} {'p95':>10} {'max':>10}")  # noqa: T201
+    for name, durations in results.items():
+        p95 = statistics.quantiles(durations, n=20, method="inclusive")[-1]
+        print(  # noqa: T201
+            f"{name:>12} {statistics.median(durations) * 1e3:>7.1f} ms "
+            f"{p95 * 1e3:>7.1f} ms {max(durations) * 1e3:>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,102 @@
+"""
+Benchmark the parsing of the docstrings of a large number of operators
+
+The short description, the long description and the examples of each operator
+are read, as by `--list --show` or a documentation generator, when each of them
+parses the docstring (as before it was cached), when the docstring is parsed
+once, and when all the docstrings are parsed by `OperatorFns.parse_docstrings`
+in this process or in worker processes.
+
+Usage:
+    python benchmarks/bench_docstrings.py [NUM_OPERATORS] [PROCESSES]
+"""
+
+import os
+import sys
+import time
+import typing as t
+
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFns, _parse_docstring, parse_description
+
+
+def make_operator(i: int) -> t.Callable[..., float]:
+    def operator(input1: float, input2: float) -> float:
+        return input1 + input2
+
+    operator.__name__ = operator.__qualname__ = f"op{i}"
+    operator.__doc__ = f"""
+    Add the inputs ({i})
+
+    description:
+        The inputs are added, and the sum is returned. This is operator {i}.
+
+    Operator Examples:
+        Example 1:
+            -op{i} 1 2 output
+        Example 2:
+            -op{i} -op{i} 1 2 3 output
+    """
+    return operator
+
+
+def get_registry(num_operators: int) -> OperatorFns:
+    operator_fns = OperatorFns()
+    param_parser = StandardParamParser()
+    for i in range(num_operators):
+        operator_fns.register(param_parser=param_parser, implicit="input")(
+            make_operator(i)
+        )
+    return operator_fns
+
+
+def read_descriptions(operator_fns: OperatorFns) -> list[tuple[t.Any, ...]]:
+    descriptions = []
+    for name in operator_fns:
+        operator_fn = operator_fns.peek(name)
+        descriptions.append(
+            (
+                operator_fn.short_description,
+                operator_fn.long_description,
+                operator_fn.examples,
+            )
+        )
+    return descriptions
+
+
+def measure(func: t.Callable[[], t.Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(num_operators: int, processes: int) -> None:
+    operator_fns = get_registry(num_operators)
+    docstrings = [operator_fns.peek(name).callback.__doc__ for name in operator_fns]
+    # warm up the import of griffe
+    parse_description(docstrings[0])
+    times = {
+        # each description parsed the docstring again
+        "uncached": measure(
+            lambda: [
+                (parse_description(d), _parse_docstring(d), _parse_docstring(d))
+                for d in docstrings
+            ]
+        ),
+        "cached (first read)": measure(lambda: read_descriptions(operator_fns)),
+        "cached (second read)": measure(lambda: read_descriptions(operator_fns)),
+        "bulk (this process)": measure(
+            lambda: get_registry(num_operators).parse_docstrings()
+        ),
+        f"bulk ({processes} processes)": measure(
+            lambda: get_registry(num_operators).parse_docstrings(processes=processes)
+        ),
+    }
+    print(f"{num_operators} operators")  # noqa: T201
+    for name, duration in times.items():
+        print(f"  {name:<22} {duration * 1e3:>9.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*args[:1] or [1000], *args[1:2] or [os.cpu_count() or 1])
@@ -0,0 +1,64 @@
+"""
+Benchmark the execution overhead of the operator tree per node
+
+Chains of `neg` operators of increasing depth are executed with the iterative
+`SerialExecutor` and with an executor which recurses into the input operators.
+
+Usage:
+    python benchmarks/bench_executor.py [DEPTH ...]
+"""
+
+import sys
+import time
+import typing as t
+
+from clios.cli.param_parser import StandardParamParser
+from clios.core.executor import ExecutorAbc, SerialExecutor
+from clios.core.operator import Operator, OperatorAbc, SimpleOperator
+from clios.core.operator_fn import OperatorFn
+
+
+def neg(i: int) -> int:
+    return -i
+
+
+neg_fn = OperatorFn.from_def(neg, param_parser=StandardParamParser(), implicit="input")
+
+
+class RecursiveExecutor(ExecutorAbc):
+    """Execute the input operators by recursion"""
+
+    def execute_inputs(self, inputs: tuple[OperatorAbc, ...]) -> list[t.Any]:
+        return [self.execute(input_) for input_ in inputs]
+
+
+def get_chain(depth: int) -> OperatorAbc:
+    op: OperatorAbc = SimpleOperator("i", 0, 1)
+    for index in range(depth):
+        op = Operator("neg", index, neg_fn, inputs=(op,))
+    return op
+
+
+def bench(executor: ExecutorAbc, op: OperatorAbc, depth: int) -> str:
+    repeat = max(1, 100_000 // depth)
+    start = time.perf_counter()
+    try:
+        for _ in range(repeat):
+            executor.execute(op)
+    except RecursionError:
+        return f"{'RecursionError':>14}"
+    elapsed = time.perf_counter() - start
+    return f"{elapsed / repeat / depth * 1e6:11.2f} us"
+
+
+def main(depths: list[int]) -> None:
+    print(f"{'depth':>8} {'iterative':>14} {'recursive':>14}")  # noqa: T201
+    for depth in depths:
+        op = get_chain(depth)
+        iterative = bench(SerialExecutor(), op, depth)
+        recursive = bench(RecursiveExecutor(), op, depth)
+        print(f"{depth:>8} {iterative} {recursive}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 1_000, 100_000])
@@ -0,0 +1,60 @@
+"""
+Benchmark the import time of the application against that of its dependencies
+
+`from clios import Clios` and the import of click and pydantic are each run by
+`python -X importtime` a few times, the best run is kept, and the ratio is
+checked against a budget.
+
+Usage:
+    python benchmarks/bench_import.py [NUM_RUNS]
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[1]
+
+# the import of the application, against the import of its dependencies
+BUDGET = 2.5
+CODE = "from clios import Clios"
+REFERENCE = (
+    "import click, pydantic, pydantic.dataclasses, pydantic.functional_validators"
+)
+
+
+def get_import_time(code: str) -> int:
+    """Get the total import time (us) of running code with `python -X importtime`"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+    )
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # the top-level imports only, as the cumulative times include the others
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def main(num_runs: int) -> None:
+    # the best of a few runs, as the first one may fill the caches
+    total = min(get_import_time(CODE) for _ in range(num_runs))
+    reference = min(get_import_time(REFERENCE) for _ in range(num_runs))
+    ratio = total / reference
+    print(f"{'clios':>12} {total / 1e3:>7.1f} ms")  # noqa: T201
+    print(f"{'dependencies':>12} {reference / 1e3:>7.1f} ms")  # noqa: T201
+    status = "within" if ratio <= BUDGET else "over"
+    print(f"{'ratio':>12} {ratio:>7.2f} ({status} the budget of {BUDGET})")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
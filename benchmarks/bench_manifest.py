@@ -0,0 +1,90 @@
+"""
+Benchmark the listing of a large number of operators, with and without a manifest
+
+Without a manifest, the docstring of each operator is parsed by `--list`, and
+`--show` builds the operator function. With a manifest, they only read it.
+
+Usage:
+    python benchmarks/bench_manifest.py [NUM_OPERATORS ...]
+"""
+
+import contextlib
+import functools
+import io
+import os
+import sys
+import tempfile
+import time
+import typing as t
+
+from clios.cli.main_parser import CliParser
+from clios.cli.manifest import Manifest
+from clios.cli.param_parser import StandardParamParser
+from clios.cli.presenter import CliPresenter
+from clios.core.operator_fn import OperatorFns
+from clios.core.param_info import Param
+
+
+def make_operator(i: int) -> t.Callable[..., float]:
+    def operator(
+        input1: float, input2: float, *, scale: t.Annotated[float, Param()] = 1.0
+    ) -> float:
+        """
+        Scale the sum of the inputs
+
+        description:
+            The inputs are added, and their sum is multiplied by `scale`.
+
+        Operator Examples:
+            -op,scale=2 1 2 output
+        """
+        return (input1 + input2) * scale
+
+    operator.__name__ = operator.__qualname__ = f"op{i}"
+    return operator
+
+
+def get_registry(operators: list[t.Callable[..., float]]) -> OperatorFns:
+    operator_fns = OperatorFns()
+    param_parser = StandardParamParser()
+    for operator in operators:
+        operator_fns.register(param_parser=param_parser, implicit="input")(operator)
+    return operator_fns
+
+
+def measure(func: t.Callable[[], t.Any]) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    return time.perf_counter() - start
+
+
+def bench(num_operators: int) -> dict[str, float]:
+    operators = [make_operator(i) for i in range(num_operators)]
+    parser = CliParser()
+    times: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "manifest.json")
+        times["build"] = measure(
+            lambda: Manifest.build(get_registry(operators), parser).write(path)
+        )
+        for name, manifest in (("docstrings", None), ("manifest", path)):
+            presenter = CliPresenter(get_registry(operators), parser, manifest)
+            if manifest is not None:
+                times["load"] = measure(presenter.load_manifest)
+            times[f"list ({name})"] = measure(presenter.print_list)
+            presenter = CliPresenter(get_registry(operators), parser, manifest)
+            show = functools.partial(presenter.print_detail, "op0")
+            times[f"show ({name})"] = measure(show)
+    return times
+
+
+def main(sizes: list[int]) -> None:
+    for num_operators in sizes:
+        print(f"{num_operators} operators")  # noqa: T201
+        for name, duration in bench(num_operators).items():
+            print(f"  {name:<20} {duration * 1e3:>9.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1500])
@@ -0,0 +1,69 @@
+"""
+Benchmark the time to parse a command line per token
+
+Synthetic command lines of increasing size are parsed: a deep chain of
+operators, a single operator with many inputs, and nested bracket groups.
+
+Usage:
+    python benchmarks/bench_parser.py [NUM_TOKENS ...]
+"""
+
+import sys
+import time
+import typing as t
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.param_info import Output
+
+intOut = t.Annotated[int, Output(callback=print, num_outputs=0)]
+
+
+def neg(i: int) -> intOut:
+    return -i
+
+
+def add(*i: int) -> intOut:
+    return sum(i)
+
+
+operator_fns = OperatorFns()
+for func in (neg, add):
+    operator_fns[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+
+
+def get_chain(num_tokens: int) -> list[str]:
+    return ["-neg"] * (num_tokens - 1) + ["1"]
+
+
+def get_wide(num_tokens: int) -> list[str]:
+    return ["-add", "["] + ["1"] * (num_tokens - 3) + ["]"]
+
+
+def get_nested(num_tokens: int) -> list[str]:
+    depth = num_tokens // 4
+    return ["-add", "[", "1"] * depth + ["]"] * depth
+
+
+def bench(argv: list[str]) -> str:
+    parser = CliParser()
+    repeat = max(1, 200_000 // len(argv))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parser.get_operator(operator_fns=operator_fns, input=argv)
+    elapsed = time.perf_counter() - start
+    return f"{elapsed / repeat / len(argv) * 1e6:9.2f} us"
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'tokens':>8} {'chain':>12} {'wide':>12} {'nested':>12}")  # noqa: T201
+    for size in sizes:
+        results = [bench(get(size)) for get in (get_chain, get_wide, get_nested)]
+        print(f"{size:>8} {' '.join(f'{r:>12}' for r in results)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,62 @@
+"""
+Benchmark the registration of a large number of operators
+
+The operators are registered, one of them is looked up, as for a command line,
+and then all of them are built, as by `OperatorFns.validate_all` (or as when
+the operator functions were built by the registration).
+
+Usage:
+    python benchmarks/bench_registry.py [NUM_OPERATORS ...]
+"""
+
+import sys
+import time
+import typing as t
+
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFns
+from clios.core.param_info import Param
+
+
+def make_operator(i: int) -> t.Callable[..., float]:
+    def operator(
+        input1: float, input2: float, *, scale: t.Annotated[float, Param()] = 1.0
+    ) -> float:
+        """Scale the sum of the inputs"""
+        return (input1 + input2) * scale
+
+    operator.__name__ = operator.__qualname__ = f"op{i}"
+    return operator
+
+
+def bench(num_operators: int) -> tuple[float, float, float]:
+    operators = [make_operator(i) for i in range(num_operators)]
+    param_parser = StandardParamParser()
+    start = time.perf_counter()
+    operator_fns = OperatorFns()
+    for operator in operators:
+        operator_fns.register(param_parser=param_parser, implicit="input")(operator)
+    register = time.perf_counter() - start
+
+    start = time.perf_counter()
+    operator_fns["op0"]
+    lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    operator_fns.validate_all()
+    build_all = time.perf_counter() - start
+    return register, lookup, build_all
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'operators':>10} {'register':>12} {'lookup':>12} {'build all':>12}")  # noqa: T201
+    for num_operators in sizes:
+        register, lookup, build_all = bench(num_operators)
+        print(  # noqa: T201
+            f"{num_operators:>10} {register * 1e3:>9.1f} ms "
+            f"{lookup * 1e3:>9.1f} ms {build_all * 1e3:>9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1500])
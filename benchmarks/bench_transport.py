@@ -0,0 +1,66 @@
+"""
+Benchmark sending numpy arrays from a worker process back to the parent
+
+An array is created by a worker process and sent back pickled or through
+shared memory. The time to create the array (measured by sending nothing back)
+is subtracted, so that only the time to send the array is reported.
+
+Usage:
+    python benchmarks/bench_transport.py [SIZE_IN_MB ...]
+"""
+
+import sys
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from clios.core.transport import PickleTransport, SharedMemoryTransport, TransportAbc
+
+
+def make(size: int, transport: TransportAbc | None) -> t.Any:
+    array = np.ones(size, dtype=np.uint8)
+    if transport is None:
+        return None
+    return transport.send(array)
+
+
+def bench(
+    pool: ProcessPoolExecutor, size: int, transport: TransportAbc | None
+) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        value = pool.submit(make, size, transport).result()
+        if transport is not None:
+            value = transport.receive(value)
+            assert value[-1] == 1
+        best = min(best, time.perf_counter() - start)
+        del value
+    return best
+
+
+def main(sizes: list[int]) -> None:
+    transports: dict[str, TransportAbc] = {
+        "pickle": PickleTransport(),
+        "shared memory": SharedMemoryTransport(),
+    }
+    for transport in transports.values():
+        transport.prepare()
+    print(f"{'size':>8} {'pickle':>12} {'shared memory':>14}")  # noqa: T201
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        for size_mb in sizes:
+            size = size_mb * 10**6
+            baseline = bench(pool, size, None)
+            results = [
+                max(bench(pool, size, transport) - baseline, 0.0)
+                for transport in transports.values()
+            ]
+            print(  # noqa: T201
+                f"{size_mb:>6}MB {results[0] * 1e3:>9.1f} ms {results[1] * 1e3:>11.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000, 2000])
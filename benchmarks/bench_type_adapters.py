@@ -0,0 +1,85 @@
+"""
+Benchmark the interning of the type adapters of the parameters
+
+A large number of operators with the same annotations are built, with each
+parameter sharing the type adapter of the identical annotations, and with a
+type adapter per parameter (as before the interning). The time, the memory
+still allocated once the operators are built (traced by `tracemalloc`), the
+memory saved by the interning (the difference), and the hit rate are reported.
+
+Usage:
+    python benchmarks/bench_type_adapters.py [NUM_OPERATORS ...]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import typing as t
+
+import clios.core.parameter
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFns
+from clios.core.param_info import Param
+from clios.core.type_adapters import TypeAdapters, _build
+
+
+class Uninterned(TypeAdapters):
+    """A type adapter per call, as before the interning"""
+
+    @t.override
+    def get(self, annotation: t.Any) -> t.Any:
+        return _build(annotation)
+
+
+def make_operator(i: int) -> t.Callable[..., float]:
+    def operator(
+        input1: float, input2: float, *, scale: t.Annotated[float, Param()] = 1.0
+    ) -> float:
+        """Scale the sum of the inputs"""
+        return (input1 + input2) * scale
+
+    operator.__name__ = operator.__qualname__ = f"op{i}"
+    return operator
+
+
+def bench(num_operators: int, type_adapters: TypeAdapters) -> tuple[float, int]:
+    clios.core.parameter.type_adapters = type_adapters
+    operators = [make_operator(i) for i in range(num_operators)]
+    param_parser = StandardParamParser()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    operator_fns = OperatorFns()
+    for operator in operators:
+        operator_fns.register(param_parser=param_parser, implicit="input")(operator)
+    operator_fns.validate_all()
+    duration = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del operator_fns
+    return duration, memory
+
+
+def main(sizes: list[int]) -> None:
+    # the first type adapters fill the caches of pydantic, which are not counted
+    bench(1, Uninterned())
+    print(  # noqa: T201
+        f"{'operators':>10} {'uninterned':>22} {'interned':>22} {'hit rate':>9} "
+        f"{'saved':>10}"
+    )
+    for num_operators in sizes:
+        uninterned, uninterned_memory = bench(num_operators, Uninterned())
+        type_adapters = TypeAdapters()
+        interned, interned_memory = bench(num_operators, type_adapters)
+        saved = uninterned_memory - interned_memory
+        print(  # noqa: T201
+            f"{num_operators:>10} {uninterned * 1e3:>8.1f} ms "
+            f"{uninterned_memory / 2**20:>7.1f} MiB "
+            f"{interned * 1e3:>8.1f} ms {interned_memory / 2**20:>7.1f} MiB "
+            f"{type_adapters.stats().hit_rate:>9.1%} {saved / 2**20:>6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1500])
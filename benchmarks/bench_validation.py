@@ -0,0 +1,77 @@
+"""
+Benchmark the validation overhead of small scalar pipelines
+
+Chains of `add` operators (as in the calc example) of increasing length are
+compiled into an execution plan and executed repeatedly, skipping the no-op
+validators and the validation of trusted outputs, or calling every validator.
+
+Usage:
+    python benchmarks/bench_validation.py [LENGTH ...]
+"""
+
+import sys
+import time
+import typing as t
+from dataclasses import replace
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.param_info import Output
+from clios.core.parameter import Parameters
+from clios.core.plan import ExecutionPlan
+
+
+def identity(value: t.Any) -> t.Any:
+    return value
+
+
+def add(
+    input1: float, input2: float
+) -> t.Annotated[float, Output(callback=identity, num_outputs=0, trusted=True)]:
+    return input1 + input2
+
+
+def get_operator_fns(skip: bool) -> OperatorFns:
+    operator_fn = OperatorFn.from_def(
+        add, param_parser=StandardParamParser(), implicit="input"
+    )
+    if not skip:
+        parameters = Parameters(
+            replace(param, build_phase_noop=False, execute_phase_noop=False)
+            for param in operator_fn.parameters
+        )
+        output = replace(
+            operator_fn.output, info=replace(operator_fn.output.info, trusted=False)
+        )
+        operator_fn = replace(operator_fn, parameters=parameters, output=output)
+    operator_fns = OperatorFns()
+    operator_fns["add"] = operator_fn
+    return operator_fns
+
+
+def bench(length: int, skip: bool) -> float:
+    tokens = ["-add", "1"] * length + ["1"]
+    operator = CliParser().get_operator(get_operator_fns(skip), tokens)
+    plan = ExecutionPlan.from_operator(operator)
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(100):
+            plan.execute()
+        best = min(best, (time.perf_counter() - start) / 100)
+    return best
+
+
+def main(lengths: list[int]) -> None:
+    print(f"{'length':>8} {'validate all':>14} {'skip no-ops':>14}")  # noqa: T201
+    for length in lengths:
+        validate_all = bench(length, skip=False)
+        skip = bench(length, skip=True)
+        print(  # noqa: T201
+            f"{length:>8} {validate_all * 1e6:>11.1f} us {skip * 1e6:>11.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1, 10, 100])
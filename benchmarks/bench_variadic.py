@@ -0,0 +1,89 @@
+"""
+Benchmark the validation of variadic arguments and inputs
+
+The variable arguments of an operator are parsed from its parameter string
+(build phase) and its variable inputs are validated before its callback is
+called (execute phase), either at once or one by one.
+
+Usage:
+    python benchmarks/bench_variadic.py [NUM_VALUES ...]
+"""
+
+import sys
+import time
+import typing as t
+
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator import Operator, SimpleOperator
+from clios.core.operator_fn import OperatorFn
+from clios.core.param_info import Input, Param
+
+
+def total(
+    *values: t.Annotated[float, Param()],
+) -> float:
+    return sum(values)
+
+
+def mean(
+    *inputs: t.Annotated[float, Input(core_validation_phase="execute")],
+) -> float:
+    return sum(inputs) / len(inputs)
+
+
+class OneByOneParamParser(StandardParamParser):
+    def _validate_var_arguments(self, parameters, var_args):
+        param = parameters.var_argument
+        return [
+            self._validate_argument(param, arg, spos, epos)
+            for arg, spos, epos in var_args
+        ]
+
+
+parser = StandardParamParser()
+one_by_one_parser = OneByOneParamParser()
+total_fn = OperatorFn.from_def(total, param_parser=parser, implicit="param")
+mean_fn = OperatorFn.from_def(mean, param_parser=parser, implicit="input")
+
+
+def best_of(func: t.Callable[[], t.Any]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_build(num_values: int) -> tuple[float, float]:
+    string = ",".join(str(i) for i in range(num_values))
+    parameters = total_fn.parameters
+    return best_of(
+        lambda: one_by_one_parser.parse_arguments(string, parameters)
+    ), best_of(lambda: parser.parse_arguments(string, parameters))
+
+
+def bench_execute(num_values: int) -> tuple[float, float]:
+    inputs = tuple(SimpleOperator(str(i), i, str(i)) for i in range(num_values))
+    operator = Operator("mean", 0, mean_fn, inputs=inputs)
+    values = [input_.input_ for input_ in inputs]
+    return best_of(lambda: operator._validate_each_input_value(values)), best_of(
+        lambda: operator._validate_input_values(values)
+    )
+
+
+def main(sizes: list[int]) -> None:
+    print(  # noqa: T201
+        f"{'values':>8} {'phase':>8} {'one by one':>12} {'at once':>12}"
+    )
+    for num_values in sizes:
+        for phase, bench in (("build", bench_build), ("execute", bench_execute)):
+            one_by_one, at_once = bench(num_values)
+            print(  # noqa: T201
+                f"{num_values:>8} {phase:>8} {one_by_one * 1e3:>9.2f} ms "
+                f"{at_once * 1e3:>9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
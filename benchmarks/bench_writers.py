@@ -0,0 +1,56 @@
+"""
+Benchmark the writing of multiple compressed outputs
+
+The same array is written to 8 gzip-compressed files, by a callback writing
+them one after the other, or by a writer per output called concurrently.
+
+Usage:
+    python benchmarks/bench_writers.py [SIZE_MB ...]
+"""
+
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+from clios.core.writer import write_outputs
+
+NUM_OUTPUTS = 8
+
+
+def write(value: bytes, path: str) -> None:
+    with gzip.open(path, "wb", compresslevel=6) as f:
+        f.write(value)
+
+
+def callback(value: bytes, *paths: str) -> None:
+    for path in paths:
+        write(value, path)
+
+
+def bench(size: int) -> tuple[float, float]:
+    # compressible but not trivially so
+    value = os.urandom(size // 4) * 4
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = [os.path.join(tmpdir, f"output{i}.gz") for i in range(NUM_OUTPUTS)]
+        start = time.perf_counter()
+        callback(value, *paths)
+        serial = time.perf_counter() - start
+        start = time.perf_counter()
+        write_outputs(value, [write] * NUM_OUTPUTS, paths)
+        concurrent = time.perf_counter() - start
+    return serial, concurrent
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'size':>8} {'callback':>12} {'writers':>12}")  # noqa: T201
+    for size in sizes:
+        serial, concurrent = bench(size * 2**20)
+        print(  # noqa: T201
+            f"{size:>5} MB {serial * 1e3:>9.1f} ms {concurrent * 1e3:>9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1, 8, 32])
@@ -1,28 +1,41 @@
+import importlib
 import typing as t
 
-from rich import print
-
-from .cli.app import Clios as Clios
-from .cli.app import OperatorFns as OperatorFns
-from .cli.app import operator as operator
-from .core.exceptions import CliosError as CliosError
-from .core.operator import OperatorError as OperatorError
-from .core.param_info import Input as Input
-from .core.param_info import Output as Output
-from .core.param_info import Param as Param
-
-registry = OperatorFns()
-
-
-@registry.register(name="print")
-def _output(input: t.Annotated[t.Any, Input()]) -> None:
-    """
-    Print the given input data to the terminal.
-
-    description:
-        It uses the `rich` library to print the data in a formatted way.
-    """
-    print(input)  # noqa: T201 # pragma: no cover
-
-
-main = Clios(registry)
+if t.TYPE_CHECKING:
+    from ._registry import main as main
+    from ._registry import registry as registry
+    from .cli.app import Clios as Clios
+    from .cli.app import OperatorFns as OperatorFns
+    from .cli.app import operator as operator
+    from .core.exceptions import CliosError as CliosError
+    from .core.operator import OperatorError as OperatorError
+    from .core.param_info import Input as Input
+    from .core.param_info import Output as Output
+    from .core.param_info import Param as Param
+
+# the names are imported when they are first used, so that importing a
+# submodule (e.g. the client of the daemon) does not import the whole package
+_EXPORTS = {
+    "Clios": ".cli.app",
+    "OperatorFns": ".cli.app",
+    "operator": ".cli.app",
+    "CliosError": ".core.exceptions",
+    "OperatorError": ".core.operator",
+    "Input": ".core.param_info",
+    "Output": ".core.param_info",
+    "Param": ".core.param_info",
+    "registry": "._registry",
+    "main": "._registry",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,22 @@
+import typing as t
+
+from .cli.app import Clios, OperatorFns
+from .core.param_info import Input
+
+registry = OperatorFns()
+
+
+@registry.register(name="print")
+def _output(input: t.Annotated[t.Any, Input()]) -> None:
+    """
+    Print the given input data to the terminal.
+
+    description:
+        It uses the `rich` library to print the data in a formatted way.
+    """
+    from rich import print
+
+    print(input)  # noqa: T201 # pragma: no cover
+
+
+main = Clios(registry)
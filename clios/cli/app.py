@@ -1,15 +1,19 @@
 import typing as t
+from functools import cached_property
 
 import click
-from rich import print
 
 from clios.core.param_parser import ParamParserAbc
 
+from ..core.cache import ResultCache
 from ..core.operator_fn import OperatorFn
 from ..core.operator_fn import OperatorFns as OperatorFns_
 from .main_parser import CliParser
 from .param_parser import StandardParamParser
-from .presenter import CliPresenter
+
+if t.TYPE_CHECKING:
+    from ..core.spill import SerializerAbc
+    from .presenter import CliPresenter
 
 standard_param_parser = StandardParamParser()
 
@@ -18,10 +22,16 @@ def operator(
     *,
     param_parser: ParamParserAbc = standard_param_parser,
     implicit: t.Literal["input", "param"] = "param",
+    deterministic: bool = True,
+    cacheable: bool = False,
 ) -> t.Callable[..., t.Any]:
     def decorator(func: t.Callable[..., t.Any]) -> OperatorFn:
         operator_fn = OperatorFn.from_def(
-            func, param_parser=param_parser, implicit=implicit
+            func,
+            param_parser=param_parser,
+            implicit=implicit,
+            deterministic=deterministic,
+            cacheable=cacheable,
         )
         return operator_fn
 
@@ -37,27 +47,49 @@ class OperatorFns(OperatorFns_):
         param_parser: ParamParserAbc = standard_param_parser,
         implicit: t.Literal["input", "param"] = "param",
         is_delegate: bool = False,
+        deterministic: bool = True,
+        cacheable: bool = False,
     ) -> t.Callable[..., t.Any]:
         return super().register(
             name=name,
             param_parser=param_parser,
             implicit=implicit,
             is_delegate=is_delegate,
+            deterministic=deterministic,
+            cacheable=cacheable,
         )
 
 
 class Clios:
-    def __init__(self, operator_fns: OperatorFns_, exe_name: str = "") -> None:
+    def __init__(
+        self,
+        operator_fns: OperatorFns_,
+        exe_name: str = "",
+        cache: ResultCache | None = None,
+        manifest: str | None = None,
+        spill_serializers: "t.Mapping[type | str, SerializerAbc] | None" = None,
+    ) -> None:
         self._operators = operator_fns
         self._parser = CliParser()
-        self._presenter = CliPresenter(self._operators, self._parser)
         self._exe_name = exe_name
+        self._cache = ResultCache.default() if cache is None else cache
+        self._manifest = manifest
+        self._spill_serializers = spill_serializers
+
+    @cached_property
+    def _presenter(self) -> "CliPresenter":
+        # imported once there is something to run or to print, not for `--help`
+        from .presenter import CliPresenter
+
+        return CliPresenter(
+            self._operators, self._parser, self._manifest, self._spill_serializers
+        )
 
-    def __call__(self):
+    def __call__(self, args: list[str] | None = None):
         try:
-            res = _click_app(standalone_mode=False)
+            res = _click_app(args=args, standalone_mode=False)
         except click.exceptions.UsageError as e:
-            print(e.format_message())
+            _rich_print(e.format_message())
             with click.Context(_click_app) as ctx:
                 click.echo(_click_app.get_help(ctx))
             raise SystemExit(1)
@@ -69,20 +101,119 @@ class Clios:
         else:
             return
 
+        if options["serve"] is not None:
+            from .daemon import serve
+
+            return serve(self, options["serve"], self._parser, self._operators)
+        if options["build_manifest"]:
+            return self._presenter.build_manifest()
         if options["list"]:
             return self._presenter.print_list()
         if options["show"] is not None:
             return self._presenter.print_detail(options["show"], self._exe_name)
         if options["dry_run"]:
             return self._presenter.dry_run(args)
+        if sum(bool(options[key]) for key in ("threads", "processes", "asyncio")) > 1:
+            _rich_print(
+                "Options `--threads`, `--processes` and `--asyncio` are mutually exclusive!"
+            )
+            raise SystemExit(1)
+        if options["strict_memory"] and options["max_memory"] is None:
+            _rich_print("Option `--strict-memory` requires `--max-memory`!")
+            raise SystemExit(1)
+        if options["max_memory"] is not None:
+            # the operators are ordered and spilled by the serial executor only
+            for key in ("threads", "processes", "asyncio"):
+                if options[key]:
+                    _rich_print(
+                        f"Options `--max-memory` and `--{key}` are mutually exclusive!"
+                    )
+                    raise SystemExit(1)
         debug = options["debug"]
-        return self._presenter.run(args, debug)
+        run_options = {
+            "threads": options["threads"],
+            "processes": options["processes"],
+            "use_asyncio": options["asyncio"],
+            "cache": None if options["no_cache"] else self._cache,
+            "max_memory": options["max_memory"],
+            "strict_memory": options["strict_memory"],
+            "profile": options["profile"],
+        }
+        if options["map"] is not None:
+            for key in ("asyncio", "max_memory", "profile", "trace", "batch"):
+                if options[key]:
+                    option = "--" + key.replace("_", "-")
+                    _rich_print(
+                        f"Options `--map` and `{option}` are mutually exclusive!"
+                    )
+                    raise SystemExit(1)
+            failures = self._presenter.run_map(
+                args,
+                options["map"],
+                threads=options["threads"],
+                processes=options["processes"],
+                debug=debug,
+                cache=run_options["cache"],
+            )
+            if failures:
+                raise SystemExit(1)
+            return None
+        if options["batch"] is not None:
+            if args:
+                _rich_print("Option `--batch` does not take any other argument!")
+                raise SystemExit(1)
+            if options["trace"] is not None:
+                _rich_print("Options `--batch` and `--trace` are mutually exclusive!")
+                raise SystemExit(1)
+            statuses = self._presenter.run_batch(
+                options["batch"], options["jobs"], debug, **run_options
+            )
+            if any(statuses):
+                raise SystemExit(1)
+            return None
+        return self._presenter.run(args, debug, trace=options["trace"], **run_options)
+
+
+def _rich_print(*objects: t.Any) -> None:
+    """Print with rich, which is only imported when there is something to print"""
+    from rich import print as rich_print
+
+    rich_print(*objects)
+
+
+_SIZE_UNITS = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+
+
+class _ByteSize(click.ParamType):
+    """A size in bytes, with an optional binary suffix, e.g. 512M or 20G"""
+
+    name = "size"
+
+    def convert(self, value: t.Any, param: t.Any, ctx: t.Any) -> int:
+        if isinstance(value, int):
+            return value
+        string = str(value).strip().upper().removesuffix("B").removesuffix("I")
+        unit = string[-1:] if string[-1:] in _SIZE_UNITS else ""
+        try:
+            size = float(string.removesuffix(unit)) * _SIZE_UNITS[unit]
+        except ValueError:
+            self.fail(f"{value!r} is not a valid size", param, ctx)
+        if size < 0:
+            self.fail(f"{value!r} is not a valid size", param, ctx)
+        return int(size)
 
 
 @click.command(
     context_settings={"allow_extra_args": True, "ignore_unknown_options": True}
 )
 @click.option("--list", type=bool, help="List all available operators", is_flag=True)
+@click.option(
+    "--build-manifest",
+    type=bool,
+    help="Write the documentation of all the operators to the manifest of the "
+    "application, read by --list and --show until the operators are modified",
+    is_flag=True,
+)
 @click.option("--debug", type=bool, help="Turn on debugging", is_flag=True)
 @click.option(
     "--show", type=str, help="Show the help information for the given operator", nargs=1
@@ -90,6 +221,89 @@ class Clios:
 @click.option(
     "--dry-run", type=bool, help="Dry run: prints the call tree", is_flag=True
 )
+@click.option(
+    "--threads",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Execute independent input operators concurrently using N threads",
+)
+@click.option(
+    "--processes",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Execute independent input operators concurrently using N processes",
+)
+@click.option(
+    "--asyncio",
+    type=bool,
+    help="Execute the operators in an asyncio event loop",
+    is_flag=True,
+)
+@click.option(
+    "--no-cache",
+    type=bool,
+    help="Do not use the cached outputs of the cacheable operators",
+    is_flag=True,
+)
+@click.option(
+    "--max-memory",
+    type=_ByteSize(),
+    default=None,
+    help="Execute the operators serially in the order which uses the least memory, "
+    "spill intermediate values to disk above SIZE, and report the peak memory "
+    "usage against SIZE (e.g. 512M or 20G)",
+)
+@click.option(
+    "--strict-memory",
+    type=bool,
+    help="Exit with an error if the peak memory usage exceeds --max-memory",
+    is_flag=True,
+)
+@click.option(
+    "--profile",
+    type=bool,
+    help="Report the time spent by each operator in validation and callbacks, "
+    "and the type adapters shared by the parameters",
+    is_flag=True,
+)
+@click.option(
+    "--trace",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write a timeline of the parsing and the execution of the operators "
+    "to FILE in the Chrome Trace Event format (e.g. for https://ui.perfetto.dev)",
+)
+@click.option(
+    "--batch",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    default=None,
+    help="Run the operators of each line of FILE (`-` for the standard input), "
+    "given as a command line or as a JSON list of strings",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Run N lines of the batch file concurrently",
+)
+@click.option(
+    "--map",
+    type=str,
+    default=None,
+    help="Run the operators over each file matching the glob PATTERN, replacing "
+    "`{}` in the inputs and outputs by the path of the file (`{.}` without its "
+    "extension, `{/}` its name, `{/.}` its name without its extension), "
+    "in N threads (--threads) or processes (--processes)",
+    metavar="PATTERN",
+)
+@click.option(
+    "--serve",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Run the command lines sent to the Unix socket SOCKET by the client "
+    "(python -m clios.cli.client SOCKET ARGS...), keeping the operators loaded",
+    metavar="SOCKET",
+)
 @click.pass_context
 def _click_app(ctx: t.Any, **kwargs: t.Any) -> tuple[list[str], dict[str, t.Any]]:
     return ctx.args, kwargs
@@ -0,0 +1,71 @@
+"""
+A thin client of the daemon started by `--serve SOCKET`
+
+It only uses the standard library, so that it starts quickly.
+
+Usage:
+    python -m clios.cli.client SOCKET [ARGS ...]
+"""
+
+import json
+import os
+import socket
+import sys
+
+
+def run(
+    path: str,
+    args: list[str],
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    fds: tuple[int, int, int] = (0, 1, 2),
+) -> int:
+    """
+    Run a command line by the daemon listening on a Unix socket
+
+    The arguments are sent with the working directory, the environment and the
+    standard streams (`fds`), which are used by the daemon as its own, so that
+    the output is written as it is produced.
+
+    Args:
+        path: The path of the socket
+        args: The command line arguments
+        cwd: The working directory (default: the current one)
+        env: The environment variables (default: the current ones)
+        fds: The file descriptors of the standard input, output and error
+
+    Returns:
+        int: The exit status of the command
+    """
+    request = {
+        "argv": args,
+        "cwd": os.getcwd() if cwd is None else cwd,
+        "env": dict(os.environ) if env is None else env,
+    }
+    data = json.dumps(request).encode() + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sent = socket.send_fds(sock, [data], list(fds))
+        sock.sendall(data[sent:])
+        response = b""
+        while chunk := sock.recv(4096):
+            response += chunk
+    if not response:
+        raise ConnectionError("The daemon closed the connection without a status!")
+    return int(json.loads(response)["exit"])
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        print(__doc__.strip(), file=sys.stderr)  # noqa: T201
+        raise SystemExit(2)
+    try:
+        status = run(sys.argv[1], sys.argv[2:])
+    except (ConnectionError, FileNotFoundError) as e:
+        print(f"Cannot connect to the daemon: {e}", file=sys.stderr)  # noqa: T201
+        raise SystemExit(1)
+    raise SystemExit(status)
+
+
+if __name__ == "__main__":
+    main()
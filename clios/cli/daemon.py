@@ -0,0 +1,198 @@
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+import typing as t
+
+from ..core.operator_fn import OperatorFns
+from .main_parser import CliParser
+from .tokenizer import OperatorToken
+
+App = t.Callable[[list[str]], t.Any]
+
+# the maximum size of the first chunk of a request, which carries the streams
+_CHUNK_SIZE = 65536
+
+
+class _Request(t.NamedTuple):
+    argv: list[str]
+    cwd: str
+    env: dict[str, str]
+    fds: list[int]
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """Run a request in the process forked for it"""
+
+    server: "_Server"
+
+    def handle(self) -> None:
+        request = self.server.pending
+        assert request is not None
+        status = _run(self.server.app, request)
+        self.request.sendall(json.dumps({"exit": status}).encode() + b"\n")
+
+
+class _Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """
+    A Unix socket server forking a process for each request
+
+    The request is read by the server process, which loads the inline operator
+    modules and builds the operator functions of the request before forking, so
+    that they are loaded once for all the requests, as the imported modules.
+    """
+
+    allow_reuse_address = False
+    block_on_close = False
+
+    def __init__(
+        self, path: str, app: App, parser: CliParser, operator_fns: OperatorFns
+    ) -> None:
+        self.app = app
+        self.parser = parser
+        self.operator_fns = operator_fns
+        self.pending: _Request | None = None
+        # the socket is only accessible by its owner
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(umask)
+
+    def process_request(self, request: t.Any, client_address: t.Any) -> None:
+        try:
+            self.pending = _receive(request)
+        except (OSError, ValueError, KeyError):
+            self.shutdown_request(request)
+            return
+        try:
+            _load_operators(self.parser, self.operator_fns, self.pending)
+            super().process_request(request, client_address)
+        finally:
+            # only the server process gets here, the forked process exits
+            for fd in self.pending.fds:
+                os.close(fd)
+            self.pending = None
+
+
+def serve(app: App, path: str, parser: CliParser, operator_fns: OperatorFns) -> None:
+    """
+    Run the command lines sent to a Unix socket by `clios.cli.client`
+
+    Each command line is run by a process forked from the server process, in the
+    working directory and with the environment and the standard streams of the
+    client, and its exit status is sent back.
+
+    Args:
+        app: The application, called with the arguments of each command line
+        path: The path of the socket
+        parser: The parser of the application, loading the inline operators
+        operator_fns: The operator functions of the application
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        print("The daemon requires Unix sockets and fork!", file=sys.stderr)  # noqa: T201
+        raise SystemExit(1)
+    if os.path.exists(path):
+        if _is_serving(path):
+            print(f"A daemon is already listening on `{path}`!", file=sys.stderr)  # noqa: T201
+            raise SystemExit(1)
+        os.unlink(path)
+    _preload()
+    with _Server(path, app, parser, operator_fns) as server:
+        print(f"Listening on `{path}`", file=sys.stderr)  # noqa: T201
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
+def _preload() -> None:
+    """Import the modules imported lazily, once for all the forked processes"""
+    for name in ("griffe", "rich.console", "rich.panel", "rich.progress", "rich.table"):
+        importlib.import_module(name)
+    importlib.import_module(".presenter", __package__)
+
+
+def _is_serving(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def _receive(sock: socket.socket) -> _Request:
+    """Receive a request: a line of JSON, with the standard streams of the client"""
+    data, fds, _, _ = socket.recv_fds(sock, _CHUNK_SIZE, 3)
+    try:
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(_CHUNK_SIZE)
+            if not chunk:
+                raise ValueError("Incomplete request!")
+            data += chunk
+        if len(fds) != 3:
+            raise ValueError("Expected the standard streams of the client!")
+        request = json.loads(data)
+        return _Request(
+            list(request["argv"]), str(request["cwd"]), dict(request["env"]), fds
+        )
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def _load_operators(
+    parser: CliParser, operator_fns: OperatorFns, request: _Request
+) -> None:
+    """Load the operator functions of a request, ignoring their errors"""
+    for arg in request.argv:
+        token = parser.tokenizer.tokenize([arg])[0]
+        if not isinstance(token, OperatorToken):
+            continue
+        try:
+            if parser.is_inline_operator(token):
+                name = os.path.join(request.cwd, parser.get_name(token))
+                parser.get_inline_operator_fn(name, 0)
+            else:
+                operator_fns.get(parser.get_name(token))
+        except Exception:  # the error is reported by the forked process
+            pass
+
+
+def _run(app: App, request: _Request) -> int:
+    """Run the command line of a request as the client, and get its exit status"""
+    for stream in (sys.stdout, sys.stderr):
+        stream.flush()
+    for target, fd in enumerate(request.fds):
+        os.dup2(fd, target)
+    for stream in (sys.stdout, sys.stderr):
+        # the output is written as it is produced
+        if isinstance(stream, io.TextIOWrapper):
+            stream.reconfigure(line_buffering=True)
+    try:
+        os.chdir(request.cwd)
+        os.environ.clear()
+        os.environ.update(request.env)
+        app(request.argv)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)  # noqa: T201
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+    return 0
@@ -1,9 +1,11 @@
 import importlib.util
 import logging
 import re
+import time
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 
 from pydantic import ValidationError
 
@@ -13,16 +15,20 @@ from clios.core.operator import (
     DelegateOperator,
     LeafOperator,
     Operator,
-    OperatorAbc,
     RootOperator,
+    SharedOperator,
     SimpleOperator,
 )
 from clios.core.operator_fn import OperatorFn, OperatorFns
 from clios.core.param_parser import ParamParserError
+from clios.core.parameter import Parameter
+from clios.core.profiler import Profiler, measure
 from clios.core.tokenizer import Token
 
+from .param_parser import is_valid_variable_name
 from .tokenizer import (
     CliTokenizer,
+    ColonToken,
     LeftBracketToken,
     OperatorToken,
     RightBracketToken,
@@ -66,59 +72,72 @@ class CliParser(ParserAbc):
         operator_fns: OperatorFns,
         input: list[str],
         callback: t.Callable[..., t.Any] = simple_callback,
+        profiler: Profiler | None = None,
         **kwargs: t.Any,
+    ) -> RootOperator:
+        with measure(profiler, None, "parse"):
+            return self._get_operator(operator_fns, input, callback, profiler)
+
+    def _get_operator(
+        self,
+        operator_fns: OperatorFns,
+        input: list[str],
+        callback: t.Callable[..., t.Any],
+        profiler: Profiler | None,
     ) -> RootOperator:
         if not input:
             raise ParserError("Input is empty!")
-        tokens = list(self.tokenizer.tokenize(input))
+        with measure(profiler, None, "tokenize"):
+            tokens = tuple(self.tokenizer.tokenize(input))
         num_tokens = len(tokens)
-        token = tokens.pop(0)
+        token = tokens[0]
         operator_name = self.get_name(token)
-        param_string = self.get_param_string(token)
         operator_fn = self._get_operator_fn(operator_fns, token, 0)
 
         num_outputs = 0
+        writers: tuple[t.Callable[[t.Any, str], t.Any], ...] = ()
         if operator_fn.output.type_ is not None:
-            if operator_fn.output.info.callback is None:
+            output_info = operator_fn.output.info
+            if output_info.callback is None and not output_info.writers:
                 raise ParserError(
                     f"Operator `{operator_name}` cannot be used as root operator!",
                     ctx={"token_index": 0},
                 )
-            callback = operator_fn.output.info.callback
-            num_outputs = operator_fn.output.info.num_outputs
-
+            if output_info.callback is not None:
+                callback = output_info.callback
+            # the output paths are in the reverse order of the synopsis (the
+            # last one first), and so are the writers of the outputs
+            writers = output_info.writers[::-1]
+            num_outputs = output_info.num_outputs
+
+        # the outputs are taken from the end, the inputs are tokens[1:end]
+        end = num_tokens
         output_file_paths: list[str] = []
         for i in range(num_outputs):
-            try:
-                output_token = tokens.pop()
-                if not isinstance(output_token, StringToken):
-                    raise ParserError(
-                        "Output file path must be a string",
-                        ctx={"token_index": num_tokens - 1 - i},
-                    )
-                output_file_paths.append(str(output_token.value))
-            except IndexError:
+            if end <= 1:
                 raise ParserError(
                     "Missing output(s)!", ctx={"token_index": num_tokens - 1 - i}
                 )
+            end -= 1
+            output_token = tokens[end]
+            if not isinstance(output_token, StringToken):
+                raise ParserError(
+                    "Output file path must be a string",
+                    ctx={"token_index": num_tokens - 1 - i},
+                )
+            output_file_paths.append(str(output_token.value))
 
-        tokens.reverse()
-
-        operator = self._get_operator(
-            operator_fns=operator_fns,
-            operator_name=operator_name,
-            param_string=param_string,
-            operator_fn=operator_fn,
-            token_index=0,
-            input_tokens=tokens,
+        operator, cursor = self._parse_operator(
+            operator_fns, tokens, operator_fn, end, profiler
         )
 
-        if len(tokens) != 0:
+        if cursor != end:
+            num_extra_tokens = end - cursor
             raise ParserError(
                 "Got too many inputs!",
                 ctx={
-                    "num_extra_tokens": len(tokens),
-                    "token_index": num_tokens - len(tokens),
+                    "num_extra_tokens": num_extra_tokens,
+                    "token_index": num_tokens - num_extra_tokens,
                 },
             )
 
@@ -126,22 +145,238 @@ class CliParser(ParserAbc):
             input=operator,
             callback=callback,
             args=tuple(output_file_paths),
+            writers=writers,
         )
 
-    def _get_operator(
+    def _parse_operator(
         self,
         operator_fns: OperatorFns,
+        tokens: tuple[Token, ...],
+        operator_fn: OperatorFn,
+        end: int,
+        profiler: Profiler | None = None,
+    ) -> tuple[BaseOperator, int]:
+        """
+        Parse the operator tree rooted at the first token, from `tokens[1:end]`
+
+        The tokens are read once by a cursor, and the operators whose inputs are
+        being parsed are kept on an explicit stack, so that the time is linear in
+        the number of tokens and the depth of the tree is not limited.
+
+        The result of an operator can be bound to a name in place of an input
+        (`NAME : -operator ...`) and referenced by later inputs (`: NAME`). The
+        bound operator is shared by all of them, so that it is executed once.
+
+        The time spent validating the arguments and the inputs of each operator
+        is recorded by `profiler`, if given.
+
+        Returns:
+            tuple[BaseOperator, int]: The operator and the cursor after its inputs
+        """
+        closing_brackets = _match_brackets(tokens, 1, end)
+        stack: list[_PendingOperator] = []
+        # the operator to be started: its token, its operator function and index
+        next_operator: tuple[Token, OperatorFn, int] | None = (
+            tokens[0],
+            operator_fn,
+            0,
+        )
+        # the operators bound to a name (with their output type), and the name
+        # the next operator is bound to
+        bound: dict[str, tuple[SharedOperator, t.Any]] = {}
+        next_binding: str | None = None
+        cursor = 1
+        while True:
+            binding: str | None = None
+            if next_operator is not None:
+                token, operator_fn, token_index = next_operator
+                binding, next_binding = next_binding, None
+                next_operator = None
+                operator_name = self.get_name(token)
+                build_start = time.perf_counter_ns()
+                args, kwds = self._parse_arguments(
+                    operator_name,
+                    self.get_param_string(token),
+                    operator_fn,
+                    token_index,
+                )
+                build_span = (build_start, time.perf_counter_ns())
+                scope_end = stack[-1].end if stack else end
+                if not operator_fn.parameters.input_present:
+                    operator: BaseOperator = LeafOperator(
+                        name=operator_name,
+                        index=token_index,
+                        operator_fn=operator_fn,
+                        args=args,
+                        kwds=kwds,
+                    )
+                    if profiler is not None:
+                        profiler.add(operator, "build", *build_span)
+                elif cursor == scope_end:
+                    raise ParserError(
+                        f"Missing inputs for operator {operator_name}!",
+                        ctx={"token_index": token_index},
+                    )
+                else:
+                    start = cursor
+                    is_bracketed = isinstance(tokens[cursor], LeftBracketToken)
+                    if is_bracketed:
+                        if cursor not in closing_brackets:
+                            raise ParserError(
+                                "Missing closing bracket!",
+                                ctx={"token_index": cursor},
+                            )
+                        # the inputs are the tokens within the brackets
+                        scope_end = closing_brackets[cursor]
+                        cursor += 1
+                    pending = _PendingOperator(
+                        name=operator_name,
+                        index=token_index,
+                        operator_fn=operator_fn,
+                        args=args,
+                        kwds=kwds,
+                        start=start,
+                        end=scope_end,
+                        is_bracketed=is_bracketed,
+                        build_spans=[build_span],
+                        binding=binding,
+                    )
+                    if not operator_fn.is_delegate:
+                        stack.append(pending)
+                        continue
+                    cursor = self._parse_delegate_inputs(pending, tokens, cursor)
+                    operator, cursor = self._finish_operator(pending, cursor, profiler)
+            else:
+                pending = stack[-1]
+                input_param = next(pending.iter_inputs, None)
+                if input_param is not None and cursor < pending.end:
+                    if _is_binding(tokens, cursor, pending.end):
+                        next_binding = self._get_binding(tokens, cursor, bound)
+                        cursor += 2
+                    child_token = tokens[cursor]
+                    child_index = cursor
+                    cursor += 1
+                    if isinstance(child_token, ColonToken):
+                        shared, out_type = self._get_bound_operator(
+                            tokens, child_index, pending.end, bound
+                        )
+                        in_type = input_param.type_
+                        if in_type is not t.Any and in_type != out_type:
+                            raise ParserError(
+                                "These operators cannot be chained together!",
+                                ctx={
+                                    "unchainable_token_index": child_index + 1,
+                                    "token_index": pending.index,
+                                },
+                            )
+                        pending.inputs.append(shared)
+                        cursor += 1
+                    elif isinstance(child_token, OperatorToken):
+                        child_op_fn = self._get_operator_fn(
+                            operator_fns, child_token, child_index
+                        )
+                        in_type = input_param.type_
+                        if in_type is not t.Any and in_type != child_op_fn.output.type_:
+                            raise ParserError(
+                                "These operators cannot be chained together!",
+                                ctx={
+                                    "unchainable_token_index": child_index,
+                                    "token_index": pending.index,
+                                },
+                            )
+                        next_operator = (child_token, child_op_fn, child_index)
+                    elif isinstance(child_token, StringToken):
+                        build_start = time.perf_counter_ns()
+                        value = child_token.value
+                        try:
+                            if not input_param.build_phase_noop:
+                                validator = input_param.build_phase_validator
+                                value = validator.validate_python(value)
+                        except ValidationError as e:
+                            raise ParserError(
+                                f"Data validation failed for input {child_token.value}!",
+                                ctx={"error": e, "token_index": child_index},
+                            )
+                        input_operator = SimpleOperator(
+                            name=child_token.value,
+                            index=child_index,
+                            input_=value,
+                        )
+                        if profiler is not None:
+                            profiler.add(
+                                input_operator,
+                                "build",
+                                build_start,
+                                time.perf_counter_ns(),
+                            )
+                        pending.inputs.append(input_operator)
+                    else:
+                        raise ParserError(
+                            "This syntax is not supported yet!",
+                            ctx={"token_index": child_index},
+                        )
+                    continue
+                stack.pop()
+                binding = pending.binding
+                operator, cursor = self._finish_operator(pending, cursor, profiler)
+
+            if binding is not None:
+                shared_operator = SharedOperator(operator)
+                bound[binding] = (shared_operator, operator.operator_fn.output.type_)
+                stack[-1].inputs.append(shared_operator)
+                continue
+            if not stack:
+                return operator, cursor
+            stack[-1].inputs.append(operator)
+
+    def _get_binding(
+        self,
+        tokens: tuple[Token, ...],
+        index: int,
+        bound: dict[str, tuple[SharedOperator, t.Any]],
+    ) -> str:
+        """Get the name bound by `NAME :` at `tokens[index]`"""
+        name = str(tokens[index].value)
+        if not is_valid_variable_name(name):
+            raise ParserError(f"Invalid name `{name}`!", ctx={"token_index": index})
+        if name in bound:
+            raise ParserError(
+                f"Name `{name}` is already bound!", ctx={"token_index": index}
+            )
+        return name
+
+    def _get_bound_operator(
+        self,
+        tokens: tuple[Token, ...],
+        index: int,
+        end: int,
+        bound: dict[str, tuple[SharedOperator, t.Any]],
+    ) -> tuple[SharedOperator, t.Any]:
+        """Get the operator referenced by `: NAME` at `tokens[index]`, and its type"""
+        if index + 1 >= end or not isinstance(tokens[index + 1], StringToken):
+            raise ParserError(
+                "Missing name after `:`!",
+                ctx={"token_index": index},
+            )
+        name = str(tokens[index + 1].value)
+        if name not in bound:
+            raise ParserError(
+                f"Name `{name}` is not bound!", ctx={"token_index": index + 1}
+            )
+        return bound[name]
+
+    def _parse_arguments(
+        self,
         operator_name: str,
         param_string: str,
         operator_fn: OperatorFn,
         token_index: int,
-        input_tokens: list[Token],
-    ) -> BaseOperator:
+    ) -> tuple[tuple[t.Any, ...], tuple[tuple[str, t.Any], ...]]:
         try:
             logger.debug(
                 f"parsing arguments for operator `{operator_name}`, param_string: {param_string}"
             )
-            args, kwds = operator_fn.param_parser.parse_arguments(
+            return operator_fn.param_parser.parse_arguments(
                 string=param_string,
                 parameters=operator_fn.parameters,
             )
@@ -151,180 +386,70 @@ class CliParser(ParserAbc):
                 ctx={"error": e, "token_index": token_index},
             )
 
-        if not operator_fn.parameters.input_present:
-            return LeafOperator(
-                name=operator_name,
-                index=token_index,
-                operator_fn=operator_fn,
-                args=args,
-                kwds=kwds,
-            )
-
-        if not input_tokens:
-            raise ParserError(
-                f"Missing inputs for operator {operator_name}!",
-                ctx={"token_index": token_index},
-            )
-        operator_token_index = token_index
-        num_tokens = len(input_tokens)
-        if isinstance(input_tokens[-1], LeftBracketToken):
-            # pop the left bracket
-            input_tokens.pop()
-            token_index += 1
-            # get the child tokens until closing right bracket
-            child_tokens = self._get_bracketed_tokens(input_tokens, token_index)
-        else:
-            child_tokens = input_tokens
-
-        inputs = self._parse_inputs(
-            operator_fns,
-            operator_fn,
-            token_index,
-            operator_token_index,
-            child_tokens,
-        )
-
-        token_index += num_tokens - len(input_tokens)
-
-        if len(inputs) < operator_fn.parameters.num_minimum_inputs:
-            raise ParserError(
-                f"Missing inputs for operator {operator_name}!",
-                ctx={"token_index": operator_token_index},
-            )
-
-        if operator_fn.is_delegate:
-            return DelegateOperator(
-                name=operator_name,
-                index=operator_token_index,
-                operator_fn=operator_fn,
-                inputs=tuple(inputs),
-                args=args,
-                kwds=kwds,
-            )
-
-        return Operator(
-            name=operator_name,
-            index=token_index,
-            operator_fn=operator_fn,
-            inputs=tuple(inputs),
-            args=args,
-            kwds=kwds,
-        )
-
-    def _parse_inputs(
-        self,
-        operator_fns: OperatorFns,
-        operator_fn: OperatorFn,
-        token_index: int,
-        operator_token_index: int,
-        input_tokens: list[Token],
-    ):
-        if operator_fn.is_delegate:
-            return self._parse_delegate_inputs(
-                operator_fns,
-                operator_fn,
-                token_index,
-                operator_token_index,
-                input_tokens,
-            )
-        return self._parse_input_operators(
-            operator_fns, operator_fn, token_index, operator_token_index, input_tokens
-        )
-
     def _parse_delegate_inputs(
         self,
-        operator_fns: OperatorFns,
-        operator_fn: OperatorFn,
-        token_index: int,
-        operator_token_index: int,
-        input_tokens: list[Token],
-    ):
-        inputs: list[str] = []
-
-        child_index = token_index
-        for input_param in operator_fn.parameters.iter_inputs():  # pragma: no cover
-            if len(input_tokens) == 0:
+        pending: "_PendingOperator",
+        tokens: tuple[Token, ...],
+        cursor: int,
+    ) -> int:
+        build_start = time.perf_counter_ns()
+        for input_param in pending.iter_inputs:  # pragma: no cover
+            if cursor == pending.end:
                 break
-            child_token = input_tokens.pop()
-            child_index += 1
+            child_token = tokens[cursor]
+            value = child_token.value
             try:
-                value = input_param.build_phase_validator.validate_python(
-                    child_token.value
-                )
+                if not input_param.build_phase_noop:
+                    value = input_param.build_phase_validator.validate_python(value)
             except ValidationError as e:
                 raise ParserError(
                     f"Data validation failed for input {child_token.value}!",
-                    ctx={"error": e, "token_index": child_index},
+                    ctx={"error": e, "token_index": cursor},
                 )
-            inputs.append(value)
-        return inputs
+            pending.inputs.append(value)
+            cursor += 1
+        pending.build_spans.append((build_start, time.perf_counter_ns()))
+        return cursor
 
-    def _parse_input_operators(
+    def _finish_operator(
         self,
-        operator_fns: OperatorFns,
-        operator_fn: OperatorFn,
-        token_index: int,
-        operator_token_index: int,
-        input_tokens: list[Token],
-    ):
-        child_operators: list[OperatorAbc] = []
-
-        child_index = token_index
-        for input_param in operator_fn.parameters.iter_inputs():
-            if len(input_tokens) == 0:
-                break
-            child_token = input_tokens.pop()
-            child_index += 1
-            if isinstance(child_token, OperatorToken):
-                child_op_name = self.get_name(child_token)
-                child_op_param_string = self.get_param_string(child_token)
-                child_op_fn = self._get_operator_fn(
-                    operator_fns, child_token, child_index
-                )
-                in_type = input_param.type_
-                if in_type is not t.Any and in_type != child_op_fn.output.type_:
-                    raise ParserError(
-                        "These operators cannot be chained together!",
-                        ctx={
-                            "unchainable_token_index": child_index,
-                            "token_index": operator_token_index,
-                        },
-                    )
-                num_tokens_before = len(input_tokens)
-                child_operator = self._get_operator(
-                    operator_fns=operator_fns,
-                    operator_name=child_op_name,
-                    param_string=child_op_param_string,
-                    operator_fn=child_op_fn,
-                    token_index=child_index,
-                    input_tokens=input_tokens,
-                )
-                child_operators.append(child_operator)
-                child_index += num_tokens_before - len(input_tokens)
-            elif isinstance(child_token, StringToken):
-                try:
-                    value = input_param.build_phase_validator.validate_python(
-                        child_token.value
-                    )
-                except ValidationError as e:
-                    raise ParserError(
-                        f"Data validation failed for input {child_token.value}!",
-                        ctx={"error": e, "token_index": child_index},
-                    )
-                child_operators.append(
-                    SimpleOperator(
-                        name=child_token.value,
-                        index=child_index,
-                        input_=value,
-                    )
-                )
-            else:
-                raise ParserError(
-                    "This syntax is not supported yet!",
-                    ctx={"token_index": child_index},
-                )
+        pending: "_PendingOperator",
+        cursor: int,
+        profiler: Profiler | None = None,
+    ) -> tuple[BaseOperator, int]:
+        """Build an operator once its inputs are parsed"""
+        if pending.is_bracketed:
+            # skip the remaining tokens within the brackets and the closing bracket
+            cursor = pending.end + 1
+        operator_fn = pending.operator_fn
+        if len(pending.inputs) < operator_fn.parameters.num_minimum_inputs:
+            raise ParserError(
+                f"Missing inputs for operator {pending.name}!",
+                ctx={"token_index": pending.index},
+            )
 
-        return child_operators
+        if operator_fn.is_delegate:
+            operator: BaseOperator = DelegateOperator(
+                name=pending.name,
+                index=pending.index,
+                operator_fn=operator_fn,
+                inputs=tuple(pending.inputs),
+                args=pending.args,
+                kwds=pending.kwds,
+            )
+        else:
+            operator = Operator(
+                name=pending.name,
+                index=pending.index + pending.is_bracketed + cursor - pending.start,
+                operator_fn=operator_fn,
+                inputs=tuple(pending.inputs),
+                args=pending.args,
+                kwds=pending.kwds,
+            )
+        if profiler is not None:
+            for start, end in pending.build_spans:
+                profiler.add(operator, "build", start, end)
+        return operator, cursor
 
     def get_inline_operator_fn(self, name: str, index: int) -> OperatorFn:
         module_path = Path(name)
@@ -398,30 +523,68 @@ class CliParser(ParserAbc):
             )
         return op
 
-    def _get_bracketed_tokens(
-        self, tokens: list[Token], opening_index: int
-    ) -> list[Token]:
-        """Get tokens until closing bracket is found"""
-        bracket_stack: list[Token] = []
-        token_stack: list[Token] = []
-        while tokens:
-            token = tokens.pop()
-            token_stack.append(token)
-            if isinstance(token, LeftBracketToken):
-                bracket_stack.append(token)
-            elif isinstance(token, RightBracketToken):
-                if not bracket_stack:
-                    return list(reversed(token_stack[:-1]))
-                bracket_stack.pop()
-
-        raise ParserError(
-            "Missing closing bracket!",
-            ctx={"token_index": opening_index},
-        )
+
+@dataclass(frozen=True)
+class _PendingOperator:
+    """An operator whose inputs are being parsed from `tokens[start:end]`"""
+
+    name: str
+    index: int
+    operator_fn: OperatorFn
+    args: tuple[t.Any, ...]
+    kwds: tuple[tuple[str, t.Any], ...]
+    start: int
+    end: int
+    is_bracketed: bool
+    inputs: list[t.Any] = field(default_factory=list)
+    # the start and end times of the validation of the arguments and the inputs
+    build_spans: list[tuple[int, int]] = field(default_factory=list)
+    # the name the operator is bound to, if any
+    binding: str | None = None
+    iter_inputs: t.Iterator[Parameter] = field(init=False)
+
+    def __post_init__(self) -> None:
+        iter_inputs = self.operator_fn.parameters.iter_inputs()
+        object.__setattr__(self, "iter_inputs", iter_inputs)
+
+
+def _is_binding(tokens: tuple[Token, ...], index: int, end: int) -> bool:
+    """Check if `tokens[index]` starts a binding: `NAME : -operator ...`"""
+    return (
+        index + 2 < end
+        and isinstance(tokens[index], StringToken)
+        and isinstance(tokens[index + 1], ColonToken)
+        and isinstance(tokens[index + 2], OperatorToken)
+    )
+
+
+def _match_brackets(tokens: tuple[Token, ...], start: int, end: int) -> dict[int, int]:
+    """Get the index of the closing bracket of each left bracket in `tokens[start:end]`"""
+    closing_brackets: dict[int, int] = {}
+    left_brackets: list[int] = []
+    for index in range(start, end):
+        token = tokens[index]
+        if isinstance(token, LeftBracketToken):
+            left_brackets.append(index)
+        elif isinstance(token, RightBracketToken) and left_brackets:
+            closing_brackets[left_brackets.pop()] = index
+    return closing_brackets
+
+
+# the inline operator modules which are loaded, by their path, with the
+# modification time of their file
+_loaded_modules: dict[Path, tuple[int, ModuleType]] = {}
 
 
 def load_module(module_name, path):
+    """Load a module from its file, once until the file is modified"""
+    path = Path(path).resolve()
+    mtime = path.stat().st_mtime_ns
+    loaded = _loaded_modules.get(path)
+    if loaded is not None and loaded[0] == mtime:
+        return loaded[1]
     spec = importlib.util.spec_from_file_location(module_name, path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _loaded_modules[path] = (mtime, module)
     return module
@@ -0,0 +1,129 @@
+import inspect
+import json
+import os
+import tempfile
+import typing as t
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from clios.core.main_parser import ParserAbc
+from clios.core.operator_fn import OperatorFn, OperatorFns
+
+# the version of the format, a manifest of another version is out of date
+_VERSION = 1
+
+
+@dataclass(frozen=True)
+class OperatorDoc:
+    """The documentation of an operator, as shown by `--list` and `--show`"""
+
+    synopsis: str
+    short_description: str
+    long_description: str
+    args_doc: list[dict[str, str]]
+    kwds_doc: list[dict[str, str]]
+    examples: list[tuple[str, str]]
+
+    @classmethod
+    def from_operator_fn(
+        cls, parser: ParserAbc, name: str, operator_fn: OperatorFn
+    ) -> "OperatorDoc":
+        synopsis, short_description, long_description, args_doc, kwds_doc = (
+            parser.get_details(name, operator_fn)
+        )
+        return cls(
+            synopsis,
+            short_description,
+            long_description,
+            args_doc,
+            kwds_doc,
+            operator_fn.examples,
+        )
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """
+    The documentation of all the operators, built once so that `--list` and
+    `--show` neither build the operator functions nor parse their docstrings
+
+    A manifest is valid as long as the names of the operators are the same, and
+    the source files of their callbacks (`sources`, with their modification
+    time in nanoseconds) are not modified.
+    """
+
+    operators: dict[str, OperatorDoc]
+    sources: dict[str, int]
+
+    @classmethod
+    def build(cls, operator_fns: OperatorFns, parser: ParserAbc) -> "Manifest":
+        """
+        Build the manifest of the operator functions
+
+        Raises:
+            ExceptionGroup: If some operator functions are not valid
+        """
+        operator_fns.validate_all()
+        operators: dict[str, OperatorDoc] = {}
+        sources: dict[str, int] = {}
+        for name, operator_fn in operator_fns.items():
+            operators[name] = OperatorDoc.from_operator_fn(parser, name, operator_fn)
+            source = _get_source(operator_fn.callback)
+            if source:
+                sources[source] = os.stat(source).st_mtime_ns
+        return cls(operators, sources)
+
+    @classmethod
+    def load(cls, path: str | Path, operator_fns: OperatorFns) -> "Manifest | None":
+        """
+        Load the manifest of the operator functions
+
+        Returns:
+            Manifest | None: The manifest, or None if it is missing or out of date
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data["version"] != _VERSION:
+                return None
+            sources: dict[str, int] = data["sources"]
+            if any(
+                os.stat(source).st_mtime_ns != mtime
+                for source, mtime in sources.items()
+            ):
+                return None
+            operators = {
+                name: OperatorDoc(
+                    **{**doc, "examples": [tuple(e) for e in doc["examples"]]}
+                )
+                for name, doc in data["operators"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if operators.keys() != operator_fns.keys():
+            return None
+        return cls(operators, sources)
+
+    def write(self, path: str | Path) -> None:
+        """Write the manifest to a file"""
+        data = {
+            "version": _VERSION,
+            "sources": self.sources,
+            "operators": {name: asdict(doc) for name, doc in self.operators.items()},
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # write to a temporary file first, so that readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+def _get_source(callback: t.Callable[..., t.Any]) -> str:
+    """Get the path of the source file of a callback, if any"""
+    try:
+        path = inspect.getfile(callback)
+    except TypeError:
+        return ""
+    return os.path.abspath(path) if os.path.exists(path) else ""
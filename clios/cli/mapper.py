@@ -0,0 +1,125 @@
+import os
+import typing as t
+from dataclasses import dataclass, field, replace
+
+from clios.core.operator import (
+    Operator,
+    OperatorAbc,
+    RootOperator,
+    SharedOperator,
+    SimpleOperator,
+)
+
+# the placeholders of the path of the mapped file (as in GNU parallel)
+PLACEHOLDERS: dict[str, t.Callable[[str], str]] = {
+    "{}": lambda path: path,
+    "{.}": lambda path: os.path.splitext(path)[0],
+    "{/}": os.path.basename,
+    "{/.}": lambda path: os.path.splitext(os.path.basename(path))[0],
+}
+
+
+def has_placeholder(string: str) -> bool:
+    """Check if the string contains a placeholder of the path"""
+    return any(placeholder in string for placeholder in PLACEHOLDERS)
+
+
+def substitute(string: str, path: str) -> str:
+    """Replace the placeholders of the string by (a part of) the path"""
+    for placeholder, get_part in PLACEHOLDERS.items():
+        if placeholder in string:
+            string = string.replace(placeholder, get_part(path))
+    return string
+
+
+@dataclass(frozen=True)
+class Template:
+    """
+    An operator tree parsed once, in which the inputs and the outputs given with
+    a placeholder are bound to the path of each mapped file
+
+    Args:
+        root: The operator tree parsed from the arguments of any mapped file
+        args: The arguments, with the placeholders
+
+    Raises:
+        ValueError: If a placeholder is not in an input or an output
+    """
+
+    root: RootOperator
+    args: list[str]
+    # the indices of the arguments with a placeholder, and of the first output
+    positions: set[int] = field(init=False)
+    output_start: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        args = self.args
+        positions = {i for i, arg in enumerate(args) if has_placeholder(arg)}
+        if not positions:
+            raise ValueError(
+                f"Missing placeholder ({', '.join(PLACEHOLDERS)}) in the arguments!"
+            )
+        output_start = len(args) - len(self.root.args)
+        bound = {i for i in positions if i >= output_start}
+        bound.update(
+            node.index
+            for node in _iter_operators(self.root)
+            if isinstance(node, SimpleOperator) and node.index in positions
+        )
+        if positions - bound:
+            index = min(positions - bound)
+            raise ValueError(
+                f"The placeholder in `{args[index]}` is not an input or an output!"
+            )
+        object.__setattr__(self, "positions", positions)
+        object.__setattr__(self, "output_start", output_start)
+
+    def bind(self, path: str) -> RootOperator:
+        """
+        Get the operator tree of a file
+
+        The inputs with a placeholder are validated again.
+
+        Raises:
+            pydantic.ValidationError: If an input is not valid
+        """
+        shared: dict[int, SharedOperator] = {}
+        # the output paths of the root operator are in the reverse order
+        outputs = tuple(
+            substitute(arg, path) for arg in reversed(self.args[self.output_start :])
+        )
+        input_ = self._bind(self.root.input, path, shared)
+        return replace(self.root, input=input_, args=outputs)
+
+    def _bind(
+        self, operator: t.Any, path: str, shared: dict[int, SharedOperator]
+    ) -> t.Any:
+        if isinstance(operator, SharedOperator):
+            # a new instance, which does not keep the output of another file
+            if id(operator) not in shared:
+                input_ = self._bind(operator.input, path, shared)
+                shared[id(operator)] = SharedOperator(input_)
+            return shared[id(operator)]
+        if not isinstance(operator, Operator):
+            return operator
+        inputs: list[OperatorAbc] = []
+        params = operator.operator_fn.parameters.iter_inputs()
+        for input_, param in zip(operator.inputs, params):
+            if isinstance(input_, SimpleOperator) and input_.index in self.positions:
+                value = substitute(self.args[input_.index], path)
+                validated: t.Any = value
+                if not param.build_phase_noop:
+                    validated = param.build_phase_validator.validate_python(value)
+                input_ = replace(input_, name=value, input_=validated)
+            else:
+                input_ = self._bind(input_, path, shared)
+            inputs.append(input_)
+        return replace(operator, inputs=tuple(inputs))
+
+
+def _iter_operators(operator: OperatorAbc) -> t.Iterator[OperatorAbc]:
+    stack = [operator]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.get_input_operators())
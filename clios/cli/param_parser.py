@@ -8,7 +8,7 @@ from clios.core.param_parser import (
     ParamParserAbc,
     ParamParserError,
 )
-from clios.core.parameter import Parameters
+from clios.core.parameter import Parameter, Parameters
 
 
 @dataclass(frozen=True)
@@ -35,6 +35,9 @@ class StandardParamParser(ParamParserAbc):
         kwd_values: dict[str, t.Any] = {}
 
         positional_arg_iter = parameters.iter_positional_arguments()
+        # the variable arguments and their positions, validated at once once
+        # all of them are known (i.e. before the first keyword argument)
+        var_args: list[tuple[str, int, int]] = []
 
         arg_list.reverse()
 
@@ -48,6 +51,11 @@ class StandardParamParser(ParamParserAbc):
                 continue
             kwd = self.get_keyword(arg)
             if kwd is not None:
+                if var_args:
+                    arg_values.extend(
+                        self._validate_var_arguments(parameters, var_args)
+                    )
+                    var_args.clear()
                 k, v = kwd
                 if not is_valid_variable_name(k):
                     raise ParamParserError(
@@ -76,7 +84,9 @@ class StandardParamParser(ParamParserAbc):
                         },
                     )
                 try:
-                    value = param.build_phase_validator.validate_python(v)
+                    value = v
+                    if not param.build_phase_noop:
+                        value = param.build_phase_validator.validate_python(v)
                 except ValidationError as e:
                     raise ParamParserError(
                         f"Data validation failed for argument `{k}`!",
@@ -107,18 +117,13 @@ class StandardParamParser(ParamParserAbc):
                         },
                     )
 
-                try:
-                    value = param.build_phase_validator.validate_python(arg)
-                except ValidationError as e:
-                    raise ParamParserError(
-                        "Data validation failed for argument!",
-                        ctx={
-                            "spos": spos,
-                            "epos": epos,
-                            "error": e,
-                        },
-                    )
-                arg_values.append(value)
+                if param.is_var_param:
+                    var_args.append((arg, spos, epos))
+                    continue
+                arg_values.append(self._validate_argument(param, arg, spos, epos))
+
+        if var_args:
+            arg_values.extend(self._validate_var_arguments(parameters, var_args))
 
         if len(arg_values) < parameters.num_required_args:
             raise ParamParserError(
@@ -141,6 +146,40 @@ class StandardParamParser(ParamParserAbc):
 
         return tuple(arg_values), tuple(kwd_values.items())
 
+    def _validate_argument(
+        self, param: Parameter, arg: str, spos: int, epos: int
+    ) -> t.Any:
+        if param.build_phase_noop:
+            return arg
+        try:
+            return param.build_phase_validator.validate_python(arg)
+        except ValidationError as e:
+            raise ParamParserError(
+                "Data validation failed for argument!",
+                ctx={
+                    "spos": spos,
+                    "epos": epos,
+                    "error": e,
+                },
+            )
+
+    def _validate_var_arguments(
+        self, parameters: Parameters, var_args: list[tuple[str, int, int]]
+    ) -> list[t.Any]:
+        """
+        Validate the variable arguments at once, or one by one if some argument
+        is invalid, to get its position
+        """
+        param = parameters.var_argument
+        assert param is not None
+        values = param.validate_batch([arg for arg, _, _ in var_args], "build")
+        if values is not None:
+            return values
+        return [
+            self._validate_argument(param, arg, spos, epos)
+            for arg, spos, epos in var_args
+        ]
+
     def get_keyword(self, string: str) -> tuple[str, str] | None:
         """split the string into key and value"""
 
@@ -1,24 +1,65 @@
+import glob
+import json
+import shlex
+import sys
+import typing as t
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import dataclass
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
+from clios.core.cache import ResultCache
+from clios.core.executor import (
+    ExecutorAbc,
+    ProcessExecutor,
+    SerialExecutor,
+    ThreadExecutor,
+)
 from clios.core.main_parser import ParserAbc, ParserError
-from clios.core.operator import OperatorError
+from clios.core.operator import (
+    OperatorAbc,
+    OperatorError,
+    RootOperator,
+    SharedOperator,
+)
 from clios.core.operator_fn import OperatorFns
+from clios.core.optimizer import share_common_operators
+from clios.core.plan import ExecutionPlan
+from clios.core.profiler import PHASES, Profiler
+from clios.core.spill import SerializerAbc, SpillStore
+from clios.core.type_adapters import TypeAdapterStats, type_adapters
+from clios.core.utils import get_peak_memory
+
+from .manifest import Manifest, OperatorDoc
+from .mapper import PLACEHOLDERS, Template, substitute
+
+# rich is imported where something is printed, so that running the operators
+# does not import it unless there is something to report
+if t.TYPE_CHECKING:
+    from rich.table import Table
 
 
 @dataclass(frozen=True)
 class CliPresenter:
     operator_fns: OperatorFns
     parser: ParserAbc
+    # the path of the manifest of the operators, read by `--list` and `--show`
+    manifest: str | None = None
+    # the serializers of the intermediate values spilled to disk, by type (or
+    # qualified name of the type), as registered to `SpillStore`
+    spill_serializers: t.Mapping[type | str, SerializerAbc] | None = None
 
     def process_error(self, error: ParserError, args: list[str]) -> None:
         """
         Process an error and present it nicely to the terminal.
         """
+        from rich.console import Console
+        from rich.text import Text
+
         # Get the error message
         message = error.message
 
@@ -80,11 +121,26 @@ class CliPresenter:
         Args:
             data (list[tuple[str, str]]): A list of tuples containing data for the table.
         """
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
         table = Table(
             show_header=True, header_style="bold blue", title="Available Operators"
         )
-        data = [(name, op.short_description) for name, op in self.operator_fns.items()]
+        manifest = self.load_manifest()
+        if manifest is not None:
+            data = [
+                (name, doc.short_description)
+                for name, doc in manifest.operators.items()
+            ]
+        else:
+            # the descriptions come from the docstrings, the operators are not built
+            operator_fns = self.operator_fns
+            data = [
+                (name, operator_fns.peek(name).short_description)
+                for name in operator_fns
+            ]
         # Add columns with dynamic width for the second column
         if not data:
             console.print("No operators found!", style="bold red")
@@ -106,23 +162,35 @@ class CliPresenter:
         """
         Prints a detailed operator page using Rich.
         """
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.text import Text
+
         console = Console()
-        if self.parser.is_inline_operator_name(name):
-            try:
-                op_fn = self.parser.get_inline_operator_fn(name, 0)
-            except ParserError as e:
-                console.print(e.message, style="bold red")
-                raise SystemExit(1)
+        manifest = None
+        if not self.parser.is_inline_operator_name(name):
+            manifest = self.load_manifest()
+        if manifest is not None and name in manifest.operators:
+            doc = manifest.operators[name]
         else:
-            try:
-                op_fn = self.operator_fns[name]
-            except KeyError:
-                console.print(f"Operator `{name}` not found!", style="bold red")
-                raise SystemExit(1)
-
-        synopsis, short_description, long_description, args_doc, kwds_doc = (
-            self.parser.get_details(name, op_fn, exe_name)
-        )
+            if self.parser.is_inline_operator_name(name):
+                try:
+                    op_fn = self.parser.get_inline_operator_fn(name, 0)
+                except ParserError as e:
+                    console.print(e.message, style="bold red")
+                    raise SystemExit(1)
+            else:
+                try:
+                    op_fn = self.operator_fns[name]
+                except KeyError:
+                    console.print(f"Operator `{name}` not found!", style="bold red")
+                    raise SystemExit(1)
+            doc = OperatorDoc.from_operator_fn(self.parser, name, op_fn)
+
+        synopsis = f"{exe_name}{doc.synopsis}"
+        short_description = doc.short_description
+        long_description = doc.long_description
+        args_doc, kwds_doc = doc.args_doc, doc.kwds_doc
 
         # Synopsis
         synopsis_panel = Panel(
@@ -161,7 +229,7 @@ class CliPresenter:
             console.print(param_table_kwds)
 
         examples: list[str] = []
-        for _, example in op_fn.examples:
+        for _, example in doc.examples:
             examples.append(example)
 
         if examples:
@@ -177,10 +245,38 @@ class CliPresenter:
             )
             console.print(examples_panel)
 
+    def load_manifest(self) -> Manifest | None:
+        """Load the manifest of the operators, if it is given and up to date"""
+        if self.manifest is None:
+            return None
+        return Manifest.load(self.manifest, self.operator_fns)
+
+    def build_manifest(self) -> None:
+        """
+        Build the manifest of the operators, read by `print_list` and `print_detail`
+        """
+        from rich.console import Console
+
+        console = Console(stderr=True)
+        if self.manifest is None:
+            console.print(
+                "No manifest path is given to the application!", style="bold red"
+            )
+            raise SystemExit(1)
+        manifest = Manifest.build(self.operator_fns, self.parser)
+        manifest.write(self.manifest)
+        console.print(
+            f"Wrote the manifest of {len(manifest.operators)} operator(s) "
+            f"to `{self.manifest}`",
+            style="dim",
+        )
+
     def dry_run(self, args: list[str]):
         """
         Dry run the operator function with the given arguments.
         """
+        from rich.console import Console
+
         console = Console()
         try:
             operator = self.parser.get_operator(self.operator_fns, args)
@@ -189,28 +285,485 @@ class CliPresenter:
             raise SystemExit(1)
         console.print(operator.draw())
 
-    def run(self, args: list[str], debug: bool = False):
+    def run(
+        self,
+        args: list[str],
+        debug: bool = False,
+        threads: int = 0,
+        processes: int = 0,
+        use_asyncio: bool = False,
+        cache: ResultCache | None = None,
+        max_memory: int | None = None,
+        strict_memory: bool = False,
+        profile: bool = False,
+        trace: str | None = None,
+        pool: Executor | None = None,
+    ):
         """
         Run the operator function with the given arguments.
+
+        If `threads` (or `processes`) is positive, independent input operators
+        are executed concurrently using that many threads (or worker processes).
+        If `use_asyncio` is set, the operators are executed in an event loop,
+        awaiting the independent input operators concurrently. The outputs of
+        the cacheable operators are kept in `cache`, if given.
+
+        If `max_memory` (in bytes) is given, the operators are executed one
+        after another, in the order which keeps the fewest intermediate values
+        alive, intermediate values are spilled to disk (by `spill_serializers`)
+        while their total size exceeds it, and the peak memory usage is reported
+        against it. It cannot be combined with `threads`, `processes` or
+        `use_asyncio`. If `strict_memory` is set, exceeding the budget is an
+        error (e.g. to enforce it in CI).
+
+        If `profile` is set, the time spent by each operator in each phase is
+        reported once the operators have been executed, with the throughput of
+        the outputs written by writers. If `trace` is given, the spans of the
+        parsing and of the execution of each operator are written to that file
+        in the Chrome Trace Event format.
+
+        If `pool` is given, the threads (or worker processes) are taken from it
+        instead of a new pool, e.g. to share them between runs.
         """
+        profiler = Profiler() if profile or trace is not None else None
         try:
-            operator = self.parser.get_operator(self.operator_fns, args)
+            operator = self.parser.get_operator(
+                self.operator_fns, args, profiler=profiler
+            )
         except ParserError as e:
             self.process_error(e, args)
             if debug:
                 raise e
             raise SystemExit(1)
 
+        parsed_operator = operator
+        operator = share_common_operators(operator)
+        if profiler is not None:
+            profiler.remap(parsed_operator, operator)
+        if max_memory is not None and (threads or processes or use_asyncio):
+            raise ValueError(
+                "The memory budget requires the operators to be executed serially!"
+            )
+        spill = None if max_memory is None else self._get_spill_store(max_memory)
         try:
-            operator.execute()
+            with _get_executor(threads, processes, cache, profiler, pool) as executor:
+                if use_asyncio:
+                    import asyncio
+
+                    asyncio.run(operator.execute_async(executor))
+                elif isinstance(executor, SerialExecutor):
+                    plan = ExecutionPlan.from_operator(
+                        operator, low_memory=max_memory is not None
+                    )
+                    plan.execute(executor=executor, spill=spill)
+                else:
+                    operator.execute(executor)
         except OperatorError as e:
-            Console().print(Text(str(e), style="bold red"))
+            _print_error(str(e))
+            if debug:
+                raise e
+            raise SystemExit(1)
+        finally:
+            if spill is not None:
+                spill.cleanup()
+            if profiler is not None and trace is not None:
+                profiler.write_trace(trace)
+        within_budget = True
+        if spill is not None:
+            within_budget = _print_peak_memory(spill)
+        if profiler is not None and profile:
+            _print_profile(profiler, operator)
+            if profiler.writes:
+                _print_writes(profiler)
+        if strict_memory and not within_budget:
+            raise SystemExit(1)
+
+    def _get_spill_store(self, max_memory: int) -> SpillStore:
+        spill = SpillStore(max_memory)
+        for type_, serializer in (self.spill_serializers or {}).items():
+            spill.register(type_, serializer)
+        return spill
+
+    def run_batch(
+        self, path: str, jobs: int = 1, debug: bool = False, **kwargs: t.Any
+    ) -> list[int]:
+        """
+        Run the operator function of each line of a batch file.
+
+        Each line holds the arguments of a run, either as a shell command line
+        or as a JSON list of strings. Empty lines and lines starting with `#`
+        are skipped. The file is read from the standard input if `path` is `-`.
+
+        The lines are run by `run` (with the other options) in a pool of `jobs`
+        threads, so that each line reports its errors as `run` does, and the
+        operator functions are loaded once for all of them. The lines share a
+        single pool of threads or worker processes (`threads` or `processes`).
+
+        Returns:
+            list[int]: The exit status of each run, in the order of the lines
+        """
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(path) as f:
+                lines = f.read().splitlines()
+        runs = [
+            (number, line)
+            for number, line in enumerate(lines, start=1)
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+        def run_line(number: int, line: str) -> int:
+            try:
+                args = _split_batch_line(line)
+            except ValueError as e:
+                _print_error(f"Line {number}: {e}")
+                return 1
+            try:
+                self.run(args, debug, pool=pool, **kwargs)
+            except SystemExit as e:
+                return e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                if debug:
+                    from rich.console import Console
+
+                    Console().print_exception()
+                _print_error(f"Line {number}: {e!r}")
+                return 1
+            return 0
+
+        pool: Executor | None = None
+        if kwargs.get("processes"):
+            pool = ProcessPoolExecutor(max_workers=kwargs["processes"])
+        elif kwargs.get("threads"):
+            pool = ThreadPoolExecutor(
+                max_workers=kwargs["threads"], thread_name_prefix="clios"
+            )
+        try:
+            with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+                statuses = list(executor.map(run_line, *zip(*runs))) if runs else []
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        from rich.console import Console
+
+        failed = [number for (number, _), status in zip(runs, statuses) if status]
+        console = Console(stderr=True)
+        message = f"Ran {len(runs)} line(s)"
+        if failed:
+            lines_failed = ", ".join(map(str, failed))
+            console.print(
+                f"{message}: {len(failed)} failed (line(s) {lines_failed})",
+                style="bold red",
+            )
+        else:
+            console.print(message, style="dim")
+        return statuses
+
+    def run_map(
+        self,
+        args: list[str],
+        pattern: str,
+        threads: int = 0,
+        processes: int = 0,
+        debug: bool = False,
+        cache: ResultCache | None = None,
+    ) -> list[tuple[str, str]]:
+        """
+        Run the operator function over each file matching a glob pattern.
+
+        The arguments are parsed once, with a placeholder of the path of the
+        file (`{}`, `{.}` without its extension, `{/}` its name, `{/.}` its name
+        without its extension) in some inputs and outputs, which are bound to
+        each file. The files are processed by a pool of `processes` worker
+        processes, or else of `threads` threads (by default, as many as the
+        default of `ThreadPoolExecutor`).
+
+        Returns:
+            list[tuple[str, str]]: The files which failed, with their error
+        """
+        from rich.console import Console
+        from rich.progress import Progress
+
+        console = Console()
+        paths = sorted(glob.glob(pattern, recursive=True))
+        if not paths:
+            console.print(f"No file matches `{pattern}`!", style="bold red")
+            raise SystemExit(1)
+        first_args = [substitute(arg, paths[0]) for arg in args]
+        try:
+            root = self.parser.get_operator(self.operator_fns, first_args)
+            template = Template(root, args)
+        except ParserError as e:
+            self.process_error(e, first_args)
             if debug:
                 raise e
             raise SystemExit(1)
+        except ValueError as e:
+            _print_error(str(e))
+            placeholders = ", ".join(PLACEHOLDERS)
+            console.print(f"The placeholders are: {placeholders}", style="dim")
+            raise SystemExit(1)
+
+        failures: list[tuple[str, str]] = []
+        pool: Executor
+        if processes > 0:
+            pool = ProcessPoolExecutor(max_workers=processes)
+        else:
+            pool = ThreadPoolExecutor(max_workers=threads or None)
+        with pool, Progress(console=Console(stderr=True), transient=True) as progress:
+            task = progress.add_task(
+                f"Mapping over {len(paths)} file(s)", total=len(paths)
+            )
+            futures: dict[Future[str | None], str] = {}
+            for path in paths:
+                try:
+                    # shared after binding: operators which are equal for
+                    # the first file may differ for the others
+                    operator = share_common_operators(template.bind(path))
+                except ValueError as e:
+                    failures.append((path, str(e)))
+                    progress.advance(task)
+                    continue
+                futures[pool.submit(_run_mapped, operator, cache)] = path
+            for future in as_completed(futures):
+                try:
+                    error = future.result()
+                except Exception as e:
+                    error = repr(e)
+                if error is not None:
+                    failures.append((futures[future], error))
+                progress.advance(task)
+
+        _print_failures(len(paths), failures)
+        return failures
+
+
+def _run_mapped(operator: RootOperator, cache: ResultCache | None) -> str | None:
+    """Execute the operator tree of a mapped file, and get its error, if any"""
+    try:
+        operator.execute(SerialExecutor(cache=cache))
+    except Exception as e:
+        return str(e) if isinstance(e, OperatorError) else repr(e)
+    return None
+
+
+def _print_error(message: str) -> None:
+    from rich.console import Console
+    from rich.text import Text
+
+    Console().print(Text(message, style="bold red"))
+
+
+def _print_failures(num_paths: int, failures: list[tuple[str, str]]) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console(stderr=True)
+    message = f"Mapped over {num_paths} file(s)"
+    if not failures:
+        console.print(message, style="dim")
+        return
+    table = Table(title="Failures", show_header=True, header_style="bold red")
+    table.add_column("file", overflow="fold", min_width=10)
+    table.add_column("error", overflow="fold")
+    for path, error in sorted(failures):
+        table.add_row(path, error)
+    console.print(table)
+    console.print(f"{message}: {len(failures)} failed", style="bold red")
+
+
+def _split_batch_line(line: str) -> list[str]:
+    """Split a line of a batch file into arguments"""
+    if line.lstrip().startswith("["):
+        try:
+            args = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            raise ValueError("Expected a JSON list of strings!")
+        return args
+    return shlex.split(line)
+
+
+def _print_profile(profiler: Profiler, operator: OperatorAbc) -> None:
+    """Print the time spent by each operator in each phase, the costliest first"""
+    from rich.console import Console
+    from rich.table import Table
+
+    totals = profiler.get_totals()
+    # the operators of the tree, each shared operator once
+    nodes: list[OperatorAbc] = []
+    seen: set[int] = set()
+    stack = [operator]
+    while stack:
+        node = stack.pop()
+        while isinstance(node, SharedOperator):
+            node = node.input
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes.append(node)
+        stack.extend(reversed(node.get_input_operators()))
+
+    def get_total(node: OperatorAbc) -> int:
+        _, phases = totals.get(id(node), (node, {}))
+        return sum(phases.values())
+
+    nodes.sort(key=get_total, reverse=True)
+    table = Table(
+        title="Profile (ms)",
+        caption="; ".join(f"{phase}: {text}" for phase, text in PHASES.items()),
+        show_header=True,
+        header_style="bold blue",
+        show_footer=True,
+    )
+    table.add_column("operator", "total", overflow="fold", min_width=10)
+    phase_totals = dict.fromkeys(PHASES, 0)
+    rows: list[list[str]] = []
+    for node in nodes:
+        _, phases = totals.get(id(node), (node, {}))
+        row = [node.draw()]
+        for phase in PHASES:
+            duration = phases.get(phase)
+            phase_totals[phase] += duration or 0
+            row.append("-" if duration is None else _format_duration(duration))
+        row.append(_format_duration(get_total(node)))
+        rows.append(row)
+    for phase in PHASES:
+        table.add_column(
+            phase, _format_duration(phase_totals[phase]), justify="right", min_width=8
+        )
+    table.add_column(
+        "total",
+        _format_duration(sum(phase_totals.values())),
+        justify="right",
+        min_width=8,
+    )
+    for row in rows:
+        table.add_row(*row)
+    console = Console(stderr=True)
+    console.print(table)
+    console.print(_format_type_adapter_stats(type_adapters.stats()), style="dim")
+
+
+def _format_type_adapter_stats(stats: TypeAdapterStats) -> str:
+    """Format the sharing of the type adapters of the parameters"""
+    return (
+        f"Type adapters: {stats.misses + stats.uncached} built, {stats.hits} shared "
+        + f"({stats.hit_rate:.0%} hit rate)"
+    )
+
+
+def _format_duration(duration: int) -> str:
+    return f"{duration / 1e6:.3f}"
+
+
+def _print_writes(profiler: Profiler) -> None:
+    """Print the size, the duration and the throughput of each written output"""
+    from rich.console import Console
+    from rich.table import Table
+
+    writes = sorted(profiler.writes, key=lambda write: write.start)
+    size = sum(write.size for write in writes)
+    # the outputs are written concurrently, the total is the wall time
+    duration = max(write.end for write in writes) - writes[0].start
+    table = Table(
+        title="Writes",
+        show_header=True,
+        header_style="bold blue",
+        show_footer=True,
+    )
+    table.add_column("output", "total", overflow="fold", min_width=10)
+    table.add_column("size", _format_size(size), justify="right", min_width=10)
+    table.add_column(
+        "time (ms)", _format_duration(duration), justify="right", min_width=9
+    )
+    table.add_column(
+        "throughput", _format_throughput(size, duration), justify="right", min_width=12
+    )
+    for write in writes:
+        table.add_row(
+            write.path,
+            _format_size(write.size),
+            _format_duration(write.duration),
+            _format_throughput(write.size, write.duration),
+        )
+    console = Console(stderr=True)
+    console.print(table)
+
+
+def _format_throughput(size: int, duration: int) -> str:
+    if not size or duration <= 0:
+        return "-"
+    return f"{_format_size(int(size * 1e9 / duration))}/s"
+
+
+def _print_peak_memory(spill: SpillStore) -> bool:
+    """Print the peak memory usage, and check if it is within the budget"""
+    from rich.console import Console
+
+    console = Console(stderr=True)
+    if spill.num_spilled:
+        console.print(
+            f"Spilled {spill.num_spilled} intermediate value(s) to disk "
+            f"({_format_size(spill.spilled_size)})",
+            style="dim",
+        )
+    max_memory = spill.threshold
+    peak = get_peak_memory()
+    if peak is None:  # pragma: no cover
+        console.print("Peak memory usage is not available!", style="dim")
+        return True
+    message = (
+        f"Peak memory usage: {_format_size(peak)} (budget: {_format_size(max_memory)})"
+    )
+    if peak > max_memory:
+        console.print(f"{message} exceeds the budget!", style="bold yellow")
+        return False
+    console.print(message, style="dim")
+    return True
+
+
+def _format_size(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            break
+        value /= 1024
+    else:
+        unit = "TiB"
+    return f"{value:.1f} {unit}"
+
+
+def _get_executor(
+    threads: int,
+    processes: int,
+    cache: ResultCache | None,
+    profiler: Profiler | None = None,
+    pool: Executor | None = None,
+) -> ExecutorAbc:
+    if processes > 0:
+        return ProcessExecutor(
+            max_workers=processes,
+            cache=cache,
+            profiler=profiler,
+            pool=t.cast(ProcessPoolExecutor | None, pool),
+        )
+    if threads > 0:
+        return ThreadExecutor(
+            max_workers=threads,
+            cache=cache,
+            profiler=profiler,
+            pool=t.cast(ThreadPoolExecutor | None, pool),
+        )
+    return SerialExecutor(cache=cache, profiler=profiler)
+
 
+def _create_param_table(args_doc: list[dict[str, str]], title: str) -> "Table":
+    from rich.table import Table
 
-def _create_param_table(args_doc: list[dict[str, str]], title: str) -> Table:
     param_table = Table(title=title, show_header=True, header_style="bold magenta")
     param_table.add_column("Parameter", style="dim", no_wrap=True)
     param_table.add_column("Type", style="dim", no_wrap=True)
@@ -0,0 +1,199 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import types
+import typing as t
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+MISSING: t.Any = object()
+
+_SUFFIX = ".pkl"
+
+
+class ResultCache:
+    """
+    A persistent, content addressed cache of operator outputs
+
+    The outputs are pickled to files in `directory`, named after the digest of
+    the operator, its arguments and the content of its inputs. When the total
+    size of the files exceeds `max_size` bytes, the least recently used files are
+    removed. The cache can be shared by concurrent processes.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = 2**30) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        return (ResultCache, (self.directory, self.max_size))
+
+    @classmethod
+    def default(cls) -> "ResultCache":
+        """
+        Get the default cache
+
+        The directory and the size budget can be set using the environment variables
+        `CLIOS_CACHE_DIR` (default: `~/.cache/clios`) and `CLIOS_CACHE_SIZE` (in bytes).
+        """
+        directory = os.environ.get("CLIOS_CACHE_DIR", "")
+        if not directory:
+            cache_home = os.environ.get("XDG_CACHE_HOME", "~/.cache")
+            directory = os.path.join(cache_home, "clios")
+        max_size = int(os.environ.get("CLIOS_CACHE_SIZE", str(2**30)))
+        return cls(Path(directory).expanduser(), max_size=max_size)
+
+    def get_key(self, *parts: t.Any) -> str | None:
+        """
+        Get the key of an entry from its parts
+
+        Returns:
+            str | None: The key, or None if any of the parts cannot be pickled
+        """
+        try:
+            return hashlib.sha256(pickle.dumps(parts, protocol=5)).hexdigest()
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+
+    def load(self, key: str) -> t.Any:
+        """
+        Load the value of an entry
+
+        Returns:
+            t.Any: The value, or `MISSING` if there is no such entry
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return MISSING
+        except Exception:
+            # a corrupt entry, or one which refers to code which has changed
+            path.unlink(missing_ok=True)
+            return MISSING
+        # mark the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+        return value
+
+    def save(self, key: str, value: t.Any) -> None:
+        """Save the value of an entry; values which cannot be pickled are skipped"""
+        try:
+            data = pickle.dumps(value, protocol=5)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(data) > self.max_size:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so that readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            with self._lock():
+                os.replace(tmp_path, self._get_path(key))
+                self._evict()
+        except BaseException:
+            # e.g. no space left, or interrupted: the temporary file is not evicted
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """Remove all the entries"""
+        if not self.directory.exists():
+            return
+        with self._lock():
+            for path in self.directory.glob(f"*{_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    @contextmanager
+    def _lock(self) -> t.Iterator[None]:
+        with open(self.directory / ".lock", "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def digest_value(value: t.Any) -> str | None:
+    """
+    Get the digest of a value
+
+    If the value is the path of an existing file, the digest includes the content
+    of the file. Returns None if the value cannot be pickled.
+    """
+    try:
+        digest = hashlib.sha256(pickle.dumps(value, protocol=5))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    if isinstance(value, (str, Path)) and value and os.path.isfile(value):
+        with open(value, "rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
+
+def digest_callback(callback: t.Callable[..., t.Any]) -> str | None:
+    """
+    Get the digest of the implementation of a callback
+
+    The digest covers its bytecode, its constants and the names it uses, its
+    default values and the values of its closure, so that it changes when the
+    callback is edited. Returns None if any of them cannot be pickled.
+    """
+    code = getattr(callback, "__code__", None)
+    try:
+        closure = tuple(
+            cell.cell_contents for cell in getattr(callback, "__closure__", None) or ()
+        )
+    except ValueError:  # an empty cell
+        return None
+    parts = (
+        None if code is None else _get_code_parts(code),
+        getattr(callback, "__defaults__", None),
+        getattr(callback, "__kwdefaults__", None),
+        closure,
+    )
+    try:
+        return hashlib.sha256(pickle.dumps(parts, protocol=5)).hexdigest()
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def _get_code_parts(code: types.CodeType) -> tuple[t.Any, ...]:
+    # the code objects of the nested functions are not picklable
+    consts = tuple(
+        _get_code_parts(const) if isinstance(const, types.CodeType) else const
+        for const in code.co_consts
+    )
+    return (code.co_code, consts, code.co_names)
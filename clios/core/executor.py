@@ -0,0 +1,330 @@
+import typing as t
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from multiprocessing.context import BaseContext
+
+from .cache import ResultCache
+from .operator import OperatorAbc, SharedOperator, SimpleOperator
+from .profiler import Profiler
+from .transport import SharedMemoryTransport, TransportAbc
+
+
+class ExecutorAbc(ABC):
+    """
+    An abstract class to represent a strategy for executing an operator tree
+
+    Args:
+        cache: The cache of the outputs of the cacheable operators
+        profiler: The profiler which records the time spent by the operators
+    """
+
+    def __init__(
+        self, cache: ResultCache | None = None, profiler: Profiler | None = None
+    ) -> None:
+        self.cache = cache
+        self.profiler = profiler
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Release the resources of the executor"""
+
+    def execute(self, operator: OperatorAbc) -> t.Any:
+        """
+        Execute an operator and (recursively) its input operators
+
+        Args:
+            operator: The operator
+
+        Returns:
+            t.Any: The output of the operator
+        """
+        inputs = operator.get_input_operators()
+        input_values = self.execute_inputs(inputs) if inputs else []
+        return operator.evaluate(input_values, self)
+
+    @abstractmethod
+    def execute_inputs(self, inputs: tuple[OperatorAbc, ...]) -> list[t.Any]:
+        """
+        Execute the input operators of an operator
+
+        Args:
+            inputs: The input operators
+
+        Returns:
+            list[t.Any]: The outputs of the input operators, in the same order
+        """
+
+
+class SerialExecutor(ExecutorAbc):
+    """
+    Execute the operators one after another
+
+    The tree is walked iteratively (children first) with an explicit stack,
+    so that the depth of the tree is not limited by the recursion limit.
+    """
+
+    def execute(self, operator: OperatorAbc) -> t.Any:
+        # Each entry is (operator, number of inputs) and the number is -1 if the
+        # inputs have not been pushed yet; the outputs go to the `values` stack
+        stack: list[tuple[OperatorAbc, int]] = [(operator, -1)]
+        values: list[t.Any] = []
+        while stack:
+            node, num_inputs = stack.pop()
+            if num_inputs < 0:
+                if isinstance(node, SharedOperator) and node.result.done:
+                    values.append(node.result.value)
+                    continue
+                inputs = node.get_input_operators()
+                stack.append((node, len(inputs)))
+                stack.extend((input_, -1) for input_ in reversed(inputs))
+                continue
+            if num_inputs:
+                input_values = values[-num_inputs:]
+                del values[-num_inputs:]
+            else:
+                input_values = []
+            values.append(node.evaluate(input_values, self))
+        return values.pop()
+
+    def execute_inputs(self, inputs: tuple[OperatorAbc, ...]) -> list[t.Any]:
+        return [self.execute(input_) for input_ in inputs]
+
+
+class ThreadExecutor(ExecutorAbc):
+    """
+    Execute sibling input operators concurrently in a pool of threads
+
+    Useful when the operator callbacks release the GIL (e.g. I/O or numerical
+    libraries). The outputs are returned in the order of the inputs and the
+    error of the first failing input (by position) is raised.
+
+    The threads are taken from `pool`, if given, which is then left running
+    (e.g. to be shared by several executors).
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        cache: ResultCache | None = None,
+        profiler: Profiler | None = None,
+        pool: ThreadPoolExecutor | None = None,
+    ) -> None:
+        super().__init__(cache, profiler)
+        self._owns_pool = pool is None
+        self._pool: Executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clios")
+            if pool is None
+            else pool
+        )
+
+    def shutdown(self) -> None:
+        if self._owns_pool:
+            self._pool.shutdown(cancel_futures=True)
+
+    def execute_inputs(self, inputs: tuple[OperatorAbc, ...]) -> list[t.Any]:
+        # Inputs which are plain values are not worth a trip through the pool,
+        # and the first operator input is run by the current thread itself
+        futures: list[Future[t.Any] | None] = []
+        inline = True
+        for input_ in inputs:
+            if isinstance(input_, SimpleOperator):
+                futures.append(None)
+            elif inline:
+                futures.append(None)
+                inline = False
+            else:
+                futures.append(self._pool.submit(input_.execute, self))
+        # A future which has not started yet is run in the current thread,
+        # so that nested operators never wait on a saturated pool
+        return _gather(inputs, futures, self, run_pending=True)
+
+
+class ProcessExecutor(ExecutorAbc):
+    """
+    Execute sibling input operators concurrently in a pool of worker processes
+
+    Useful for CPU bound operators written in pure Python. Each input operator
+    is sent, together with its whole subtree, to a worker process which executes
+    it and sends the output back. The callbacks of the operators are pickled by
+    reference, so they must be importable (e.g. not defined inside a function).
+
+    An operator with a single input operator is executed in the current process,
+    so that the fan-out further down the tree can be distributed.
+
+    A shared operator used by the subtrees of several inputs is executed once,
+    before the subtrees are sent, and its output is sent along with them.
+
+    The outputs are sent back by `transport`; by default large numpy arrays are
+    sent through shared memory and the other outputs are pickled. The spans
+    recorded by the worker processes, if profiling, are sent along with them.
+
+    The worker processes are taken from `pool`, if given, which is then left
+    running (e.g. to be shared by several executors).
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        mp_context: BaseContext | None = None,
+        cache: ResultCache | None = None,
+        transport: TransportAbc | None = None,
+        profiler: Profiler | None = None,
+        pool: ProcessPoolExecutor | None = None,
+    ) -> None:
+        super().__init__(cache, profiler)
+        self.transport = SharedMemoryTransport() if transport is None else transport
+        self.transport.prepare()
+        self._owns_pool = pool is None
+        self._pool: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+            if pool is None
+            else pool
+        )
+
+    def shutdown(self) -> None:
+        if self._owns_pool:
+            self._pool.shutdown(cancel_futures=True)
+
+    def execute_inputs(self, inputs: tuple[OperatorAbc, ...]) -> list[t.Any]:
+        if sum(1 for input_ in inputs if _is_remote(input_)) < 2:
+            return [input_.execute(self) for input_ in inputs]
+        # The shared operators of several subtrees are executed first, so that
+        # their results are sent along with the subtrees instead of being
+        # computed again by each worker
+        pending = _get_pending_shared_operators(inputs)
+        if pending:
+            self.execute_inputs(pending)
+        # a shared operator used several times as an input is sent once
+        unique = tuple({id(input_): input_ for input_ in inputs}.values())
+        profile = self.profiler is not None
+        futures: list[Future[t.Any] | None] = [
+            self._pool.submit(
+                _execute_subtree, input_, self.cache, self.transport, profile
+            )
+            if _is_remote(input_)
+            else None
+            for input_ in unique
+        ]
+        values = _gather(
+            unique,
+            futures,
+            self,
+            run_pending=False,
+            receive=self._receive,
+            discard=self._discard,
+        )
+        for input_, value in zip(unique, values):
+            if isinstance(input_, SharedOperator):
+                input_.result.set(value)
+        if len(unique) == len(inputs):
+            return values
+        outputs = {id(input_): value for input_, value in zip(unique, values)}
+        return [outputs[id(input_)] for input_ in inputs]
+
+    def _receive(self, operator: OperatorAbc, result: t.Any) -> t.Any:
+        if self.profiler is not None:
+            result, records = result
+            self.profiler.merge(operator, records)
+        return self.transport.receive(result)
+
+    def _discard(self, result: t.Any) -> None:
+        if self.profiler is not None:
+            result, _ = result
+        self.transport.discard(result)
+
+
+def _is_remote(operator: OperatorAbc) -> bool:
+    """Check if an input operator is worth executing in a worker process"""
+    if isinstance(operator, SharedOperator):
+        return not operator.result.done
+    return not isinstance(operator, SimpleOperator)
+
+
+def _get_pending_shared_operators(
+    inputs: tuple[OperatorAbc, ...],
+) -> tuple[SharedOperator, ...]:
+    """
+    Get the shared operators which are not executed yet and are used by the
+    subtrees of the inputs (the outermost ones)
+    """
+    pending: dict[int, SharedOperator] = {}
+    stack = [child for input_ in inputs for child in input_.get_input_operators()]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, SharedOperator):
+            if not node.result.done:
+                pending.setdefault(id(node), node)
+            continue
+        stack.extend(node.get_input_operators())
+    return tuple(pending.values())
+
+
+def _execute_subtree(
+    operator: OperatorAbc,
+    cache: ResultCache | None,
+    transport: TransportAbc,
+    profile: bool = False,
+) -> t.Any:
+    """
+    Execute an operator in a worker process, and get the object to be sent back
+    (and the records of the spans of its subtree, if `profile` is set)
+    """
+    profiler = Profiler() if profile else None
+    value = operator.execute(SerialExecutor(cache=cache, profiler=profiler))
+    if profiler is None:
+        return transport.send(value)
+    return transport.send(value), profiler.export(operator)
+
+
+def _gather(
+    inputs: tuple[OperatorAbc, ...],
+    futures: list[Future[t.Any] | None],
+    executor: ExecutorAbc,
+    run_pending: bool,
+    receive: t.Callable[[OperatorAbc, t.Any], t.Any] | None = None,
+    discard: t.Callable[[t.Any], None] | None = None,
+) -> list[t.Any]:
+    """
+    Collect the outputs of the inputs in order
+
+    Inputs without a future are executed in the current thread, and so are the
+    inputs whose future has not started yet if `run_pending` is set. The result
+    of the future of an input is passed to `receive`, if given, and the results
+    which are not received because of an error are passed to `discard`.
+    """
+    values: list[t.Any] = []
+    received: set[int] = set()
+    try:
+        for index, (input_, future) in enumerate(zip(inputs, futures)):
+            if future is None or (run_pending and future.cancel()):
+                values.append(input_.execute(executor))
+            elif receive is None:
+                values.append(future.result())
+            else:
+                received.add(index)
+                values.append(receive(input_, future.result()))
+    except BaseException:
+        for index, future in enumerate(futures):
+            if future is None or future.cancel() or index in received:
+                continue
+            if discard is not None:
+                # results which have already been sent are not received anymore
+                future.add_done_callback(partial(_discard, discard))
+        raise
+    return values
+
+
+def _discard(discard: t.Callable[[t.Any], None], future: Future[t.Any]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        discard(future.result())
@@ -1,11 +1,23 @@
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 from pydantic import ValidationError
 
+from .cache import MISSING, digest_callback, digest_value
 from .exceptions import CliosError
 from .operator_fn import OperatorFn
+from .profiler import measure
+from .writer import write_outputs
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .cache import ResultCache
+    from .executor import ExecutorAbc
+    from .profiler import Profiler
 
 
 class OperatorError(Exception):
@@ -21,10 +33,53 @@ class OperatorError(Exception):
         return message
 
 
+def _get_profiler(executor: "ExecutorAbc | None") -> "Profiler | None":
+    return None if executor is None else executor.profiler
+
+
+def _run_coroutine(coroutine: Any) -> Any:
+    """Run a coroutine to completion from synchronous code"""
+    import asyncio
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # the current thread already runs an event loop (e.g. clios is called from
+    # an asynchronous application), which cannot be blocked on: the coroutine
+    # is run in an event loop of its own, in another thread
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
 @dataclass(frozen=True)
 class OperatorAbc(ABC):
+    def execute(self, executor: "ExecutorAbc | None" = None) -> Any:
+        """Execute the operator and its input operators (serially by default)"""
+        if executor is None:
+            from .executor import SerialExecutor
+
+            executor = SerialExecutor()
+        return executor.execute(self)
+
+    def get_input_operators(self) -> tuple["OperatorAbc", ...]:
+        """Get the input operators, which are executed before this operator"""
+        return ()
+
     @abstractmethod
-    def execute(self) -> Any: ...  # pragma: no cover
+    def evaluate(
+        self, input_values: list[Any], executor: "ExecutorAbc | None" = None
+    ) -> Any:
+        """
+        Get the output of the operator, given the outputs of its input operators
+        """
+
+    @abstractmethod
+    async def execute_async(
+        self, executor: "ExecutorAbc | None" = None
+    ) -> Any: ...  # pragma: no cover
 
     @abstractmethod
     def draw(self) -> str: ...  # pragma: no cover
@@ -42,7 +97,12 @@ class SimpleOperator(OperatorAbc):
     index: int
     input_: Any
 
-    def execute(self) -> Any:
+    def evaluate(
+        self, input_values: list[Any], executor: "ExecutorAbc | None" = None
+    ) -> Any:
+        return self.input_
+
+    async def execute_async(self, executor: "ExecutorAbc | None" = None) -> Any:
         return self.input_
 
     def draw(self) -> str:
@@ -60,10 +120,24 @@ class BaseOperator(OperatorAbc):
     kwds: tuple[tuple[str, Any], ...] = ()
 
     def _validate_arguments(self) -> list[Any]:
+        parameters = self.operator_fn.parameters
+        var_argument = parameters.var_argument
+        if var_argument is not None:
+            # the variable arguments are validated at once, if valid
+            start = parameters.num_positional_arguments
+            values = var_argument.validate_batch(self.args[start:], "execute")
+            if values is not None:
+                return self._validate_each_argument(self.args[:start]) + values
+        return self._validate_each_argument(self.args)
+
+    def _validate_each_argument(self, args: tuple[Any, ...]) -> list[Any]:
         arg_values: list[Any] = []
         iter_args = self.operator_fn.parameters.iter_positional_arguments()
-        for val in self.args:
+        for val in args:
             param = next(iter_args)
+            if param.execute_phase_noop:
+                arg_values.append(val)
+                continue
             try:
                 arg_values.append(param.execute_phase_validator.validate_python(val))
             except ValidationError as e:
@@ -77,6 +151,9 @@ class BaseOperator(OperatorAbc):
         arg_values: dict[str, Any] = {}
         for key, val in self.kwds:
             param = self.operator_fn.parameters.get_keyword_argument(key)
+            if param.execute_phase_noop:
+                arg_values[key] = val
+                continue
             try:
                 arg_values[key] = param.execute_phase_validator.validate_python(val)
             except ValidationError as e:
@@ -100,17 +177,102 @@ class BaseOperator(OperatorAbc):
                 param_values.append(args_rev.pop())
         return param_values
 
-    def execute(self) -> Any:
-        arg_values = self._validate_arguments()
-        kwds_values = self._validate_keywords()
+    def _get_cache(self, executor: "ExecutorAbc | None") -> "ResultCache | None":
+        if executor is None or not self.operator_fn.cacheable:
+            return None
+        return executor.cache
+
+    def _get_cache_key(
+        self, cache: "ResultCache", args: list[Any], kwds: dict[str, Any]
+    ) -> str | None:
+        """Get the key of the output in the result cache"""
+        digests = [digest_value(value) for value in (*args, *kwds.values())]
+        if None in digests:
+            return None
+        callback = self.operator_fn.callback
+        callback_digest = digest_callback(callback)
+        if callback_digest is None:
+            return None
+        return cache.get_key(
+            self.name,
+            getattr(callback, "__module__", ""),
+            getattr(callback, "__qualname__", ""),
+            callback_digest,
+            tuple(kwds),
+            digests,
+        )
+
+    def _load_cached(
+        self, args: list[Any], kwds: dict[str, Any], executor: "ExecutorAbc | None"
+    ) -> tuple["ResultCache | None", str | None, Any]:
+        """Get the result cache, the key and the cached output (or `MISSING`)"""
+        cache = self._get_cache(executor)
+        key = None if cache is None else self._get_cache_key(cache, args, kwds)
+        if cache is None or key is None:
+            return cache, key, MISSING
+        return cache, key, cache.load(key)
+
+    @contextmanager
+    def _calling(self, profiler: "Profiler | None") -> Iterator[None]:
+        """Measure the call of the callback, and wrap its errors"""
         try:
-            value = self.operator_fn.callback(*arg_values, **kwds_values)
+            with measure(profiler, self, "callback"):
+                yield
         except CliosError as e:
             raise OperatorError(
                 f"An error occurred while executing operator `{self.name}`!",
                 ctx={"error": e, "index": self.index, "name": self.name},
             )
 
+    def _save_output(
+        self,
+        value: Any,
+        profiler: "Profiler | None",
+        cache: "ResultCache | None",
+        key: str | None,
+    ) -> Any:
+        """Validate the output of the callback, and save it in the result cache"""
+        with measure(profiler, self, "output"):
+            value = self._validate_output(value)
+        if cache is not None and key is not None:
+            cache.save(key, value)
+        return value
+
+    def _call(
+        self,
+        args: list[Any],
+        kwds: dict[str, Any],
+        executor: "ExecutorAbc | None" = None,
+    ) -> Any:
+        cache, key, value = self._load_cached(args, kwds, executor)
+        if value is not MISSING:
+            return value
+        profiler = _get_profiler(executor)
+        with self._calling(profiler):
+            value = self.operator_fn.callback(*args, **kwds)
+            if self.operator_fn.is_async:
+                value = _run_coroutine(value)
+        return self._save_output(value, profiler, cache, key)
+
+    async def _call_async(
+        self,
+        args: list[Any],
+        kwds: dict[str, Any],
+        executor: "ExecutorAbc | None" = None,
+    ) -> Any:
+        cache, key, value = self._load_cached(args, kwds, executor)
+        if value is not MISSING:
+            return value
+        profiler = _get_profiler(executor)
+        with self._calling(profiler):
+            value = self.operator_fn.callback(*args, **kwds)
+            if self.operator_fn.is_async:
+                value = await value
+        return self._save_output(value, profiler, cache, key)
+
+    def _validate_output(self, value: Any) -> Any:
+        if self.operator_fn.output.is_trusted:
+            return value
         try:
             return self.operator_fn.output.validator.validate_python(value)
         except ValidationError as e:
@@ -121,33 +283,27 @@ class BaseOperator(OperatorAbc):
                 ctx={"index": self.index, "name": self.name},
             )
 
-    def draw(self) -> str:
-        return f"{self.name}"
-
-
-@dataclass(frozen=True)
-class LeafOperator(BaseOperator):
-    """An operator that has no inputs"""
-
-    pass
-
-
-@dataclass(frozen=True)
-class _Operator(BaseOperator):
-    inputs: tuple[Any, ...] = ()
-
-    def execute_input(self, input_: Any) -> Any:
-        raise NotImplementedError
-
-    def _validate_execute_inputs(self) -> list[Any]:
+    def _validate_input_values(self, values: list[Any]) -> list[Any]:
+        parameters = self.operator_fn.parameters
+        var_input = parameters.var_input
+        if var_input is not None:
+            # the variable inputs are validated at once, if valid
+            start = parameters.num_fixed_inputs
+            batch = var_input.validate_batch(values[start:], "execute")
+            if batch is not None:
+                return self._validate_each_input_value(values[:start]) + batch
+        return self._validate_each_input_value(values)
+
+    def _validate_each_input_value(self, values: list[Any]) -> list[Any]:
         input_values: list[Any] = []
         iter_inputs = self.operator_fn.parameters.iter_inputs()
-        for input_ in self.inputs:
+        for input_value in values:
             input_param = next(iter_inputs)
+            if input_param.execute_phase_noop:
+                input_values.append(input_value)
+                continue
             try:
-                value = input_param.execute_phase_validator.validate_python(
-                    self.execute_input(input_)
-                )
+                value = input_param.execute_phase_validator.validate_python(input_value)
             except ValidationError as e:
                 raise OperatorError(
                     f"Data validation failed for the input of operator `{self.name}`!",
@@ -156,29 +312,50 @@ class _Operator(BaseOperator):
             input_values.append(value)
         return input_values
 
-    def execute(self) -> Any:
+    def _prepare_call(
+        self, input_values: list[Any]
+    ) -> tuple[list[Any], dict[str, Any]]:
+        """Validate and compose the positional and keyword arguments of the callback"""
         arg_values = self._validate_arguments()
         kwds_values = self._validate_keywords()
-        input_values = self._validate_execute_inputs()
+        input_values = self._validate_input_values(input_values)
         positional_args = self._compose_arg_values(arg_values, input_values)
+        return positional_args, kwds_values
+
+    def evaluate(
+        self, input_values: list[Any], executor: "ExecutorAbc | None" = None
+    ) -> Any:
+        profiler = _get_profiler(executor)
+        with measure(profiler, self, "execute"):
+            with measure(profiler, self, "validate"):
+                positional_args, kwds_values = self._prepare_call(input_values)
+            return self._call(positional_args, kwds_values, executor)
+
+    async def _execute_inputs_async(self, executor: "ExecutorAbc | None") -> list[Any]:
+        return []
+
+    async def execute_async(self, executor: "ExecutorAbc | None" = None) -> Any:
+        input_values = await self._execute_inputs_async(executor)
+        profiler = _get_profiler(executor)
+        with measure(profiler, self, "execute"):
+            with measure(profiler, self, "validate"):
+                positional_args, kwds_values = self._prepare_call(input_values)
+            return await self._call_async(positional_args, kwds_values, executor)
 
-        try:
-            value = self.operator_fn.callback(*positional_args, **kwds_values)
-        except CliosError as e:
-            raise OperatorError(
-                f"An error occurred while executing operator `{self.name}`!",
-                ctx={"error": e, "index": self.index, "name": self.name},
-            )
+    def draw(self) -> str:
+        return f"{self.name}"
 
-        try:
-            return self.operator_fn.output.validator.validate_python(value)
-        except ValidationError as e:
-            raise OperatorError(
-                f"Data validation failed for the output of operator `{self.name}`!\n"
-                + f"Error: {e}\n"
-                + "It's a bug! Please report it!",
-                ctx={"index": self.index, "name": self.name},
-            )
+
+@dataclass(frozen=True)
+class LeafOperator(BaseOperator):
+    """An operator that has no inputs"""
+
+    pass
+
+
+@dataclass(frozen=True)
+class _Operator(BaseOperator):
+    inputs: tuple[Any, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -187,8 +364,21 @@ class Operator(_Operator):
 
     inputs: tuple[OperatorAbc, ...] = ()
 
-    def execute_input(self, input_: OperatorAbc) -> Any:
-        return input_.execute()
+    def get_input_operators(self) -> tuple[OperatorAbc, ...]:
+        return self.inputs
+
+    async def _execute_inputs_async(self, executor: "ExecutorAbc | None") -> list[Any]:
+        import asyncio
+
+        # Wait for all the inputs, and raise the error of the first failing input
+        values = await asyncio.gather(
+            *(input_.execute_async(executor) for input_ in self.inputs),
+            return_exceptions=True,
+        )
+        for value in values:
+            if isinstance(value, BaseException):
+                raise value
+        return values
 
     def draw(self) -> str:
         res = f"{self.name} [ "
@@ -204,8 +394,14 @@ class DelegateOperator(_Operator):
 
     inputs: tuple[str, ...] = ()
 
-    def execute_input(self, input_: str) -> str:
-        return input_
+    def evaluate(
+        self, input_values: list[Any], executor: "ExecutorAbc | None" = None
+    ) -> Any:
+        # the string inputs are given to the callback as they are
+        return super().evaluate(list(self.inputs), executor)
+
+    async def _execute_inputs_async(self, executor: "ExecutorAbc | None") -> list[Any]:
+        return list(self.inputs)
 
     def draw(self) -> str:
         res = f"{self.name} [ "
@@ -216,15 +412,123 @@ class DelegateOperator(_Operator):
         return res
 
 
+class _SharedResult:
+    """The result of a shared operator, computed once"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._done = False
+        self._value: Any = None
+        self._task: "asyncio.Future[Any] | None" = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # A computed result is sent along with the operator (e.g. to a worker
+        # process), so that it is not computed again by the receiver
+        if self._done:
+            return (_SharedResult._computed, (self._value,))
+        return (_SharedResult, ())
+
+    @classmethod
+    def _computed(cls, value: Any) -> "_SharedResult":
+        result = cls()
+        result.set(value)
+        return result
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    def set(self, value: Any) -> None:
+        self._value, self._done = value, True
+
+    def get(self, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if not self._done:
+                self.set(compute())
+            return self._value
+
+    async def get_async(self, compute: Callable[[], Any]) -> Any:
+        if self._done:
+            return self._value
+        if self._task is None:
+            import asyncio
+
+            self._task = asyncio.ensure_future(compute())
+        value = await self._task
+        self.set(value)
+        return value
+
+
+@dataclass(frozen=True)
+class SharedOperator(OperatorAbc):
+    """
+    An operator whose input operator is executed only once
+
+    The same instance is used as the input of several operators, which then
+    share its output. The output is kept for the lifetime of the instance.
+    """
+
+    input: OperatorAbc
+    _result: _SharedResult = field(
+        init=False, default_factory=_SharedResult, compare=False, repr=False
+    )
+
+    @property
+    def result(self) -> _SharedResult:
+        return self._result
+
+    def execute(self, executor: "ExecutorAbc | None" = None) -> Any:
+        return self._result.get(lambda: self.input.execute(executor))
+
+    def get_input_operators(self) -> tuple[OperatorAbc, ...]:
+        return (self.input,)
+
+    def evaluate(
+        self, input_values: list[Any], executor: "ExecutorAbc | None" = None
+    ) -> Any:
+        (value,) = input_values
+        self._result.set(value)
+        return value
+
+    async def execute_async(self, executor: "ExecutorAbc | None" = None) -> Any:
+        return await self._result.get_async(lambda: self.input.execute_async(executor))
+
+    def draw(self) -> str:
+        return self.input.draw()
+
+
 @dataclass(frozen=True)
 class RootOperator(OperatorAbc):
     input: BaseOperator
     callback: Callable[..., Any]
     args: tuple[str, ...] = ()
-
-    def execute(self) -> Any:
-        value = self.input.execute()
-        return self.callback(value, *self.args)
+    # if given, each output path is written by its writer, concurrently,
+    # instead of calling `callback(value, *args)`
+    writers: tuple[Callable[[Any, str], Any], ...] = ()
+
+    def get_input_operators(self) -> tuple[OperatorAbc, ...]:
+        return (self.input,)
+
+    def evaluate(
+        self, input_values: list[Any], executor: "ExecutorAbc | None" = None
+    ) -> Any:
+        (value,) = input_values
+        return self._output(value, executor)
+
+    async def execute_async(self, executor: "ExecutorAbc | None" = None) -> Any:
+        value = await self.input.execute_async(executor)
+        return self._output(value, executor)
+
+    def _output(self, value: Any, executor: "ExecutorAbc | None") -> Any:
+        profiler = _get_profiler(executor)
+        with measure(profiler, self, "root"):
+            if self.writers:
+                return write_outputs(value, self.writers, self.args, profiler, self)
+            return self.callback(value, *self.args)
 
     def draw(self) -> str:
         res = ",".join(self.args)
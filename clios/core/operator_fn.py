@@ -1,75 +1,100 @@
 # from dataclasses import dataclass
+import importlib
+import importlib.util
+import inspect
+import pickle
+import sys
 import typing as t
+from collections.abc import ItemsView, ValuesView
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-
-from griffe import Docstring, DocstringSectionKind, parse_google
+from functools import cached_property
+from pathlib import Path
 
 from .param_parser import ParamParserAbc
 from .parameter import Parameter, Parameters, ReturnValue
 from .utils import get_output_info, get_typed_signature
 
+if t.TYPE_CHECKING:
+    from griffe import DocstringSection
+
 Implicit = t.Literal["input", "param"]
 
 
-@dataclass(frozen=True)
-class OperatorFn:
-    """A dataclass to represent an operator function"""
+class Description(t.NamedTuple):
+    """The descriptions of an operator, parsed from the docstring of its callback"""
+
+    short_description: str
+    long_description: str
+    examples: list[tuple[str, str]]
+
+
+class _Documented:
+    """
+    The descriptions of an operator, from the docstring of its callback
+
+    The docstring is parsed once, when a description is first needed (or by
+    `OperatorFns.parse_docstrings`), and kept outside of the dataclass fields,
+    so that the operator function stays hashable.
+    """
 
-    parameters: Parameters
-    output: ReturnValue
     callback: t.Callable[..., t.Any]
-    param_parser: ParamParserAbc
-    is_delegate: bool = False
+
+    @cached_property
+    def description(self) -> Description:
+        """Get the descriptions of the operator"""
+        return parse_description(self.callback.__doc__)
 
     @property
     def short_description(self) -> str:
         """Get the short description of the operator"""
-        if not self.callback.__doc__:
-            return ""
-        parsed_docstring = parse_google(Docstring(self.callback.__doc__))
-
-        if parsed_docstring[0].kind != DocstringSectionKind.text:
-            return ""
-
-        return parsed_docstring[0].value
+        return self.description.short_description
 
     @property
     def long_description(self) -> str:
         """Get the long description of the operator"""
-        if not self.callback.__doc__:
-            return ""
-        parsed_docstring = parse_google(Docstring(self.callback.__doc__))
-
-        for section in parsed_docstring:
-            if section.title and section.title.lower() == "description":
-                return section.value.contents
-        return ""
+        return self.description.long_description
 
     @property
     def examples(self) -> list[tuple[str, str]]:
         """Get the examples of the operator"""
-        if not self.callback.__doc__:
-            return []
-
-        parsed_docstring = parse_google(Docstring(self.callback.__doc__))
-
-        for section in parsed_docstring:
-            if section.title and (
-                section.title.lower() == "operator examples"
-                or section.title.lower() == "operator example"
-            ):
-                example_docstring = parse_google(Docstring(section.value.contents))
-                examples: list[tuple[str, str]] = []
-                for example in example_docstring:
-                    title = "" if example.title is None else example.title
-                    contents = (
-                        example.value
-                        if example.kind == DocstringSectionKind.text
-                        else example.value.contents
-                    )
-                    examples.append((title, contents))
-                return examples
-        return []
+        return self.description.examples
+
+
+@dataclass(frozen=True)
+class OperatorFn(_Documented):
+    """A dataclass to represent an operator function"""
+
+    parameters: Parameters
+    output: ReturnValue
+    callback: t.Callable[..., t.Any]
+    param_parser: ParamParserAbc
+    is_delegate: bool = False
+    implicit: Implicit = "param"
+    is_async: bool = False
+    deterministic: bool = True
+    cacheable: bool = False
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        """
+        Pickle the operator function by reference to the import path of its callback
+
+        The validators are not pickled, they are rebuilt (once per process) when
+        the operator function is unpickled.
+        """
+        module = getattr(self.callback, "__module__", None)
+        qualname = getattr(self.callback, "__qualname__", "")
+        if module is None or "<locals>" in qualname:
+            raise pickle.PicklingError(
+                f"Cannot pickle operator function `{qualname}`: "
+                + "the callback is not importable!"
+            )
+        try:
+            path = inspect.getfile(self.callback)
+        except TypeError:
+            path = ""
+        options = tuple((name, getattr(self, name)) for name in _FROM_DEF_OPTIONS)
+        return (_load_operator_fn, (module, qualname, path, options))
 
     @classmethod
     def from_def(
@@ -78,6 +103,8 @@ class OperatorFn:
         param_parser: ParamParserAbc,
         implicit: Implicit,
         is_delegate: bool = False,
+        deterministic: bool = True,
+        cacheable: bool = False,
     ) -> "OperatorFn":
         signature = get_typed_signature(func)
         parameter_list: list[Parameter] = []
@@ -91,15 +118,225 @@ class OperatorFn:
             callback=func,
             param_parser=param_parser,
             is_delegate=is_delegate,
+            implicit=implicit,
+            is_async=inspect.iscoroutinefunction(func),
+            deterministic=deterministic,
+            cacheable=cacheable,
         )
 
 
+@dataclass(frozen=True)
+class DeferredOperatorFn(_Documented):
+    """
+    An operator function registered, but not built yet
+
+    The signature of the callback is validated, and the validators of its
+    parameters are built, when the operator function is first looked up.
+    """
+
+    callback: t.Callable[..., t.Any]
+    param_parser: ParamParserAbc
+    implicit: Implicit = "param"
+    is_delegate: bool = False
+    deterministic: bool = True
+    cacheable: bool = False
+
+    def build(self) -> OperatorFn:
+        options = {name: getattr(self, name) for name in _FROM_DEF_OPTIONS}
+        return OperatorFn.from_def(self.callback, **options)
+
+
+# The options of `OperatorFn.from_def` which are kept on the operator function
+_FROM_DEF_OPTIONS = (
+    "param_parser",
+    "implicit",
+    "is_delegate",
+    "deterministic",
+    "cacheable",
+)
+
+_loaded_operator_fns: dict[tuple[t.Any, ...], OperatorFn] = {}
+
+
+def parse_description(docstring: str | None) -> Description:
+    """Parse the descriptions of an operator from the docstring of its callback"""
+    if not docstring:
+        return Description("", "", [])
+    sections = _parse_docstring(docstring)
+    short_description = ""
+    if sections and sections[0].kind == "text":
+        short_description = sections[0].value
+    long_description = ""
+    examples: list[tuple[str, str]] = []
+    for section in sections:
+        title = section.title.lower() if section.title else ""
+        if title == "description" and not long_description:
+            long_description = section.value.contents
+        elif title in ("operator examples", "operator example") and not examples:
+            for example in _parse_docstring(section.value.contents):
+                contents = (
+                    example.value if example.kind == "text" else example.value.contents
+                )
+                examples.append(
+                    ("" if example.title is None else example.title, contents)
+                )
+    return Description(short_description, long_description, examples)
+
+
+def _parse_docstring(docstring: str) -> list["DocstringSection"]:
+    """Parse a Google-style docstring (griffe is only imported to render the help)"""
+    from griffe import Docstring, parse_google
+
+    return parse_google(Docstring(docstring))
+
+
+def _load_operator_fn(
+    module_name: str,
+    qualname: str,
+    path: str,
+    options: tuple[tuple[str, t.Any], ...],
+) -> OperatorFn:
+    """Get an operator function given the import path of its callback"""
+    key = (module_name, qualname, path, options)
+    if key in _loaded_operator_fns:
+        return _loaded_operator_fns[key]
+
+    if module_name in sys.modules:
+        obj: t.Any = sys.modules[module_name]
+    else:
+        try:
+            obj = importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            # e.g. an inline operator module, which is loaded from its file path
+            if not path or not Path(path).exists():
+                raise
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            assert spec is not None and spec.loader is not None
+            obj = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(obj)
+            sys.modules[module_name] = obj
+
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+
+    if isinstance(obj, OperatorFn):
+        operator_fn = obj
+    else:
+        operator_fn = OperatorFn.from_def(obj, **dict(options))
+    _loaded_operator_fns[key] = operator_fn
+    return operator_fn
+
+
 class OperatorFns(dict[str, OperatorFn]):
-    def __setitem__(self, key: str, value: OperatorFn) -> None:
+    """
+    The operator functions, by name
+
+    The operator functions registered with `register` are built when they are
+    first looked up (by key, or by iterating over the values or items), so that
+    only the operators of a command line are built. Use `validate_all` to check
+    all of them, e.g. in a test.
+    """
+
+    def __getitem__(self, key: str) -> OperatorFn:
+        value: t.Any = super().__getitem__(key)
+        if isinstance(value, DeferredOperatorFn):
+            deferred, value = value, value.build()
+            if "description" in vars(deferred):
+                vars(value)["description"] = deferred.description
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return self[key] if key in self else default
+
+    def __iter__(self) -> t.Iterator[str]:
+        # overridden so that `dict(...)`, `{**...}` and `|` look up the operator
+        # functions by key (building them), instead of copying the unbuilt ones
+        return super().__iter__()
+
+    def values(self) -> ValuesView[OperatorFn]:  # type: ignore
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, OperatorFn]:  # type: ignore
+        return ItemsView(self)
+
+    def copy(self) -> "OperatorFns":
+        # the operator functions not built yet are built on lookup in the copy
+        operator_fns = OperatorFns()
+        dict.update(operator_fns, dict.items(self))
+        return operator_fns
+
+    def pop(self, key: str, *default: t.Any) -> t.Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        super().pop(key)
+        return value
+
+    def popitem(self) -> tuple[str, OperatorFn]:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: t.Any = None) -> t.Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def peek(self, key: str) -> "OperatorFn | DeferredOperatorFn":
+        """Get an operator function without building it, e.g. for its docstring"""
+        return super().__getitem__(key)
+
+    def validate_all(self) -> None:
+        """
+        Build all the operator functions
+
+        Raises:
+            ExceptionGroup: The errors of the operator functions which are not valid
+        """
+        errors: list[Exception] = []
+        for key in list(self):
+            try:
+                self[key]
+            except Exception as e:
+                e.add_note(f"Registered as operator `{key}`")
+                errors.append(e)
+        if errors:
+            raise ExceptionGroup(f"{len(errors)} invalid operator(s)!", errors)
+
+    def parse_docstrings(self, processes: int = 0) -> None:
+        """
+        Parse the docstrings of all the operator functions, without building them
+
+        Args:
+            processes: The number of worker processes parsing the docstrings, or 0
+                to parse them in this process
+        """
+        pending: dict[str | None, list[_Documented]] = {}
+        for key in self:
+            documented = self.peek(key)
+            if "description" not in vars(documented):
+                pending.setdefault(documented.callback.__doc__, []).append(documented)
+        descriptions: list[Description]
+        if processes > 0 and len(pending) > 1:
+            chunksize = max(len(pending) // (4 * processes), 1)
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                descriptions = list(
+                    executor.map(parse_description, pending, chunksize=chunksize)
+                )
+        else:
+            descriptions = [parse_description(docstring) for docstring in pending]
+        for documented_fns, description in zip(pending.values(), descriptions):
+            for documented_fn in documented_fns:
+                # the value of the cached property
+                vars(documented_fn)["description"] = description
+
+    def __setitem__(self, key: str, value: "OperatorFn | DeferredOperatorFn") -> None:
         assert key not in self, (
             f"Operator '{key}' already exists. Reassignment is not allowed."
         )
-        super().__setitem__(key, value)
+        super().__setitem__(key, value)  # type: ignore
 
     def update(self, *arg, **kwds) -> None:
         if kwds or not isinstance(arg[0], OperatorFns):
@@ -110,7 +347,8 @@ class OperatorFns(dict[str, OperatorFn]):
             assert key not in self, (
                 f"Operator '{key}' already exists. Reassignment is not allowed."
             )
-        super().update(arg[0])
+        # the operator functions not built yet are kept as is
+        super().update(dict.items(arg[0]))
 
     def register(
         self,
@@ -119,14 +357,18 @@ class OperatorFns(dict[str, OperatorFn]):
         param_parser: ParamParserAbc,
         implicit: t.Literal["input", "param"],
         is_delegate: bool = False,
+        deterministic: bool = True,
+        cacheable: bool = False,
     ) -> t.Callable[..., t.Any]:
         def _decorator(func: t.Callable[..., t.Any]):
             key = name if name else func.__name__
-            self[key] = OperatorFn.from_def(
+            self[key] = DeferredOperatorFn(
                 func,
                 param_parser=param_parser,
                 implicit=implicit,
                 is_delegate=is_delegate,
+                deterministic=deterministic,
+                cacheable=cacheable,
             )
             return func
 
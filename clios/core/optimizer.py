@@ -0,0 +1,122 @@
+import typing as t
+from collections import Counter
+from dataclasses import replace
+
+from .operator import (
+    BaseOperator,
+    DelegateOperator,
+    Operator,
+    OperatorAbc,
+    RootOperator,
+    SharedOperator,
+    SimpleOperator,
+)
+
+
+def share_common_operators(root: RootOperator) -> RootOperator:
+    """
+    Eliminate the common subexpressions of an operator tree
+
+    Operators with the same operator function, arguments and (recursively) inputs
+    are replaced by a single `SharedOperator`, so that they are executed only once.
+    Operators which are not deterministic are never shared. The operators which
+    are already shared (e.g. bound to a name by the parser) stay shared.
+
+    Args:
+        root (RootOperator): The operator tree
+
+    Returns:
+        RootOperator: The operator tree with the common operators shared
+    """
+    operators = list(_iter_post_order(root.input))
+    # The structural keys are interned as integers, so that they stay flat
+    interned: dict[t.Hashable, int] = {}
+    keys: dict[int, int] = {}
+    counts: Counter[int] = Counter()
+    # the operators of already shared operators are yielded once per use
+    counted: set[int] = set()
+    for operator in operators:
+        key = interned.setdefault(_get_key(operator, keys), len(interned))
+        keys[id(operator)] = key
+        # Plain input values are not worth sharing
+        if not isinstance(operator, SimpleOperator) and id(operator) not in counted:
+            counted.add(id(operator))
+            counts[key] += 1
+    if all(count == 1 for count in counts.values()):
+        return root
+    input_ = _share(operators, keys, counts)
+    assert isinstance(input_, BaseOperator)
+    return replace(root, input=input_)
+
+
+def _iter_post_order(operator: OperatorAbc) -> t.Generator[OperatorAbc, None, None]:
+    """Yield every operator of the tree, children first"""
+    stack: list[tuple[OperatorAbc, bool]] = [(operator, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+            continue
+        stack.append((node, True))
+        stack.extend((input_, False) for input_ in reversed(node.get_input_operators()))
+
+
+def _get_key(operator: OperatorAbc, keys: dict[int, int]) -> t.Hashable:
+    unique = object()
+    if isinstance(operator, SimpleOperator):
+        key: t.Hashable = (SimpleOperator, type(operator.input_), operator.input_)
+    elif isinstance(operator, SharedOperator):
+        key = (SharedOperator, id(operator))
+    elif isinstance(operator, BaseOperator):
+        if not operator.operator_fn.deterministic:
+            return unique
+        inputs: tuple[t.Any, ...] = ()
+        if isinstance(operator, Operator):
+            inputs = tuple(keys[id(input_)] for input_ in operator.inputs)
+        elif isinstance(operator, DelegateOperator):
+            inputs = operator.inputs
+        key = (
+            type(operator),
+            id(operator.operator_fn),
+            operator.args,
+            operator.kwds,
+            inputs,
+        )
+    else:
+        return unique
+    try:
+        hash(key)
+    except TypeError:
+        return unique
+    return key
+
+
+def _share(
+    operators: list[OperatorAbc],
+    keys: dict[int, int],
+    counts: Counter[int],
+) -> OperatorAbc:
+    """Rebuild the tree from its operators in post order, sharing the common ones"""
+    shared: dict[int, OperatorAbc] = {}
+    rebuilt: list[OperatorAbc] = []
+    for operator in operators:
+        num_inputs = len(operator.get_input_operators())
+        inputs = tuple(rebuilt[len(rebuilt) - num_inputs :])
+        del rebuilt[len(rebuilt) - num_inputs :]
+        key = keys[id(operator)]
+        if key in shared:
+            rebuilt.append(shared[key])
+            continue
+        if isinstance(operator, SharedOperator):
+            # rebuilt once, for all of its uses
+            operator = replace(operator, input=inputs[0])
+            shared[key] = operator
+            rebuilt.append(operator)
+            continue
+        if isinstance(operator, Operator):
+            operator = replace(operator, inputs=inputs)
+        if counts[key] > 1:
+            operator = SharedOperator(operator)
+            shared[key] = operator
+        rebuilt.append(operator)
+    return rebuilt.pop()
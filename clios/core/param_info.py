@@ -30,3 +30,17 @@ class Output:
     strict: bool = False
     callback: Callable[..., None] | None = None
     num_outputs: NonNegativeInt = 1
+    # the return value is not validated if trusted
+    trusted: bool = False
+    # a writer per output, called as `writer(value, path)` concurrently instead
+    # of calling `callback(value, *paths)` once
+    writers: tuple[Callable[[Any, str], Any], ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.writers and self.callback is not None:
+            raise ValueError("Either `callback` or `writers` can be given, not both!")
+        if self.writers and len(self.writers) != self.num_outputs:
+            raise ValueError(
+                f"Expected a writer per output: got {len(self.writers)} writer(s) "
+                + f"for {self.num_outputs} output(s)!"
+            )
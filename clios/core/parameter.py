@@ -6,11 +6,12 @@ from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
 
-from pydantic import BeforeValidator, ConfigDict, PydanticUserError, Strict, TypeAdapter
+from pydantic import BeforeValidator, Strict, TypeAdapter, ValidationError
 from pydantic.functional_validators import AfterValidator, PlainValidator, WrapValidator
 from typing_extensions import Doc
 
 from .param_info import Input, Output, Param, ParamTypes
+from .type_adapters import strip_metadata, type_adapters
 from .utils import get_parameter_type_annotation
 
 
@@ -25,8 +26,11 @@ def _init_validator(
     annotation: t.Any,
     phase_validators: tuple[t.Callable[[t.Any], t.Any], ...],
     phase: str,
+    batch: bool = False,
 ) -> TypeAdapter[t.Any]:
     validators = [BeforeValidator(validator) for validator in phase_validators]
+    # the metadata of clios (e.g. the parameter info) does not change the validation
+    annotation = strip_metadata(annotation)
     if info.core_validation_phase != phase:
         annotation = t.Any
 
@@ -36,12 +40,21 @@ def _init_validator(
     if info.strict and _get_type(annotation) is not t.Any:
         annotation = t.Annotated[annotation, Strict()]
 
-    try:
-        return TypeAdapter(annotation, config=ConfigDict(arbitrary_types_allowed=True))
-    except PydanticUserError as e:
-        if e.code == "type-adapter-config-unused":
-            return TypeAdapter(annotation)
-        raise
+    if batch:
+        # validate a list of values at once
+        annotation = list[annotation]  # type: ignore
+
+    # shared by the parameters with the same type, validators, strictness and phase
+    return type_adapters.get(annotation)
+
+
+def _is_noop_validator(
+    info: ParamTypes,
+    phase_validators: tuple[t.Callable[[t.Any], t.Any], ...],
+    phase: str,
+) -> bool:
+    """Check if the validator of a phase returns its input as it is"""
+    return info.core_validation_phase != phase and not phase_validators
 
 
 def _get_description(annotation: t.Any) -> str:
@@ -90,6 +103,60 @@ class Parameter:
     execute_phase_validator: TypeAdapter[t.Any]
     description: str
     default: t.Any
+    build_phase_noop: bool = False
+    execute_phase_noop: bool = False
+
+    @cached_property
+    def build_phase_batch_validator(self) -> TypeAdapter[list[t.Any]]:
+        """Get the build-phase validator of a list of values"""
+        return _init_validator(
+            self.info,
+            self.annotation,
+            self.info.build_phase_validators,
+            "build",
+            batch=True,
+        )
+
+    @cached_property
+    def execute_phase_batch_validator(self) -> TypeAdapter[list[t.Any]]:
+        """Get the execute-phase validator of a list of values"""
+        return _init_validator(
+            self.info,
+            self.annotation,
+            self.info.execute_phase_validators,
+            "execute",
+            batch=True,
+        )
+
+    def validate_batch(
+        self, values: t.Sequence[t.Any], phase: t.Literal["build", "execute"]
+    ) -> list[t.Any] | None:
+        """
+        Validate the values of a variadic parameter with a single call
+
+        Args:
+            values (t.Sequence[t.Any]): The values
+            phase (str): The phase of the validation
+
+        Returns:
+            list[t.Any] | None: The validated values, or None if some value is
+                invalid or there are less than two values: the values must then
+                be validated one by one (e.g. to get the error of the invalid value)
+        """
+        if len(values) < 2:
+            return None
+        if phase == "build":
+            if self.build_phase_noop:
+                return list(values)
+            validator = self.build_phase_batch_validator
+        else:
+            if self.execute_phase_noop:
+                return list(values)
+            validator = self.execute_phase_batch_validator
+        try:
+            return validator.validate_python(list(values))
+        except ValidationError:
+            return None
 
     @property
     def choices(self) -> list[t.Any]:
@@ -161,6 +228,12 @@ class Parameter:
             execute_phase_validator=execute_phase_validator,
             description=description,
             default=default,
+            build_phase_noop=_is_noop_validator(
+                param_type, param_type.build_phase_validators, "build"
+            ),
+            execute_phase_noop=_is_noop_validator(
+                param_type, param_type.execute_phase_validators, "execute"
+            ),
         )
 
     @property
@@ -228,8 +301,8 @@ class ReturnValue:
         prohibited_validators = (PlainValidator, WrapValidator, AfterValidator)
         type_adapter: TypeAdapter[t.Any]
         if _get_type(annotation) is None:
-            type_adapter = TypeAdapter(None)
-            info = Output(callback=info.callback, num_outputs=0)
+            type_adapter = type_adapters.get(None)
+            info = Output(callback=info.callback, num_outputs=0, trusted=info.trusted)
         else:
             if t.get_origin(annotation) is t.Annotated:
                 if any(
@@ -241,15 +314,18 @@ class ReturnValue:
                     )
             if info.strict:
                 annotation = t.Annotated[annotation, Strict()]
-            type_adapter = TypeAdapter(
-                annotation, config=ConfigDict(arbitrary_types_allowed=True)
-            )
+            type_adapter = type_adapters.get(annotation)
         return cls(type_adapter, annotation, info)
 
     @property
     def type_(self):
         return _get_type(self.annotation)
 
+    @property
+    def is_trusted(self) -> bool:
+        """Check if the return value is trusted, i.e. not validated"""
+        return self.info.trusted
+
 
 class Parameters(tuple[Parameter, ...]):
     @cached_property
@@ -317,6 +393,18 @@ class Parameters(tuple[Parameter, ...]):
                 return param
         return None
 
+    @cached_property
+    def num_positional_arguments(self) -> int:
+        """Get the number of positional arguments, except the variable one"""
+        return len([param for param in self if param.is_positional_param])
+
+    @cached_property
+    def num_fixed_inputs(self) -> int:
+        """Get the number of input parameters, except the variable one"""
+        return len([param for param in self if param.is_input]) - (
+            self.var_input is not None
+        )
+
     @cached_property
     def num_minimum_inputs(self) -> int:
         """Get the number of minimum required input parameters"""
@@ -0,0 +1,454 @@
+import typing as t
+from dataclasses import dataclass
+
+from pydantic import ValidationError
+
+from .operator import (
+    BaseOperator,
+    DelegateOperator,
+    OperatorAbc,
+    OperatorError,
+    SharedOperator,
+    SimpleOperator,
+)
+from .parameter import Parameter
+from .profiler import measure
+from .spill import SpillStore
+
+if t.TYPE_CHECKING:
+    from .executor import ExecutorAbc
+
+_Validate = t.Callable[[t.Any], t.Any]
+
+
+def _identity(value: t.Any) -> t.Any:
+    return value
+
+
+def _get_validator(param: Parameter) -> _Validate | None:
+    """Get the execute-phase validator of a parameter, or None if it is a no-op"""
+    if param.execute_phase_noop:
+        return None
+    return param.execute_phase_validator.validate_python
+
+
+@dataclass(frozen=True)
+class Instruction:
+    """
+    A step of an execution plan, which computes the value of the next slot
+
+    Args:
+        operator: The operator
+        inputs: The slots of the values of the input operators
+    """
+
+    operator: OperatorAbc
+    inputs: tuple[int, ...]
+
+    @property
+    def output_type(self) -> t.Any:
+        """Get the type of the value of the instruction, if known"""
+        return None
+
+    def run(self, input_values: list[t.Any], executor: "ExecutorAbc | None") -> t.Any:
+        return self.operator.evaluate(input_values, executor)
+
+
+@dataclass(frozen=True)
+class CallInstruction(Instruction):
+    """
+    A step of an execution plan, which calls the callback of an operator
+
+    The validators of the arguments and the inputs, and the position of each of
+    them in the positional arguments of the callback, are resolved beforehand.
+
+    Args:
+        arguments: The name and the validator of each positional argument
+        keywords: The key, the name and the validator of each keyword argument
+        input_validators: The validator of each input
+        positions: For each positional argument of the callback, whether it is
+            an input and its index within the inputs (or the arguments)
+        var_arguments: The index of the first variable argument and its
+            parameter, if there are several variable arguments
+        var_inputs: The index of the first variable input and its parameter,
+            if there are several variable inputs
+
+    A validator is None if it is a no-op, and it is not called. The values of a
+    variadic parameter are validated at once, and one by one only if invalid.
+    """
+
+    operator: BaseOperator
+    arguments: tuple[tuple[str, _Validate | None], ...]
+    keywords: tuple[tuple[str, str, _Validate | None], ...]
+    input_validators: tuple[_Validate | None, ...]
+    positions: tuple[tuple[bool, int], ...]
+    var_arguments: tuple[int, Parameter] | None = None
+    var_inputs: tuple[int, Parameter] | None = None
+
+    @property
+    def output_type(self) -> t.Any:
+        return self.operator.operator_fn.output.type_
+
+    def run(self, input_values: list[t.Any], executor: "ExecutorAbc | None") -> t.Any:
+        profiler = None if executor is None else executor.profiler
+        with measure(profiler, self.operator, "execute"):
+            with measure(profiler, self.operator, "validate"):
+                positional_args, kwds_values = self._prepare_call(input_values)
+            return self.operator._call(positional_args, kwds_values, executor)
+
+    def _prepare_call(
+        self, input_values: list[t.Any]
+    ) -> tuple[list[t.Any], dict[str, t.Any]]:
+        """See BaseOperator._prepare_call"""
+        operator = self.operator
+        arg_values = self._validate_arguments()
+        kwds_values: dict[str, t.Any] = {}
+        for (key, name, validate), (_, value) in zip(self.keywords, operator.kwds):
+            if validate is None:
+                kwds_values[key] = value
+                continue
+            try:
+                kwds_values[key] = validate(value)
+            except ValidationError as e:
+                raise OperatorError(
+                    f"Data validation failed for the argument `{name}` of operator `{operator.name}`!",
+                    ctx={"error": e, "index": operator.index, "name": operator.name},
+                )
+        valid_input_values = self._validate_inputs(input_values)
+        positional_args = [
+            valid_input_values[index] if is_input else arg_values[index]
+            for is_input, index in self.positions
+        ]
+        return positional_args, kwds_values
+
+    def _validate_arguments(self) -> list[t.Any]:
+        args = self.operator.args
+        if self.var_arguments is not None:
+            start, param = self.var_arguments
+            values = param.validate_batch(args[start:], "execute")
+            if values is not None:
+                return self._validate_each_argument(args[:start]) + values
+        return self._validate_each_argument(args)
+
+    def _validate_each_argument(self, args: tuple[t.Any, ...]) -> list[t.Any]:
+        operator = self.operator
+        arg_values: list[t.Any] = []
+        for (name, validate), value in zip(self.arguments, args):
+            if validate is None:
+                arg_values.append(value)
+                continue
+            try:
+                arg_values.append(validate(value))
+            except ValidationError as e:
+                raise OperatorError(
+                    f"Data validation failed for the argument `{name}` of operator `{operator.name}`!",
+                    ctx={"error": e, "index": operator.index, "name": operator.name},
+                )
+        return arg_values
+
+    def _validate_inputs(self, input_values: list[t.Any]) -> list[t.Any]:
+        if self.var_inputs is not None:
+            start, param = self.var_inputs
+            values = param.validate_batch(input_values[start:], "execute")
+            if values is not None:
+                return self._validate_each_input(input_values[:start]) + values
+        return self._validate_each_input(input_values)
+
+    def _validate_each_input(self, input_values: list[t.Any]) -> list[t.Any]:
+        operator = self.operator
+        valid_input_values: list[t.Any] = []
+        for validate, value in zip(self.input_validators, input_values):
+            if validate is None:
+                valid_input_values.append(value)
+                continue
+            try:
+                valid_input_values.append(validate(value))
+            except ValidationError as e:
+                raise OperatorError(
+                    f"Data validation failed for the input of operator `{operator.name}`!",
+                    ctx={"error": e, "index": operator.index, "name": operator.name},
+                )
+        return valid_input_values
+
+    @classmethod
+    def from_operator(
+        cls, operator: BaseOperator, inputs: tuple[int, ...]
+    ) -> "CallInstruction":
+        parameters = operator.operator_fn.parameters
+        iter_args = parameters.iter_positional_arguments()
+        arguments: list[tuple[str, _Validate | None]] = []
+        for _ in operator.args:
+            param = next(iter_args)
+            arguments.append((param.name, _get_validator(param)))
+        keywords: list[tuple[str, str, _Validate | None]] = []
+        for key, _ in operator.kwds:
+            param = parameters.get_keyword_argument(key)
+            keywords.append((key, param.name, _get_validator(param)))
+        iter_inputs = parameters.iter_inputs()
+        input_validators = tuple(_get_validator(next(iter_inputs)) for _ in inputs)
+        # see BaseOperator._compose_arg_values
+        positions: list[tuple[bool, int]] = []
+        num_args, num_inputs = 0, 0
+        for param in parameters.iter_positional():
+            if num_args == len(operator.args) and num_inputs == len(inputs):
+                break
+            if param.is_input:
+                positions.append((True, num_inputs))
+                num_inputs += 1
+            else:
+                positions.append((False, num_args))
+                num_args += 1
+        var_arguments = None
+        start = parameters.num_positional_arguments
+        if parameters.var_argument is not None and len(operator.args) - start > 1:
+            var_arguments = (start, parameters.var_argument)
+        var_inputs = None
+        start = parameters.num_fixed_inputs
+        if parameters.var_input is not None and len(inputs) - start > 1:
+            var_inputs = (start, parameters.var_input)
+        return cls(
+            operator=operator,
+            inputs=inputs,
+            arguments=tuple(arguments),
+            keywords=tuple(keywords),
+            input_validators=input_validators,
+            positions=tuple(positions),
+            var_arguments=var_arguments,
+            var_inputs=var_inputs,
+        )
+
+
+@dataclass(frozen=True)
+class PlanInput:
+    """
+    An input value of an execution plan
+
+    Args:
+        operator: The operator of the input value in the operator tree
+        slot: The slot of the value
+        validate: The validator of a replacement value
+    """
+
+    operator: SimpleOperator
+    slot: int
+    validate: _Validate = _identity
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    A flat, topologically ordered list of instructions to execute an operator tree
+
+    The values of the instructions are kept in slots: the constants (e.g. the
+    input values) first, followed by the value of each instruction in order.
+    Shared operators are executed once and their value is used by each of their
+    consumers. A value is released as soon as its last consumer has received it.
+    The plan can be executed many times, with different input values.
+
+    Args:
+        constants: The initial values of the slots
+        inputs: The input values, in the order of the command line
+        instructions: The instructions, each input operator before its consumers
+        releases: For each instruction, the slots whose last consumer it is
+    """
+
+    constants: tuple[t.Any, ...]
+    inputs: tuple[PlanInput, ...]
+    instructions: tuple[Instruction, ...]
+    releases: tuple[tuple[int, ...], ...]
+
+    @property
+    def input_names(self) -> tuple[str, ...]:
+        """Get the names of the input values"""
+        return tuple(input_.operator.name for input_ in self.inputs)
+
+    @classmethod
+    def from_operator(
+        cls, operator: OperatorAbc, low_memory: bool = False
+    ) -> "ExecutionPlan":
+        """
+        Compile an operator tree into an execution plan
+
+        The input operators of an operator are executed from left to right, or
+        if `low_memory` is set, in the order which keeps the fewest intermediate
+        values alive at the same time (the input operators that need the most
+        intermediate values first). The error raised by a failing plan may then
+        differ from the one raised by executing the tree.
+
+        Args:
+            operator (OperatorAbc): The operator tree
+            low_memory (bool): Whether to minimize the number of live values
+
+        Returns:
+            ExecutionPlan: The execution plan
+        """
+        needs = _get_needs(operator) if low_memory else {}
+        constants: list[t.Any] = []
+        inputs: dict[int, PlanInput] = {}
+        # operators are compiled children first: (operator, order of evaluation
+        # of its input operators, or None if they have not been pushed yet)
+        stack: list[tuple[OperatorAbc, tuple[int, ...] | None]] = [(operator, None)]
+        slots: list[int] = []
+        shared_slots: dict[int, int] = {}
+        compiled: list[tuple[OperatorAbc, tuple[int, ...]]] = []
+        while stack:
+            node, order = stack.pop()
+            if isinstance(node, SimpleOperator):
+                slot = len(constants)
+                constants.append(node.input_)
+                inputs[slot] = PlanInput(node, slot)
+                slots.append(slot)
+                continue
+            if isinstance(node, SharedOperator) and id(node) in shared_slots:
+                slots.append(shared_slots[id(node)])
+                continue
+            input_operators = node.get_input_operators()
+            if order is None:
+                order = tuple(range(len(input_operators)))
+                if needs:
+                    order = tuple(
+                        sorted(order, key=lambda i: -needs[id(input_operators[i])])
+                    )
+                stack.append((node, order))
+                stack.extend((input_operators[i], None) for i in reversed(order))
+                continue
+            evaluated_slots = slots[len(slots) - len(input_operators) :]
+            del slots[len(slots) - len(input_operators) :]
+            ordered_slots = [0] * len(input_operators)
+            for i, slot in zip(order, evaluated_slots):
+                ordered_slots[i] = slot
+            input_slots = tuple(ordered_slots)
+            if isinstance(node, SharedOperator):
+                (slot,) = input_slots
+                shared_slots[id(node)] = slot
+                slots.append(slot)
+                continue
+            if isinstance(node, DelegateOperator):
+                input_slots = tuple(
+                    range(len(constants), len(constants) + len(node.inputs))
+                )
+                constants.extend(node.inputs)
+            elif isinstance(node, BaseOperator):
+                # replacement input values are validated like the command line
+                iter_inputs = node.operator_fn.parameters.iter_inputs()
+                for slot in input_slots:
+                    param = next(iter_inputs)
+                    if slot in inputs and not param.build_phase_noop:
+                        validate = param.build_phase_validator.validate_python
+                        inputs[slot] = PlanInput(inputs[slot].operator, slot, validate)
+            compiled.append((node, input_slots))
+            # the slot of the value of the node is only known once all the
+            # constants are known, so it is resolved below
+            slots.append(-len(compiled))
+
+        def resolve(slot: int) -> int:
+            return slot if slot >= 0 else len(constants) - slot - 1
+
+        instructions: list[Instruction] = []
+        last_consumers: dict[int, int] = {}
+        for node, input_slots in compiled:
+            input_slots = tuple(resolve(slot) for slot in input_slots)
+            for slot in input_slots:
+                last_consumers[slot] = len(instructions)
+            if isinstance(node, BaseOperator):
+                instructions.append(CallInstruction.from_operator(node, input_slots))
+            else:
+                instructions.append(Instruction(node, input_slots))
+        releases: list[list[int]] = [[] for _ in instructions]
+        for slot, consumer in last_consumers.items():
+            releases[consumer].append(slot)
+        return cls(
+            constants=tuple(constants),
+            inputs=tuple(sorted(inputs.values(), key=lambda i: i.operator.index)),
+            instructions=tuple(instructions),
+            releases=tuple(tuple(release) for release in releases),
+        )
+
+    def execute(
+        self,
+        inputs: t.Sequence[t.Any] | None = None,
+        executor: "ExecutorAbc | None" = None,
+        spill: SpillStore | None = None,
+    ) -> t.Any:
+        """
+        Execute the plan
+
+        Args:
+            inputs (t.Sequence[t.Any] | None): Replacements of the input values,
+                in the order of `input_names`; the original values are used if None
+            executor (ExecutorAbc | None): The executor whose cache is used; the
+                instructions are always executed one after another
+            spill (SpillStore | None): The store to which the intermediate values
+                are written when their size exceeds its threshold
+
+        Returns:
+            t.Any: The output of the operator tree
+        """
+        values = list(self.constants)
+        if inputs is not None:
+            if len(inputs) != len(self.inputs):
+                raise ValueError(
+                    f"Expected {len(self.inputs)} input values, got {len(inputs)}"
+                )
+            for input_, value in zip(self.inputs, inputs):
+                try:
+                    values[input_.slot] = input_.validate(value)
+                except ValidationError as e:
+                    operator = input_.operator
+                    raise OperatorError(
+                        f"Data validation failed for input {value}!",
+                        ctx={
+                            "error": e,
+                            "index": operator.index,
+                            "name": operator.name,
+                        },
+                    )
+        num_instructions = len(self.instructions)
+        for index, (instruction, release) in enumerate(
+            zip(self.instructions, self.releases)
+        ):
+            input_values = [values[slot] for slot in instruction.inputs]
+            for slot in release:
+                values[slot] = None
+            if spill is not None:
+                input_values = [spill.load(value) for value in input_values]
+                for slot in release:
+                    spill.release(slot)
+            values.append(instruction.run(input_values, executor))
+            del input_values
+            if spill is not None and index + 1 < num_instructions:
+                spill.add(
+                    values,
+                    len(values) - 1,
+                    instruction.output_type,
+                    keep=self.instructions[index + 1].inputs,
+                )
+        return values[-1]
+
+
+def _get_needs(operator: OperatorAbc) -> dict[int, int]:
+    """
+    Get the number of values which are alive at the same time while executing
+    each operator of the tree, if its input operators are executed in the order
+    of their needs (the Sethi-Ullman number of the operator)
+    """
+    needs: dict[int, int] = {}
+    stack: list[tuple[OperatorAbc, bool]] = [(operator, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in needs:
+            continue
+        input_operators = node.get_input_operators()
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((input_, False) for input_ in input_operators)
+            continue
+        if isinstance(node, SimpleOperator):
+            # constants are alive anyway
+            needs[id(node)] = 0
+            continue
+        input_needs = sorted((needs[id(i)] for i in input_operators), reverse=True)
+        # while an input operator is executed, the values of the ones executed
+        # before it are alive
+        needs[id(node)] = max([1, *(need + i for i, need in enumerate(input_needs))])
+    return needs
@@ -0,0 +1,253 @@
+import json
+import os
+import threading
+import time
+import typing as t
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+if t.TYPE_CHECKING:
+    from .operator import OperatorAbc
+
+Phase = t.Literal[
+    "tokenize",
+    "parse",
+    "build",
+    "execute",
+    "validate",
+    "callback",
+    "output",
+    "root",
+    "write",
+]
+
+# the description of each phase reported per operator; the other phases enclose
+# some of them (e.g. `execute` encloses `validate`, `callback` and `output`)
+PHASES: dict[Phase, str] = {
+    "build": "build-phase validation of the arguments and inputs",
+    "validate": "execute-phase validation of the arguments and inputs",
+    "callback": "callback",
+    "output": "output validation",
+    "root": "output callback (or writers) of the root operator",
+}
+
+# a span sent by a worker process: the position of its operator in the subtree
+# executed by the worker, its phase, start, end, process and thread ids
+_Record = tuple[int, Phase, int, int, int, int]
+
+
+@dataclass(frozen=True)
+class Write:
+    """
+    The writing of an output file by its writer
+
+    Args:
+        path: The path of the output file
+        size: The size of the written file in bytes, 0 if it is not a file
+        start: The start time in nanoseconds (`time.perf_counter_ns`)
+        end: The end time in nanoseconds
+    """
+
+    path: str
+    size: int
+    start: int
+    end: int
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+
+@dataclass(frozen=True)
+class Span:
+    """
+    The time spent by an operator in a phase
+
+    Args:
+        operator: The operator, or None for the phases of the whole tree
+        phase: The phase
+        start: The start time in nanoseconds (`time.perf_counter_ns`)
+        end: The end time in nanoseconds
+        pid: The id of the process
+        tid: The (native) id of the thread
+    """
+
+    operator: "OperatorAbc | None"
+    phase: Phase
+    start: int
+    end: int
+    pid: int
+    tid: int
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+
+class Profiler:
+    """Record the time spent by each operator of a tree in each phase"""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.writes: list[Write] = []
+
+    def add(
+        self, operator: "OperatorAbc | None", phase: Phase, start: int, end: int
+    ) -> None:
+        """Record a span"""
+        span = Span(operator, phase, start, end, os.getpid(), threading.get_native_id())
+        self.spans.append(span)
+
+    @contextmanager
+    def measure(self, operator: "OperatorAbc | None", phase: Phase) -> t.Iterator[None]:
+        """Record the span of the block"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(operator, phase, start, time.perf_counter_ns())
+
+    def add_write(
+        self, operator: "OperatorAbc", path: str, size: int, start: int, end: int
+    ) -> None:
+        """Record the writing of an output file, as a `write` span of the operator"""
+        self.writes.append(Write(path, size, start, end))
+        self.add(operator, "write", start, end)
+
+    def get_totals(self) -> dict[int, tuple["OperatorAbc", dict[Phase, int]]]:
+        """
+        Get the total time in nanoseconds spent by each operator in each of `PHASES`
+
+        Returns:
+            dict: The operator and its totals by phase, by the id of the operator
+        """
+        totals: dict[int, tuple[OperatorAbc, dict[Phase, int]]] = {}
+        for span in self.spans:
+            if span.operator is None or span.phase not in PHASES:
+                continue
+            _, phases = totals.setdefault(id(span.operator), (span.operator, {}))
+            phases[span.phase] = phases.get(span.phase, 0) + span.duration
+        return totals
+
+    def remap(self, old: "OperatorAbc", new: "OperatorAbc") -> None:
+        """
+        Move the spans of the operators of a tree to the corresponding operators
+        of an equivalent tree, e.g. after sharing its common operators
+        """
+        from .operator import SharedOperator
+
+        mapping: dict[int, OperatorAbc] = {}
+        stack = [(old, new)]
+        while stack:
+            old_node, new_node = stack.pop()
+            while isinstance(new_node, SharedOperator):
+                new_node = new_node.input
+            mapping[id(old_node)] = new_node
+            stack.extend(
+                zip(old_node.get_input_operators(), new_node.get_input_operators())
+            )
+        self.spans = [
+            replace(span, operator=mapping.get(id(span.operator), span.operator))
+            for span in self.spans
+        ]
+
+    def export(self, operator: "OperatorAbc") -> list[_Record]:
+        """
+        Get the spans of the operators of a tree as plain records, to be sent
+        from a worker process and added to the profiler of the parent by `merge`
+        """
+        positions = {id(node): i for i, node in enumerate(_iter_nodes(operator))}
+        return [
+            (
+                positions[id(span.operator)],
+                span.phase,
+                span.start,
+                span.end,
+                span.pid,
+                span.tid,
+            )
+            for span in self.spans
+            if id(span.operator) in positions
+        ]
+
+    def merge(self, operator: "OperatorAbc", records: list[_Record]) -> None:
+        """Add the records exported by `export` for an equivalent tree"""
+        nodes = list(_iter_nodes(operator))
+        self.spans.extend(
+            Span(nodes[position], phase, start, end, pid, tid)
+            for position, phase, start, end, pid, tid in records
+        )
+
+    def write_trace(self, path: str | Path) -> None:
+        """
+        Write the spans as trace events in the Chrome Trace Event format, which
+        can be opened with Perfetto (https://ui.perfetto.dev) or chrome://tracing
+        """
+        origin = min((span.start for span in self.spans), default=0)
+        events: list[dict[str, t.Any]] = []
+        pids: set[int] = set()
+        paths = {(write.start, write.end): write.path for write in self.writes}
+        for span in self.spans:
+            pids.add(span.pid)
+            event: dict[str, t.Any] = {
+                "name": span.phase,
+                "cat": span.phase,
+                "ph": "X",
+                "ts": (span.start - origin) / 1e3,
+                "dur": span.duration / 1e3,
+                "pid": span.pid,
+                "tid": span.tid,
+            }
+            if span.operator is not None:
+                name = _get_name(span.operator)
+                if span.phase == "execute":
+                    event["name"] = name
+                event["args"] = {"operator": name}
+                index = getattr(span.operator, "index", None)
+                if index is not None:
+                    event["args"]["index"] = index
+                if span.phase == "write":
+                    event["args"]["path"] = paths.get((span.start, span.end))
+            events.append(event)
+        main_pid = os.getpid()
+        for pid in sorted(pids):
+            events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "args": {"name": "clios" if pid == main_pid else "clios worker"},
+                }
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def measure(
+    profiler: Profiler | None, operator: "OperatorAbc | None", phase: Phase
+) -> t.ContextManager[None]:
+    """Record the span of the block, if there is a profiler"""
+    if profiler is None:
+        return nullcontext()
+    return profiler.measure(operator, phase)
+
+
+def _iter_nodes(operator: "OperatorAbc") -> t.Iterator["OperatorAbc"]:
+    """Iterate over the operators of a tree in pre-order, each operator once"""
+    seen: set[int] = set()
+    stack = [operator]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        yield node
+        stack.extend(reversed(node.get_input_operators()))
+
+
+def _get_name(operator: "OperatorAbc") -> str:
+    name = getattr(operator, "name", None)
+    if isinstance(name, str):
+        return name
+    return type(operator).__name__
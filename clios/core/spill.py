@@ -0,0 +1,224 @@
+import os
+import pickle
+import sys
+import tempfile
+import typing as t
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class SerializerAbc(ABC):
+    """An abstract class to represent a way of writing values to files"""
+
+    suffix: str = ""
+
+    def accepts(self, value: t.Any) -> bool:
+        """Check if the value can be written by the serializer"""
+        return True
+
+    @abstractmethod
+    def dump(self, value: t.Any, path: Path) -> None:
+        """Write the value to the file"""
+
+    @abstractmethod
+    def load(self, path: Path) -> t.Any:
+        """Read the value from the file"""
+
+
+class PickleSerializer(SerializerAbc):
+    """Write values with pickle protocol 5"""
+
+    suffix = ".pkl"
+
+    def dump(self, value: t.Any, path: Path) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(value, f, protocol=5)
+
+    def load(self, path: Path) -> t.Any:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+class NumpySerializer(SerializerAbc):
+    """
+    Write numpy arrays in the npy format, and read them back as copy-on-write
+    memory maps, so that only the parts which are used are read
+    """
+
+    suffix = ".npy"
+
+    def accepts(self, value: t.Any) -> bool:
+        # arrays of Python objects cannot be memory mapped
+        return not value.dtype.hasobject
+
+    def dump(self, value: t.Any, path: Path) -> None:
+        import numpy as np
+
+        np.save(path, value, allow_pickle=False)
+
+    def load(self, path: Path) -> t.Any:
+        import numpy as np
+
+        return np.load(path, mmap_mode="c", allow_pickle=False)
+
+
+class Spilled:
+    """A value which has been written to a file"""
+
+    def __init__(self, path: Path, serializer: SerializerAbc) -> None:
+        self.path = path
+        self.serializer = serializer
+
+    def load(self) -> t.Any:
+        return self.serializer.load(self.path)
+
+
+def get_size(value: t.Any) -> int:
+    """Estimate the size of a value in bytes"""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+class SpillStore:
+    """
+    Write intermediate values to a temporary directory while their total size
+    exceeds a threshold, and read them back when they are used
+
+    The serializer of a value is chosen by the output type of its operator (or
+    by the type of the value, if the output type is not a class): the first of
+    its base classes which has a registered serializer, or pickle otherwise.
+    numpy arrays are written in the npy format by default.
+
+    Args:
+        threshold: The total size in bytes of the values kept in memory
+        directory: The parent directory of the temporary directory
+    """
+
+    def __init__(self, threshold: int, directory: str | Path | None = None) -> None:
+        self.threshold = threshold
+        self.directory = directory
+        self.num_spilled = 0
+        self.spilled_size = 0
+        self._serializers: dict[type | str, SerializerAbc] = {
+            "numpy.ndarray": NumpySerializer(),
+        }
+        self._default_serializer: SerializerAbc = PickleSerializer()
+        self._tmpdir: tempfile.TemporaryDirectory[str] | None = None
+        # the size and the output type of the values in memory, by slot
+        self._sizes: dict[int, int] = {}
+        self._types: dict[int, t.Any] = {}
+        self._size = 0
+        self._spilled: dict[int, Path] = {}
+        self._unspillable: set[int] = set()
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.cleanup()
+
+    def register(self, type_: type | str, serializer: SerializerAbc) -> None:
+        """
+        Register the serializer of a type
+
+        Args:
+            type_: The type, or its qualified name (e.g. `numpy.ndarray`) so that
+                its module need not be imported
+            serializer: The serializer
+        """
+        self._serializers[type_] = serializer
+
+    def get_serializer(self, type_: t.Any, value: t.Any) -> SerializerAbc:
+        """Get the serializer of a value with the given output type"""
+        cls = t.get_origin(type_) or type_
+        if cls is t.Any or not isinstance(cls, type):
+            cls = type(value)
+        for base in cls.__mro__:
+            for key in (base, f"{base.__module__}.{base.__qualname__}"):
+                serializer = self._serializers.get(key)
+                if serializer is not None and serializer.accepts(value):
+                    return serializer
+        return self._default_serializer
+
+    def add(
+        self,
+        values: list[t.Any],
+        slot: int,
+        type_: t.Any,
+        keep: tuple[int, ...] = (),
+    ) -> None:
+        """
+        Add the value of a slot, and spill the largest values in memory (except
+        those in `keep`) while their total size exceeds the threshold
+        """
+        size = get_size(values[slot])
+        self._sizes[slot] = size
+        self._types[slot] = type_
+        self._size += size
+        if self._size <= self.threshold:
+            return
+        candidates = sorted(
+            (
+                slot
+                for slot in self._sizes
+                if slot not in keep and slot not in self._unspillable
+            ),
+            key=lambda slot: self._sizes[slot],
+            reverse=True,
+        )
+        for candidate in candidates:
+            if self._size <= self.threshold:
+                break
+            spilled = self._spill(values[candidate], self._types[candidate], candidate)
+            if spilled is not None:
+                values[candidate] = spilled
+                self._forget(candidate)
+
+    def release(self, slot: int) -> None:
+        """Forget the value of a slot which is no longer used"""
+        self._forget(slot)
+        self._unspillable.discard(slot)
+        path = self._spilled.pop(slot, None)
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:  # pragma: no cover
+                # e.g. still memory mapped on Windows; removed by `cleanup`
+                pass
+
+    def load(self, value: t.Any) -> t.Any:
+        """Read the value back if it has been spilled"""
+        if isinstance(value, Spilled):
+            return value.load()
+        return value
+
+    def cleanup(self) -> None:
+        """Remove the spilled values"""
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def _forget(self, slot: int) -> None:
+        self._size -= self._sizes.pop(slot, 0)
+        self._types.pop(slot, None)
+
+    def _spill(self, value: t.Any, type_: t.Any, slot: int) -> Spilled | None:
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.TemporaryDirectory(
+                prefix="clios-spill-", dir=self.directory, ignore_cleanup_errors=True
+            )
+        serializer = self.get_serializer(type_, value)
+        path = Path(self._tmpdir.name) / f"{slot}{serializer.suffix}"
+        try:
+            serializer.dump(value, path)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # values which cannot be written are kept in memory
+            path.unlink(missing_ok=True)
+            self._unspillable.add(slot)
+            return None
+        self._spilled[slot] = path
+        self.num_spilled += 1
+        self.spilled_size += os.path.getsize(path)
+        return Spilled(path, serializer)
@@ -0,0 +1,146 @@
+import ctypes
+import sys
+import typing as t
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+
+
+class TransportAbc(ABC):
+    """
+    An abstract class to represent the way the outputs of operators executed by
+    a worker process are sent back to the parent process
+    """
+
+    def prepare(self) -> None:
+        """Prepare the parent process, before the worker processes are started"""
+
+    @abstractmethod
+    def send(self, value: t.Any) -> t.Any:
+        """Get the object to be pickled in place of an output (in the worker)"""
+
+    @abstractmethod
+    def receive(self, value: t.Any) -> t.Any:
+        """Get the output from the unpickled object (in the parent)"""
+
+    @abstractmethod
+    def discard(self, value: t.Any) -> None:
+        """Release the resources of an unpickled object which will not be received"""
+
+
+class PickleTransport(TransportAbc):
+    """Send the outputs pickled"""
+
+    def send(self, value: t.Any) -> t.Any:
+        return value
+
+    def receive(self, value: t.Any) -> t.Any:
+        return value
+
+    def discard(self, value: t.Any) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """A handle of a numpy array in a shared memory segment"""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: t.Any
+
+
+class SharedMemoryTransport(TransportAbc):
+    """
+    Send numpy arrays through shared memory segments, and other outputs pickled
+
+    The worker copies an array to a new segment and only a small handle is
+    pickled. The parent maps the segment into an array without a copy, and
+    removes its name right away: the memory is freed once the array (and every
+    view of it) is no longer used by any consumer.
+
+    Args:
+        min_size: The size in bytes from which arrays are sent through shared memory
+    """
+
+    def __init__(self, min_size: int = 2**20) -> None:
+        self.min_size = min_size
+
+    def prepare(self) -> None:
+        # The workers must report their segments to the resource tracker of the
+        # parent, so that a segment is not removed when its worker exits
+        resource_tracker.ensure_running()
+
+    def send(self, value: t.Any) -> t.Any:
+        if not _is_array(value) or value.dtype.hasobject:
+            return value
+        if value.nbytes < max(self.min_size, 1):
+            return value
+        import numpy as np
+
+        segment = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        try:
+            array = np.ndarray(value.shape, dtype=value.dtype, buffer=segment.buf)
+            array[...] = value
+            del array
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+        segment.close()
+        return SharedArray(segment.name, value.shape, value.dtype)
+
+    def receive(self, value: t.Any) -> t.Any:
+        if not isinstance(value, SharedArray):
+            return value
+        import numpy as np
+
+        segment = shared_memory.SharedMemory(name=value.name)
+        segment.unlink()
+        return np.asarray(_MappedSegment(segment, value.shape, np.dtype(value.dtype)))
+
+    def discard(self, value: t.Any) -> None:
+        if not isinstance(value, SharedArray):
+            return
+        try:
+            segment = shared_memory.SharedMemory(name=value.name)
+        except FileNotFoundError:  # pragma: no cover
+            return
+        segment.close()
+        segment.unlink()
+
+
+class _MappedSegment:
+    """
+    Keep a shared memory segment mapped for as long as an array uses it
+
+    The array is the only owner of this object, through `__array_interface__`,
+    so the segment is unmapped once the array and its views are released.
+    """
+
+    def __init__(
+        self, segment: shared_memory.SharedMemory, shape: tuple[int, ...], dtype: t.Any
+    ) -> None:
+        self._segment = segment
+        # the address is taken without keeping the buffer exported
+        buffer = segment.buf
+        assert buffer is not None
+        view = ctypes.c_char.from_buffer(buffer)
+        address = ctypes.addressof(view)
+        del view, buffer
+        self.__array_interface__ = {
+            "shape": shape,
+            "typestr": dtype.str,
+            "descr": dtype.descr,
+            "data": (address, False),
+            "version": 3,
+        }
+
+    def __del__(self) -> None:
+        self._segment.close()
+
+
+def _is_array(value: t.Any) -> bool:
+    # numpy is not imported unless some operator already did
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
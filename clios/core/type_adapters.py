@@ -0,0 +1,113 @@
+import threading
+import typing as t
+from dataclasses import dataclass
+
+from pydantic import ConfigDict, PydanticUserError, TypeAdapter
+from typing_extensions import Doc
+
+from .param_info import Input, Output, Param
+
+# the metadata which is only read by clios, not by pydantic
+_CLIOS_METADATA = (Param, Input, Output, Doc)
+
+
+@dataclass(frozen=True)
+class TypeAdapterStats:
+    """
+    The statistics of the interned type adapters
+
+    Args:
+        hits: The number of type adapters shared with a previous annotation
+        misses: The number of type adapters built
+        uncached: The number of type adapters built for an unhashable annotation
+    """
+
+    hits: int
+    misses: int
+    uncached: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of the type adapters shared with a previous annotation"""
+        total = self.hits + self.misses + self.uncached
+        return self.hits / total if total else 0.0
+
+
+class TypeAdapters:
+    """
+    Intern the type adapters by annotation, so that the parameters (and return
+    values) with identical annotations share one compiled core schema
+
+    The annotations are compared along with their representation, as some equal
+    annotations are validated differently: e.g. `int | float` and `float | int`
+    are equal, but "2" is validated as 2 by the first one and 2.0 by the other.
+    The type adapters are never mutated once built, sharing them across the
+    operators is safe.
+    """
+
+    def __init__(self) -> None:
+        self._adapters: dict[tuple[t.Any, str], TypeAdapter[t.Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._uncached = 0
+
+    def get(self, annotation: t.Any) -> TypeAdapter[t.Any]:
+        """Get the type adapter of an annotation, built on first use"""
+        annotation = strip_metadata(annotation)
+        key = (annotation, repr(annotation))
+        try:
+            with self._lock:
+                type_adapter = self._adapters.get(key)
+                if type_adapter is not None:
+                    self._hits += 1
+                    return type_adapter
+        except TypeError:
+            # unhashable, e.g. some metadata of the annotation
+            with self._lock:
+                self._uncached += 1
+            return _build(annotation)
+        # built outside of the lock: another thread may build the same one
+        type_adapter = _build(annotation)
+        with self._lock:
+            return self._adapters.setdefault(key, type_adapter)
+
+    def stats(self) -> TypeAdapterStats:
+        """Get the statistics of the interned type adapters"""
+        with self._lock:
+            return TypeAdapterStats(self._hits, len(self._adapters), self._uncached)
+
+    def clear(self) -> None:
+        """Forget the type adapters and reset the statistics"""
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._uncached = 0
+
+
+def strip_metadata(annotation: t.Any) -> t.Any:
+    """
+    Remove the metadata of an annotation which is not read by pydantic (the
+    parameter info and the documentation), so that it does not prevent sharing
+    """
+    if t.get_origin(annotation) is not t.Annotated:
+        return annotation
+    type_, *metadata = t.get_args(annotation)
+    kept = [arg for arg in metadata if not isinstance(arg, _CLIOS_METADATA)]
+    if len(kept) == len(metadata):
+        return annotation
+    if not kept:
+        return type_
+    return t.Annotated[type_, *kept]  # type: ignore
+
+
+def _build(annotation: t.Any) -> TypeAdapter[t.Any]:
+    try:
+        return TypeAdapter(annotation, config=ConfigDict(arbitrary_types_allowed=True))
+    except PydanticUserError as e:
+        if e.code == "type-adapter-config-unused":
+            return TypeAdapter(annotation)
+        raise
+
+
+# the type adapters shared by all the operator functions
+type_adapters = TypeAdapters()
@@ -1,10 +1,16 @@
 import inspect
+import sys
 import typing as t
 
 from pydantic._internal._typing_extra import eval_type_lenient as evaluate_forwardref
 
 from .param_info import Input, Output, Param, ParamTypes
 
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
+
 
 def get_output_info(return_annotation: t.Any) -> Output:
     if t.get_origin(return_annotation) is not t.Annotated:
@@ -55,3 +61,15 @@ def get_typed_annotation(annotation: t.Any, globalns: dict[str, t.Any]) -> t.Any
         annotation = t.ForwardRef(annotation)
         annotation = evaluate_forwardref(annotation, globalns, globalns)
     return annotation
+
+
+def get_peak_memory() -> int | None:
+    """
+    Get the peak resident set size in bytes of the current process, or None if
+    it is not known on this platform
+    """
+    if resource is None:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,56 @@
+import os
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+if t.TYPE_CHECKING:
+    from .operator import OperatorAbc
+    from .profiler import Profiler
+
+Writer = t.Callable[[t.Any, str], t.Any]
+
+
+def write_outputs(
+    value: t.Any,
+    writers: t.Sequence[Writer],
+    paths: t.Sequence[str],
+    profiler: "Profiler | None" = None,
+    operator: "OperatorAbc | None" = None,
+) -> None:
+    """
+    Write the value to each output path with its writer, concurrently
+
+    Each writer is called as `writer(value, path)` in a thread of its own, since
+    writing (and compressing) files mostly releases the GIL. All the writers
+    are waited for, then the error of the first output which failed, if any,
+    is raised.
+
+    Args:
+        value: The value to write
+        writers: The writer of each output
+        paths: The path of each output
+        profiler: The profiler recording the size and the duration of each write
+        operator: The operator whose writes are recorded
+    """
+    if len(writers) != len(paths):
+        raise ValueError(
+            f"Expected {len(writers)} output path(s), got {len(paths)} path(s)!"
+        )
+
+    def write(writer: Writer, path: str) -> None:
+        start = time.perf_counter_ns()
+        writer(value, path)
+        end = time.perf_counter_ns()
+        if profiler is not None and operator is not None:
+            size = os.path.getsize(path) if os.path.isfile(path) else 0
+            profiler.add_write(operator, path, size, start, end)
+
+    if len(writers) == 1:
+        write(writers[0], paths[0])
+        return
+    with ThreadPoolExecutor(
+        max_workers=len(writers), thread_name_prefix="clios-writer"
+    ) as executor:
+        futures = [executor.submit(write, *item) for item in zip(writers, paths)]
+    for future in futures:
+        future.result()
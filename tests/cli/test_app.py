@@ -1,9 +1,14 @@
 # type: ignore
+import json
 import sys
+import typing as t
 
 import pytest
 
 from clios.cli.app import Clios, OperatorFns
+from clios.core.param_info import Output, Param
+from clios.core.spill import PickleSerializer
+from tests.conftest import count
 
 
 @pytest.fixture
@@ -57,3 +62,329 @@ def test_click_app_run(app):
     sys.argv = ["cli", "test_op"]
     result = Clios(app)()
     assert result is None
+
+
+def test_click_app_threads_and_processes(app):
+    sys.argv = ["cli", "--threads", "2", "--processes", "2", "test_op"]
+    with pytest.raises(SystemExit):
+        Clios(app)()
+
+
+def add(i: int, j: int) -> t.Annotated[int, Output(callback=print, num_outputs=0)]:
+    return i + j
+
+
+def test_click_app_processes_named_value(app, capsys, calls):
+    app.register(name="count", implicit="input")(count)
+    app.register(name="add", implicit="input")(add)
+    sys.argv = ["cli", "--processes", "2", "-add", "x", ":", "-count", "1"]
+    sys.argv += ["-add", ":", "x", "-add", ":", "x", "2"]
+    assert Clios(app)() is None
+    assert capsys.readouterr().out.strip() == "5"
+    # the named value is computed once, not once per worker
+    assert calls.read_text() == "1\n"
+
+
+def test_click_app_run_asyncio(app):
+    @app.register(name="test_op")
+    async def test_op():
+        return None
+
+    sys.argv = ["cli", "--asyncio", "test_op"]
+    result = Clios(app)()
+    assert result is None
+
+
+@pytest.mark.parametrize("size", ["1G", "512MiB", "100"])
+def test_click_app_run_max_memory(app, capsys, size):
+    @app.register(name="test_op")
+    def test_op():
+        return None
+
+    sys.argv = ["cli", "--max-memory", size, "test_op"]
+    result = Clios(app)()
+    assert result is None
+    assert "Peak memory usage" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "option", [["--threads", "2"], ["--processes", "2"], ["--asyncio"]]
+)
+def test_click_app_max_memory_not_serial(app, capsys, option):
+    @app.register(name="test_op")
+    def test_op():
+        return None
+
+    sys.argv = ["cli", "--max-memory", "1G", *option, "test_op"]
+    with pytest.raises(SystemExit):
+        Clios(app)()
+    assert "mutually exclusive" in capsys.readouterr().out
+
+
+def test_click_app_strict_memory(app, capsys):
+    @app.register(name="test_op")
+    def test_op():
+        return None
+
+    sys.argv = ["cli", "--max-memory", "1G", "--strict-memory", "test_op"]
+    assert Clios(app)() is None
+    # the peak memory usage of the interpreter exceeds 100 bytes
+    sys.argv = ["cli", "--max-memory", "100", "--strict-memory", "test_op"]
+    with pytest.raises(SystemExit) as e:
+        Clios(app)()
+    assert e.value.code == 1
+    assert "exceeds the budget" in capsys.readouterr().err
+
+    sys.argv = ["cli", "--strict-memory", "test_op"]
+    with pytest.raises(SystemExit):
+        Clios(app)()
+
+
+class Recorder(PickleSerializer):
+    def __init__(self):
+        self.dumped = []
+
+    def dump(self, value, path):
+        self.dumped.append(value)
+        super().dump(value, path)
+
+
+def test_click_app_spill_serializers(app, capsys):
+    @app.register(name="make", implicit="input")
+    def make(i: int) -> list[int]:
+        return [i] * 1000
+
+    @app.register(name="total", implicit="input")
+    def total(*i: t.Any) -> t.Annotated[int, Output(callback=print, num_outputs=0)]:
+        return sum(sum(value) for value in i)
+
+    recorder = Recorder()
+    sys.argv = ["cli", "--max-memory", "1", "-total", "[", "-make", "1", "-make", "2"]
+    sys.argv += ["-make", "3", "]"]
+    assert Clios(app, spill_serializers={list: recorder})() is None
+    assert capsys.readouterr().out.strip() == "6000"
+    assert recorder.dumped == [[1] * 1000, [2] * 1000]
+
+
+def test_click_app_invalid_max_memory(app):
+    sys.argv = ["cli", "--max-memory", "lots", "test_op"]
+    with pytest.raises(SystemExit):
+        Clios(app)()
+
+
+@pytest.mark.parametrize("option", [[], ["--threads", "2"], ["--asyncio"]])
+def test_click_app_run_profile(app, capsys, option):
+    @app.register(name="test_op")
+    def test_op():
+        return None
+
+    sys.argv = ["cli", "--profile", *option, "test_op"]
+    result = Clios(app)()
+    assert result is None
+    err = capsys.readouterr().err
+    assert "Profile" in err
+    assert "test_op" in err
+    assert "Type adapters:" in err
+
+
+def write_text(value, path):
+    with open(path, "w") as f:
+        f.write(value)
+
+
+def write_upper(value, path):
+    write_text(value.upper(), path)
+
+
+def test_click_app_run_writers(app, capsys, tmp_path):
+    @app.register(name="test_op")
+    def test_op() -> t.Annotated[
+        str, Output(writers=(write_text, write_upper), num_outputs=2)
+    ]:
+        return "text"
+
+    paths = [tmp_path / "lower.txt", tmp_path / "upper.txt"]
+    sys.argv = ["cli", "--profile", "test_op", *map(str, paths)]
+    result = Clios(app)()
+    assert result is None
+    assert [path.read_text() for path in paths] == ["text", "TEXT"]
+    err = capsys.readouterr().err
+    assert "Writes" in err
+    assert "/s" in err
+
+
+def test_click_app_run_trace(app, tmp_path):
+    @app.register(name="test_op")
+    def test_op():
+        return None
+
+    path = tmp_path / "trace.json"
+    sys.argv = ["cli", "--trace", str(path), "test_op"]
+    result = Clios(app)()
+    assert result is None
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {"parse", "tokenize", "test_op", "root"} <= {e["name"] for e in events}
+
+
+def get_batch_app(app, tmp_path):
+    @app.register(name="write", implicit="input")
+    def write(
+        value: str, *, suffix: t.Annotated[str, Param()] = ""
+    ) -> t.Annotated[str, Output(writers=(write_text,))]:
+        return value + suffix
+
+    return tmp_path / "batch.txt"
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_click_app_batch(app, capsys, tmp_path, jobs):
+    path = get_batch_app(app, tmp_path)
+    outputs = [tmp_path / f"output{i}.txt" for i in range(3)]
+    lines = [
+        "# a comment",
+        f"-write 'a b' {outputs[0]}",
+        "",
+        json.dumps(["-write,suffix=!", "c", str(outputs[1])]),
+        f"-write d {outputs[2]}",
+    ]
+    path.write_text("\n".join(lines))
+    sys.argv = ["cli", "--batch", str(path), "--jobs", jobs]
+    assert Clios(app)() is None
+    assert [output.read_text() for output in outputs] == ["a b", "c!", "d"]
+    assert "Ran 3 line(s)" in capsys.readouterr().err
+
+
+def test_click_app_batch_errors(app, capsys, tmp_path):
+    path = get_batch_app(app, tmp_path)
+    output = tmp_path / "output.txt"
+    lines = [
+        "-not_found a b",
+        f"-write a {output}",
+        '["-write", 1]',
+        "-write 'a",
+        "-write,suffix=x",
+    ]
+    path.write_text("\n".join(lines))
+    sys.argv = ["cli", "--batch", str(path), "--jobs", "2"]
+    with pytest.raises(SystemExit) as e:
+        Clios(app)()
+    assert e.value.code == 1
+    assert output.read_text() == "a"
+    captured = capsys.readouterr()
+    assert "Operator `not_found` not found!" in captured.out
+    assert "Line 3: Expected a JSON list of strings!" in captured.out
+    assert "Line 4: No closing quotation" in captured.out
+    assert "4 failed (line(s) 1, 3, 4, 5)" in captured.err
+
+
+def test_click_app_batch_processes(app, capsys, tmp_path, monkeypatch, calls):
+    import clios.cli.presenter
+    import clios.core.executor
+
+    pools = []
+
+    class Pool(clios.core.executor.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(clios.cli.presenter, "ProcessPoolExecutor", Pool)
+    monkeypatch.setattr(clios.core.executor, "ProcessPoolExecutor", Pool)
+    app.register(name="count", implicit="input")(count)
+    app.register(name="add", implicit="input")(add)
+    path = tmp_path / "batch.txt"
+    path.write_text("\n".join(f"-add -count {i} -count 1" for i in range(4)))
+    sys.argv = ["cli", "--batch", str(path), "--jobs", "2", "--processes", "2"]
+    assert Clios(app)() is None
+    assert sorted(capsys.readouterr().out.split()) == ["1", "2", "3", "4"]
+    # the lines share a single pool of worker processes
+    assert len(pools) == 1
+
+
+@pytest.mark.parametrize(
+    "option", [["test_op"], ["--trace", "trace.json"]], ids=["args", "trace"]
+)
+def test_click_app_batch_invalid(app, tmp_path, option):
+    path = get_batch_app(app, tmp_path)
+    path.write_text("")
+    sys.argv = ["cli", "--batch", str(path), *option]
+    with pytest.raises(SystemExit):
+        Clios(app)()
+
+
+def get_map_app(app, tmp_path):
+    @app.register(name="upper", implicit="input")
+    def upper(path: str) -> t.Annotated[str, Output(writers=(write_text,))]:
+        with open(path) as f:
+            text = f.read()
+        if not text:
+            raise ValueError("Empty file!")
+        return text.upper()
+
+    data = tmp_path / "data"
+    data.mkdir()
+    for name in ("a", "b", "c"):
+        (data / f"{name}.txt").write_text(name)
+    return data
+
+
+@pytest.mark.parametrize("threads", ["0", "2"])
+def test_click_app_map(app, capsys, tmp_path, threads):
+    data = get_map_app(app, tmp_path)
+    output = str(tmp_path / "{/.}.up")
+    sys.argv = ["cli", "--map", str(data / "*.txt"), "--threads", threads]
+    sys.argv += ["upper", "{}", output]
+    assert Clios(app)() is None
+    outputs = [tmp_path / f"{name}.up" for name in ("a", "b", "c")]
+    assert [path.read_text() for path in outputs] == ["A", "B", "C"]
+    assert "Mapped over 3 file(s)" in capsys.readouterr().err
+
+
+def test_click_app_map_common_operators(app, tmp_path):
+    data = get_map_app(app, tmp_path)
+
+    @app.register(name="read", implicit="input")
+    def read(path: str) -> str:
+        with open(path) as f:
+            return f.read()
+
+    @app.register(name="concat", implicit="input")
+    def concat(a: str, b: str) -> t.Annotated[str, Output(writers=(write_text,))]:
+        return a + b
+
+    # both inputs are equal for the first file only
+    sys.argv = ["cli", "--map", str(data / "*.txt"), "-concat", "-read", "{}"]
+    sys.argv += ["-read", str(data / "a.txt"), str(tmp_path / "{/.}.cat")]
+    assert Clios(app)() is None
+    outputs = [tmp_path / f"{name}.cat" for name in ("a", "b", "c")]
+    assert [path.read_text() for path in outputs] == ["aa", "ba", "ca"]
+
+
+def test_click_app_map_errors(app, capsys, tmp_path):
+    data = get_map_app(app, tmp_path)
+    (data / "b.txt").write_text("")
+    sys.argv = ["cli", "--map", str(data / "*.txt"), "upper", "{}", "{.}.up"]
+    with pytest.raises(SystemExit) as e:
+        Clios(app)()
+    assert e.value.code == 1
+    assert (data / "a.up").read_text() == "A"
+    assert not (data / "b.up").exists()
+    err = capsys.readouterr().err
+    assert "Empty file!" in err
+    assert "Mapped over 3 file(s): 1 failed" in err
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--map", "not_found/*.txt", "upper", "{}", "{}.up"],
+        ["--map", "*.txt", "upper", "a.txt", "a.up"],
+        ["--map", "*.txt", "--profile", "upper", "{}", "{}.up"],
+    ],
+    ids=["no_file", "no_placeholder", "profile"],
+)
+def test_click_app_map_invalid(app, tmp_path, monkeypatch, args):
+    monkeypatch.chdir(get_map_app(app, tmp_path))
+    sys.argv = ["cli", *args]
+    with pytest.raises(SystemExit):
+        Clios(app)()
@@ -0,0 +1,86 @@
+# type: ignore
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from clios.cli.client import run
+
+ROOT = Path(__file__).parents[2]
+
+INLINE_OPERATOR = """
+import os
+
+from clios.cli.app import operator
+
+
+@operator(implicit="input")
+def pid(i: str) -> None:
+    print(i, os.getppid(), os.environ.get("CLIOS_TEST"))
+"""
+
+
+@pytest.fixture(scope="module")
+def daemon(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("daemon") / "clios.sock")
+    code = (
+        "from clios import Clios; from examples.calc.calc import operators; "
+        f"Clios(operators)(['--serve', {path!r}])"
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-c", code], cwd=ROOT, stderr=subprocess.PIPE
+    )
+    for _ in range(500):
+        if os.path.exists(path):
+            break
+        time.sleep(0.01)
+    yield path, process.pid
+    process.terminate()
+    process.wait()
+
+
+def test_daemon_run(daemon, capfd):
+    path, _ = daemon
+    assert run(path, ["-print", "-add", "1", "2"]) == 0
+    assert run(path, ["-print", "-mul", "2", "3"]) == 0
+    assert capfd.readouterr().out.split() == ["3.0", "6.0"]
+
+
+def test_daemon_error(daemon, capfd):
+    path, _ = daemon
+    assert run(path, ["-not_found"]) == 1
+    assert "Operator `not_found` not found!" in capfd.readouterr().out
+
+
+def test_daemon_cwd(daemon, tmp_path):
+    path, _ = daemon
+    assert run(path, ["-range,0,3", "output.json"], cwd=str(tmp_path)) == 0
+    assert (tmp_path / "output.json").read_text() == "[0.0, 1.0, 2.0]"
+
+
+def test_daemon_inline_operator(daemon, tmp_path, capfd):
+    path, pid = daemon
+    (tmp_path / "pid_op.py").write_text(INLINE_OPERATOR)
+    env = {**os.environ, "CLIOS_TEST": "1"}
+    assert run(path, ["-pid_op.py", "a"], cwd=str(tmp_path), env=env) == 0
+    assert run(path, ["-pid_op.py", "b"], cwd=str(tmp_path)) == 0
+    # the requests are run by processes forked from the daemon, in the
+    # environment of the client
+    out = capfd.readouterr().out.split()
+    assert out == ["a", str(pid), "1", "b", str(pid), "None"]
+
+
+def test_daemon_already_serving(daemon):
+    path, _ = daemon
+    process = subprocess.run(
+        [sys.executable, "-m", "examples.calc.calc", "--serve", path],
+        check=False,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert process.returncode == 1
+    assert "already listening" in process.stderr
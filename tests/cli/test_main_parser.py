@@ -1,4 +1,5 @@
 # type: ignore
+import sys
 import typing as t
 
 import pytest
@@ -7,8 +8,9 @@ from pydantic import ValidationError
 from clios.cli.main_parser import CliParser, ParserError
 from clios.cli.param_parser import ParamParserError, StandardParamParser
 from clios.cli.tokenizer import CliTokenizer
-from clios.core.operator import RootOperator
+from clios.core.operator import RootOperator, SharedOperator
 from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.optimizer import share_common_operators
 from clios.core.param_info import Input, Output, Param
 
 intOut = t.Annotated[int, Output(callback=print)]
@@ -176,7 +178,7 @@ invalids = [
     ],
     [
         ["-op_1i", ":"],
-        ParserError("This syntax is not supported yet!", ctx={"token_index": 1}),
+        ParserError("Missing name after `:`!", ctx={"token_index": 1}),
     ],
     [
         ["-op_not_found"],
@@ -261,6 +263,22 @@ invalids = [
         [],
         ParserError("Input is empty!"),
     ],
+    [
+        ["-op_2i", "-op_1o", ":", "x"],
+        ParserError("Name `x` is not bound!", ctx={"token_index": 3}),
+    ],
+    [
+        ["-op_2i", "x", ":", "-op_1o", "x", ":", "-op_1o"],
+        ParserError("Name `x` is already bound!", ctx={"token_index": 4}),
+    ],
+    [
+        ["-op_2i", "1x", ":", "-op_1o", ":", "1x"],
+        ParserError("Invalid name `1x`!", ctx={"token_index": 1}),
+    ],
+    [
+        ["-op_2i", "x", ":", "-op_1i1o", ":", "x", "1"],
+        ParserError("Name `x` is not bound!", ctx={"token_index": 5}),
+    ],
 ]
 
 validation_errors = [
@@ -399,6 +417,10 @@ valid = [
         list("-op_vi [ -op_vi1o [ 1 2 3 ] -op_vi1o [ 4 5 6 ] ]".split()),
         "[ op_vi [ op_vi1o [ 1 2 3 ] op_vi1o [ 4 5 6 ] ] ]",
     ],
+    [
+        list("-op_vi x : -op_vi1o [ 1 2 ] 3 : x".split()),
+        "[ op_vi [ op_vi1o [ 1 2 ] 3 op_vi1o [ 1 2 ] ] ]",
+    ],
 ]
 
 
@@ -409,3 +431,68 @@ def test_draw(input, expected_draw):
     assert isinstance(op, RootOperator)
     assert op.draw() == expected_draw
     op.execute()
+
+
+def test_get_operator_output_order():
+    parser = CliParser()
+    op = parser.get_operator(operator_fns=operator_fns, input=["-op_2o", "a", "b"])
+    # the output paths are given to the callback from the last one
+    assert op.args == ("b", "a")
+
+
+def test_get_operator_deep_chain():
+    depth = 10 * sys.getrecursionlimit()
+    parser = CliParser()
+    input = ["-op_1i"] + ["-op_1i1o"] * depth + ["-op_1p1o,1"]
+    op = parser.get_operator(operator_fns=operator_fns, input=input)
+    assert op.input.index == depth + 1
+    depth_found = 0
+    child = op.input.inputs[0]
+    while child.name == "op_1i1o":
+        depth_found += 1
+        child = child.inputs[0]
+    assert depth_found == depth
+
+
+def test_get_operator_deep_brackets():
+    depth = 10 * sys.getrecursionlimit()
+    parser = CliParser()
+    input = ["-op_vi"] + ["[", "1", "-op_vi1o"] * depth + ["1"] + ["]"] * depth
+    op = parser.get_operator(operator_fns=operator_fns, input=input)
+    assert op.input.index == len(input)
+    with pytest.raises(ParserError) as e:
+        parser.get_operator(operator_fns=operator_fns, input=input[:-1])
+    assert e.value.message == "Missing closing bracket!"
+    assert e.value.ctx["token_index"] == 1
+
+
+def test_get_operator_named():
+    calls = []
+
+    def count(i: intIn) -> intOut:
+        calls.append(i)
+        return i
+
+    fns = OperatorFns(operator_fns)
+    fns["count"] = OperatorFn.from_def(
+        count, param_parser=param_parser, implicit="input"
+    )
+    parser = CliParser()
+    input = "-op_vi x : -count 1 -op_vi1o [ : x 2 ] : x".split()
+    op = parser.get_operator(operator_fns=fns, input=input)
+    bound, op_vi1o, reference = op.input.inputs
+    assert isinstance(bound, SharedOperator)
+    assert op_vi1o.inputs[0] is bound
+    assert reference is bound
+    op.execute()
+    assert calls == [1]
+    # the bound operator stays shared once the common operators are shared
+    input = "-op_vi x : -count 1 -op_vi1o [ : x ] -op_vi1o [ : x ] : x".split()
+    op = share_common_operators(parser.get_operator(operator_fns=fns, input=input))
+    bound, op_vi1o, op_vi1o_copy, reference = op.input.inputs
+    assert op_vi1o_copy is op_vi1o
+    assert op_vi1o.input.inputs[0] is bound
+    assert reference is bound
+    assert not isinstance(bound.input, SharedOperator)
+    op.execute()
+    assert calls == [1, 1]
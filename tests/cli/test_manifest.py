@@ -0,0 +1,120 @@
+# type: ignore
+import json
+import os
+import sys
+
+import pytest
+
+from clios.cli.app import Clios, OperatorFns
+from clios.cli.main_parser import CliParser, load_module
+from clios.cli.manifest import Manifest
+from clios.core.operator_fn import DeferredOperatorFn
+
+OPERATORS = '''
+import typing as t
+
+from clios import Output, Param
+
+
+def scale(
+    i: float, *, factor: t.Annotated[float, Param()] = 2.0
+) -> t.Annotated[float, Output(callback=print)]:
+    """
+    Scale the input
+
+    description:
+        Multiply the input by a factor.
+
+    Operator Examples:
+        -scale,factor=3 1 output
+    """
+    return i * factor
+
+
+def negate(i: float) -> t.Annotated[float, Output(callback=print)]:
+    """Negate the input"""
+    return -i
+'''
+
+
+@pytest.fixture
+def module(tmp_path):
+    path = tmp_path / "manifest_operators.py"
+    path.write_text(OPERATORS)
+    return path, load_module("manifest_operators", path)
+
+
+def get_registry(module):
+    operator_fns = OperatorFns()
+    for name in ("scale", "negate"):
+        operator_fns.register(implicit="input")(getattr(module, name))
+    return operator_fns
+
+
+def test_manifest(module, tmp_path):
+    path, module = module
+    manifest = Manifest.build(get_registry(module), CliParser())
+    assert manifest.sources == {str(path): os.stat(path).st_mtime_ns}
+    doc = manifest.operators["scale"]
+    assert doc.synopsis == " -scale[,factor=<val>] i output"
+    assert doc.short_description == "Scale the input"
+    assert doc.long_description == "Multiply the input by a factor."
+    assert doc.examples == [("", "-scale,factor=3 1 output")]
+    assert [arg["name"] for arg in doc.kwds_doc] == ["factor"]
+
+    manifest.write(tmp_path / "manifest.json")
+    operator_fns = get_registry(module)
+    assert Manifest.load(tmp_path / "manifest.json", operator_fns) == manifest
+    # the operator functions are not built
+    assert isinstance(operator_fns.peek("scale"), DeferredOperatorFn)
+
+
+def test_manifest_out_of_date(module, tmp_path):
+    path, module = module
+    manifest_path = tmp_path / "manifest.json"
+    operator_fns = get_registry(module)
+    assert Manifest.load(manifest_path, operator_fns) is None
+    Manifest.build(operator_fns, CliParser()).write(manifest_path)
+    assert Manifest.load(manifest_path, operator_fns) is not None
+
+    # another registry
+    del operator_fns["negate"]
+    assert Manifest.load(manifest_path, operator_fns) is None
+
+    # a modified source file
+    operator_fns = get_registry(module)
+    mtime = os.stat(path).st_mtime_ns
+    os.utime(path, ns=(mtime, mtime + 1))
+    assert Manifest.load(manifest_path, operator_fns) is None
+
+    # an invalid manifest
+    manifest_path.write_text("{")
+    assert Manifest.load(manifest_path, operator_fns) is None
+
+
+def test_click_app_manifest(module, tmp_path, capsys):
+    _, module = module
+    manifest_path = tmp_path / "manifest.json"
+    sys.argv = ["cli", "--build-manifest"]
+    assert Clios(get_registry(module), manifest=str(manifest_path))() is None
+    assert "Wrote the manifest of 2 operator(s)" in capsys.readouterr().err
+
+    # the documentation is read from the manifest
+    data = json.loads(manifest_path.read_text())
+    data["operators"]["negate"]["short_description"] = "From the manifest"
+    manifest_path.write_text(json.dumps(data))
+    operator_fns = get_registry(module)
+    app = Clios(operator_fns, manifest=str(manifest_path))
+    sys.argv = ["cli", "--list"]
+    app()
+    assert "From the manifest" in capsys.readouterr().out
+    sys.argv = ["cli", "--show", "negate"]
+    app()
+    assert "From the manifest" in capsys.readouterr().out
+    assert isinstance(operator_fns.peek("negate"), DeferredOperatorFn)
+
+
+def test_click_app_manifest_missing_path(module):
+    sys.argv = ["cli", "--build-manifest"]
+    with pytest.raises(SystemExit):
+        Clios(get_registry(module[1]))()
@@ -0,0 +1,90 @@
+# type: ignore
+import typing as t
+
+import pytest
+from pydantic import ValidationError
+
+from clios.cli.main_parser import CliParser
+from clios.cli.mapper import Template, has_placeholder, substitute
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator import SharedOperator
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.param_info import Output, Param
+
+strOut = t.Annotated[str, Output(callback=print)]
+
+
+def cat(*i: str) -> strOut:
+    return "".join(i)
+
+
+def size(i: int) -> str:
+    return str(i)
+
+
+def suffix(i: str, *, s: t.Annotated[str, Param()] = "") -> str:
+    return i + s
+
+
+operator_fns = OperatorFns()
+for func in (cat, size, suffix):
+    operator_fns[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+
+
+def get_template(args, path="a/b.nc"):
+    root = CliParser().get_operator(operator_fns, [substitute(a, path) for a in args])
+    return Template(root, args)
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [
+        ("{}", "data/x.nc"),
+        ("{.}", "data/x"),
+        ("{/}", "x.nc"),
+        ("out/{/.}.txt", "out/x.txt"),
+        ("no placeholder", "no placeholder"),
+    ],
+)
+def test_substitute(string, expected):
+    assert substitute(string, "data/x.nc") == expected
+    assert has_placeholder(string) == (string != expected)
+
+
+def test_template_bind():
+    args = "-cat [ x : -cat [ {/.} 1 ] : x -suffix {/} ] out".split()
+    template = get_template(args)
+    root = template.bind("data/c.nc")
+    assert root.input.execute() == "c1c1c.nc"
+    bound, reference, _ = root.input.inputs
+    assert isinstance(bound, SharedOperator)
+    assert reference is bound
+    # the template is not modified
+    assert template.root.input.execute() == "b1b1b.nc"
+
+
+def test_template_outputs():
+    template = get_template(["-cat", "[", "{}", "]", "{.}.txt"])
+    assert template.bind("data/c.nc").args == ("data/c.txt",)
+
+
+def test_template_validation():
+    template = get_template(["-cat", "[", "-size", "{/.}", "]", "out"], "1.nc")
+    assert template.bind("2.nc").input.execute() == "2"
+    with pytest.raises(ValidationError):
+        template.bind("a.nc")
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["-cat", "[", "a", "]", "out"],
+        ["-cat", "[", "-suffix,s={/}", "a", "]", "out"],
+    ],
+    ids=["missing", "param"],
+)
+def test_template_invalid(args):
+    with pytest.raises(ValueError):
+        get_template(args)
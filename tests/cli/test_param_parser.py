@@ -62,6 +62,10 @@ def selvar(name: t.Annotated[str, Param()]):
     pass
 
 
+def op_1pvp(ip: intParam, *vp: intParam, ik: intParam = 0):
+    pass
+
+
 def op_1K(*, ip: IntParam):
     pass
 
@@ -177,6 +181,14 @@ build_error = [
             "Data validation failed for argument `ip`!", ctx={"spos": 0, "epos": 4}
         ),
     ],
+    [
+        ["1,2,3,a,5", op_1pvp],
+        ParserError("Data validation failed for argument!", ctx={"spos": 6, "epos": 7}),
+    ],
+    [
+        ["1,2,a,ik=b", op_1pvp],
+        ParserError("Data validation failed for argument!", ctx={"spos": 4, "epos": 5}),
+    ],
 ]
 
 
@@ -212,6 +224,8 @@ def test_parse_arguments_build_error(input, expected):
         [op_1p, "100", [(100,), ()]],
         [selvar, "name", [("name",), ()]],
         [op_1p1k, "1,ik=1", [(1,), (("ik", 1),)]],
+        [op_1pvp, "1,2,3,ik=4", [(1, 2, 3), (("ik", 4),)]],
+        [op_1pvp, "1,2", [(1, 2), ()]],
     ],
 )
 def test_valid(fn, input, expected):
@@ -14,22 +14,22 @@ from clios.core.param_info import Output, Param
 
 @pytest.fixture
 def mock_console(mocker):
-    return mocker.patch("clios.cli.presenter.Console")
+    return mocker.patch("rich.console.Console")
 
 
 @pytest.fixture
 def mock_panel(mocker):
-    return mocker.patch("clios.cli.presenter.Panel")
+    return mocker.patch("rich.panel.Panel")
 
 
 @pytest.fixture
 def mock_table(mocker):
-    return mocker.patch("clios.cli.presenter.Table")
+    return mocker.patch("rich.table.Table")
 
 
 @pytest.fixture
 def mock_text(mocker):
-    return mocker.patch("clios.cli.presenter.Text")
+    return mocker.patch("rich.text.Text")
 
 
 def operator1(
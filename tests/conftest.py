@@ -21,3 +21,18 @@ def copy_file(request, tmp_path):
 
     # Return the list of copied files
     return _copy
+
+
+def count(i: int) -> int:
+    # the calls are counted in a file, as they may be made by worker processes
+    with open(os.environ["CLIOS_TEST_CALLS"], "a") as f:
+        f.write(f"{i}\n")
+    return i
+
+
+@pytest.fixture
+def calls(tmp_path, monkeypatch):
+    # the file of the calls to `count`
+    path = tmp_path / "calls.txt"
+    monkeypatch.setenv("CLIOS_TEST_CALLS", str(path))
+    return path
@@ -1,7 +1,29 @@
 # type: ignore
 import pytest
 
-from clios.core.operator_fn import OperatorFns
+import clios.core.operator_fn as operator_fn_module
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import (
+    DeferredOperatorFn,
+    Description,
+    OperatorFn,
+    OperatorFns,
+)
+
+
+def get_registry():
+    reg = OperatorFns()
+
+    @reg.register(name="valid", param_parser=StandardParamParser(), implicit="input")
+    def valid(i: int) -> int:
+        """Valid operator"""
+        return i
+
+    @reg.register(name="invalid", param_parser=StandardParamParser(), implicit="input")
+    def invalid(i) -> int:
+        return i
+
+    return reg
 
 
 def test_set_key_exist():
@@ -42,3 +64,87 @@ def test_update_does_not_take_kwds():
         str(e.value)
         == f"update() only accept a single positional argument of type {OperatorFns}"
     )
+
+
+def test_register_deferred():
+    reg = get_registry()
+    assert isinstance(reg.peek("valid"), DeferredOperatorFn)
+    assert reg.peek("valid").short_description == "Valid operator"
+    operator_fn = reg["valid"]
+    assert isinstance(operator_fn, OperatorFn)
+    assert reg.get("valid") is operator_fn
+    assert reg.peek("valid") is operator_fn
+    assert reg.get("not_found") is None
+
+
+def test_register_deferred_update():
+    reg = OperatorFns()
+    reg.update(get_registry())
+    assert isinstance(reg.peek("valid"), DeferredOperatorFn)
+    assert isinstance(reg["valid"], OperatorFn)
+
+
+def test_register_deferred_error():
+    reg = get_registry()
+    with pytest.raises(AssertionError, match="Missing type annotation"):
+        reg["invalid"]
+    with pytest.raises(AssertionError, match="Missing type annotation"):
+        list(reg.values())
+    with pytest.raises(ExceptionGroup) as e:
+        reg.validate_all()
+    assert str(e.value) == "1 invalid operator(s)! (1 sub-exception)"
+    assert e.value.exceptions[0].__notes__ == ["Registered as operator `invalid`"]
+    assert isinstance(reg.peek("valid"), OperatorFn)
+
+
+def test_validate_all():
+    reg = get_registry()
+    del reg["invalid"]
+    reg.validate_all()
+    assert [type(value) for value in reg.values()] == [OperatorFn]
+    assert [name for name, _ in reg.items()] == ["valid"]
+
+
+def test_copy_deferred():
+    reg = get_registry()
+    del reg["invalid"]
+    for operator_fns in (dict(reg), reg.copy(), {**reg}, {} | reg, reg | {}):
+        assert isinstance(operator_fns["valid"], OperatorFn)
+    # the views do not build the operator functions until they are iterated
+    values = get_registry().values()
+    assert len(values) == 2
+    reg = get_registry()
+    assert isinstance(reg.copy().peek("valid"), DeferredOperatorFn)
+    assert isinstance(reg.setdefault("valid"), OperatorFn)
+    assert isinstance(reg.pop("valid"), OperatorFn)
+    with pytest.raises(AssertionError, match="Missing type annotation"):
+        reg.popitem()
+    assert reg.pop("valid", None) is None
+
+
+def test_description_cached(mocker):
+    parse = mocker.patch(
+        "clios.core.operator_fn._parse_docstring",
+        wraps=operator_fn_module._parse_docstring,
+    )
+    operator_fn = get_registry()["valid"]
+    hash_ = hash(operator_fn)
+    for _ in range(2):
+        assert operator_fn.short_description == "Valid operator"
+        assert operator_fn.long_description == ""
+        assert operator_fn.examples == []
+    assert parse.call_count == 1
+    # the cache is not a field of the dataclass
+    assert hash(operator_fn) == hash_
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_parse_docstrings(processes):
+    reg = get_registry()
+    reg.parse_docstrings(processes=processes)
+    description = reg.peek("valid").description
+    assert isinstance(reg.peek("valid"), DeferredOperatorFn)
+    assert description == Description("Valid operator", "", [])
+    assert reg.peek("invalid").description == Description("", "", [])
+    # the description is kept when the operator function is built
+    assert reg["valid"].description is description
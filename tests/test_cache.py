@@ -0,0 +1,224 @@
+# type: ignore
+import asyncio
+import errno
+import os
+import typing as t
+from collections import Counter
+
+import pytest
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.cache import MISSING, ResultCache, digest_callback, digest_value
+from clios.core.executor import ProcessExecutor, SerialExecutor
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.param_info import Output, Param
+
+calls = Counter()
+
+
+def identity(value):
+    return value
+
+
+floatOut = t.Annotated[float, Output(callback=identity, num_outputs=0)]
+
+
+def read(path: str) -> float:
+    calls["read"] += 1
+    with open(path) as f:
+        return float(f.read())
+
+
+def scale(i: float, factor: t.Annotated[float, Param()] = 1) -> floatOut:
+    calls["scale"] += 1
+    return i * factor
+
+
+def add(i: float, j: float) -> floatOut:
+    calls["add"] += 1
+    return i + j
+
+
+operators = OperatorFns()
+for func in (read, scale):
+    operators[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input", cacheable=True
+    )
+operators["add"] = OperatorFn.from_def(
+    add, param_parser=StandardParamParser(), implicit="input"
+)
+
+
+def get_operator(input: str):
+    return CliParser().get_operator(operator_fns=operators, input=input.split())
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("2")
+    return path
+
+
+def test_cached_outputs_are_reused(cache, data_file):
+    op = get_operator(f"-add -scale,3 -read {data_file} -read {data_file}")
+    assert op.execute(SerialExecutor(cache=cache)) == 8
+    assert calls == {"add": 1, "scale": 1, "read": 1}
+
+    calls.clear()
+    assert op.execute(SerialExecutor(cache=cache)) == 8
+    assert calls == {"add": 1}
+
+    calls.clear()
+    op = get_operator(f"-add -scale,4 -read {data_file} -read {data_file}")
+    assert op.execute(SerialExecutor(cache=cache)) == 10
+    assert calls == {"add": 1, "scale": 1}
+
+
+def test_input_file_content_is_part_of_the_key(cache, data_file):
+    op = get_operator(f"-scale,3 -read {data_file}")
+    assert op.execute(SerialExecutor(cache=cache)) == 6
+    data_file.write_text("3")
+    assert op.execute(SerialExecutor(cache=cache)) == 9
+    assert calls == {"scale": 2, "read": 2}
+
+
+def test_no_cache(cache, data_file):
+    op = get_operator(f"-scale,3 -read {data_file}")
+    op.execute()
+    op.execute(SerialExecutor())
+    assert calls == {"scale": 2, "read": 2}
+    assert not cache.directory.exists()
+
+
+def get_edited_operator(source: str, input: str):
+    """Get an operator whose callback `times` is defined by `source`"""
+    namespace = {"__name__": __name__, "floatOut": floatOut}
+    exec(source, namespace)
+    edited = OperatorFns()
+    edited["read"] = operators["read"]
+    edited["times"] = OperatorFn.from_def(
+        namespace["times"],
+        param_parser=StandardParamParser(),
+        implicit="input",
+        cacheable=True,
+    )
+    return CliParser().get_operator(operator_fns=edited, input=input.split())
+
+
+def test_edited_callback_is_part_of_the_key(cache, data_file):
+    source = "def times(i: float) -> floatOut:\n    return i * {}\n"
+    op = get_edited_operator(source.format(2), f"-times -read {data_file}")
+    assert op.execute(SerialExecutor(cache=cache)) == 4
+    op = get_edited_operator(source.format(3), f"-times -read {data_file}")
+    assert op.execute(SerialExecutor(cache=cache)) == 6
+    op = get_edited_operator(source.format(3), f"-times -read {data_file}")
+    assert op.execute(SerialExecutor(cache=cache)) == 6
+    assert calls == {"read": 1}
+
+
+def test_digest_callback():
+    def make_scale(factor, offset=0):
+        def scale(i, power=1):
+            return (i * factor) ** power + offset
+
+        return scale
+
+    digests = {
+        digest_callback(make_scale(2)),
+        digest_callback(make_scale(3)),
+        digest_callback(make_scale(2, offset=1)),
+        digest_callback(lambda i: [i * 2 for _ in range(2)]),
+        digest_callback(lambda i: [i * 3 for _ in range(2)]),
+    }
+    assert len(digests) == 5
+    assert digest_callback(make_scale(2)) == digest_callback(make_scale(2))
+    assert digest_callback(make_scale(lambda: None)) is None
+
+
+def test_cache_with_other_executors(cache, data_file):
+    op = get_operator(f"-add -scale,3 -read {data_file} -read {data_file}")
+    with ProcessExecutor(max_workers=2, cache=cache) as executor:
+        assert op.execute(executor) == 8
+    assert asyncio.run(op.execute_async(SerialExecutor(cache=cache))) == 8
+    assert calls == {"add": 2}
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_size=2500)
+    for key in "abc":
+        cache.save(key, b"x" * 1000)
+    assert cache.load("a") is MISSING
+    assert cache.load("b") == b"x" * 1000
+
+    # `b` was used more recently than `c`
+    os.utime(cache._get_path("c"), (0, 0))
+    cache.save("d", b"x" * 1000)
+    assert cache.load("c") is MISSING
+    assert cache.load("b") is not MISSING
+    assert cache.load("d") is not MISSING
+
+    cache.clear()
+    assert cache.load("b") is MISSING
+
+
+@pytest.mark.parametrize(
+    "data", [b"garbage", b"cclios.core.cache\nremoved\n.", b"cremoved_module\nf\n."]
+)
+def test_invalid_entry_is_a_miss(cache, data):
+    cache.save("key", 1)
+    cache._get_path("key").write_bytes(data)
+    assert cache.load("key") is MISSING
+    assert not cache._get_path("key").exists()
+
+
+@pytest.mark.parametrize(
+    "error", [OSError(errno.ENOSPC, "No space left on device"), KeyboardInterrupt()]
+)
+def test_failed_save_is_removed(cache, monkeypatch, error):
+    fdopen = os.fdopen
+
+    class FailingFile:
+        def __init__(self, fd, mode):
+            self.file = fdopen(fd, mode)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.file.close()
+
+        def write(self, data):
+            raise error
+
+    monkeypatch.setattr(os, "fdopen", FailingFile)
+    with pytest.raises(type(error)):
+        cache.save("key", 1)
+    assert list(cache.directory.iterdir()) == []
+    assert cache.load("key") is MISSING
+
+
+def test_unpicklable_values(cache):
+    assert digest_value(lambda: None) is None
+    assert cache.get_key(lambda: None) is None
+    cache.save("key", lambda: None)
+    assert cache.load("key") is MISSING
+
+
+def test_default_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("CLIOS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("CLIOS_CACHE_SIZE", "10")
+    cache = ResultCache.default()
+    assert cache.directory == tmp_path
+    assert cache.max_size == 10
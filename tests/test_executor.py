@@ -0,0 +1,290 @@
+# type: ignore
+import asyncio
+import os
+import pickle
+import sys
+import threading
+import typing as t
+
+import pytest
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.exceptions import CliosError
+from clios.core.executor import ProcessExecutor, SerialExecutor, ThreadExecutor
+from clios.core.operator import (
+    Operator,
+    OperatorError,
+    RootOperator,
+    SimpleOperator,
+)
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.optimizer import share_common_operators
+from clios.core.param_info import Output
+from clios.core.transport import PickleTransport
+
+from .conftest import count
+
+
+def identity(value):
+    return value
+
+
+intOut = t.Annotated[int, Output(callback=identity, num_outputs=0)]
+floatOut = t.Annotated[float, Output(callback=identity, num_outputs=0)]
+
+barrier = threading.Barrier(2, timeout=5)
+
+
+def wait(i: int) -> int:
+    barrier.wait()
+    return i
+
+
+def add(i: int, j: int) -> intOut:
+    return i + j
+
+
+def neg(i: int) -> int:
+    return -i
+
+
+def fail(i: int) -> int:
+    raise CliosError(f"failed {i}")
+
+
+def mean(*i: int) -> floatOut:
+    return sum(i) / len(i)
+
+
+def pid(i: int) -> int:
+    return os.getpid()
+
+
+def pids(*i: int) -> t.Annotated[list[int], Output(callback=identity, num_outputs=0)]:
+    return list(i)
+
+
+def array(i: int) -> t.Any:
+    import numpy as np
+
+    return np.full(2**18, i, dtype=np.int64)
+
+
+def arrays(*i: t.Any) -> t.Annotated[t.Any, Output(callback=identity, num_outputs=0)]:
+    return list(i)
+
+
+async_barrier = asyncio.Barrier(2)
+
+
+async def async_wait(i: int) -> int:
+    async with asyncio.timeout(5):
+        await async_barrier.wait()
+    return i
+
+
+async def async_neg(i: int) -> int:
+    await asyncio.sleep(0)
+    return -i
+
+
+async def async_fail(i: int) -> int:
+    await asyncio.sleep(0.01 * i)
+    raise CliosError(f"failed {i}")
+
+
+operators = OperatorFns()
+for func in (
+    wait,
+    add,
+    neg,
+    fail,
+    mean,
+    pid,
+    pids,
+    count,
+    array,
+    arrays,
+    async_wait,
+    async_neg,
+    async_fail,
+):
+    operators[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+
+
+def get_operator(input: list[str]):
+    return CliParser().get_operator(operator_fns=operators, input=input)
+
+
+def test_inputs_run_concurrently():
+    barrier.reset()
+    op = get_operator(["-add", "-wait", "1", "-wait", "2"])
+    with ThreadExecutor(max_workers=2) as executor:
+        assert op.execute(executor) == 3
+
+
+@pytest.mark.parametrize(
+    "input,expected",
+    [
+        (["-add", "-neg", "1", "-neg", "2"], -3),
+        (["-mean", "-neg", "1", "2", "-add", "3", "4", "-neg", "6"], 0.5),
+        (["-add", "-add", "-neg", "1", "2", "-add", "-neg", "3", "-neg", "4"], -6),
+    ],
+)
+def test_outputs_keep_input_order(input, expected):
+    op = get_operator(input)
+    with ThreadExecutor(max_workers=1) as executor:
+        assert op.execute(executor) == expected
+    assert op.execute() == expected
+
+
+def test_error_of_first_failing_input():
+    op = get_operator(["-add", "-fail", "1", "-fail", "2"])
+    with pytest.raises(OperatorError) as serial_error:
+        op.execute()
+    with ThreadExecutor(max_workers=2) as executor, pytest.raises(OperatorError) as e:
+        op.execute(executor)
+    assert e.value.message == "An error occurred while executing operator `fail`!"
+    assert str(e.value.ctx["error"]) == "failed 1"
+    assert e.value.ctx["name"] == serial_error.value.ctx["name"]
+    assert e.value.ctx["index"] == serial_error.value.ctx["index"]
+
+
+def test_operator_fn_is_pickled_by_reference():
+    operator_fn = operators["add"]
+    loaded = pickle.loads(pickle.dumps(operator_fn))
+    assert loaded.callback is add
+    assert loaded.parameters[0].name == "i"
+    assert pickle.loads(pickle.dumps(operator_fn)) is loaded
+
+
+def test_operator_fn_with_local_callback_is_not_picklable():
+    def local(i: int) -> int:
+        return i
+
+    operator_fn = OperatorFn.from_def(
+        local, param_parser=StandardParamParser(), implicit="input"
+    )
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(operator_fn)
+
+
+def test_process_executor():
+    op = get_operator(["-pids", "-pid", "1", "-pid", "2", "3"])
+    with ProcessExecutor(max_workers=2) as executor:
+        pid1, pid2, value = op.execute(executor)
+    assert value == 3
+    assert os.getpid() not in (pid1, pid2)
+
+    op = get_operator(["-add", "-add", "-neg", "1", "2", "-add", "-neg", "3", "4"])
+    with ProcessExecutor(max_workers=2) as executor:
+        assert op.execute(executor) == 2
+
+
+def test_process_executor_error():
+    op = get_operator(["-add", "-fail", "1", "-fail", "2"])
+    with pytest.raises(OperatorError) as serial_error:
+        op.execute()
+    with ProcessExecutor(max_workers=2) as executor, pytest.raises(OperatorError) as e:
+        op.execute(executor)
+    assert e.value.message == serial_error.value.message
+    assert e.value.ctx["index"] == serial_error.value.ctx["index"]
+    assert str(e.value.ctx["error"]) == "failed 1"
+
+
+@pytest.mark.parametrize(
+    "input,expected",
+    [
+        (["-add", "-count", "1", "-count", "1"], 2),
+        (["-add", "-neg", "-count", "1", "-add", "-count", "1", "2"], 2),
+        (
+            ["-pids", "-neg", "-neg", "-count", "1", "-neg", "-count", "1", "3"],
+            [1, -1, 3],
+        ),
+        (["-add", "x", ":", "-count", "1", "-add", ":", "x", "-neg", ":", "x"], 1),
+    ],
+)
+def test_process_executor_shared_operator(input, expected, calls):
+    root = share_common_operators(get_operator(input))
+    with ProcessExecutor(max_workers=2) as executor:
+        assert root.execute(executor) == expected
+    # the shared operator is executed once, not once per worker
+    assert calls.read_text() == "1\n"
+
+
+@pytest.mark.parametrize("transport", [None, PickleTransport()])
+def test_process_executor_transport(transport):
+    np = pytest.importorskip("numpy")
+    op = get_operator(["-arrays", "-array", "1", "-array", "2", "-array", "3"])
+    with ProcessExecutor(max_workers=2, transport=transport) as executor:
+        values = op.execute(executor)
+    for i, value in enumerate(values, 1):
+        assert isinstance(value, np.ndarray)
+        assert (value == i).all()
+    shared = [type(value.base).__name__ == "_MappedSegment" for value in values]
+    assert shared == [transport is None] * 3
+
+
+def test_async_operator_fn():
+    assert operators["async_wait"].is_async
+    assert not operators["wait"].is_async
+
+
+def test_execute_async():
+    op = get_operator(["-add", "-async_wait", "1", "-async_wait", "2"])
+    assert asyncio.run(op.execute_async()) == 3
+
+    op = get_operator(["-mean", "-neg", "1", "2", "-add", "3", "4", "-neg", "6"])
+    assert asyncio.run(op.execute_async()) == 0.5
+
+
+def test_execute_async_operator_synchronously():
+    op = get_operator(["-add", "-async_fail", "1", "2"])
+    with pytest.raises(OperatorError) as e:
+        op.execute()
+    assert str(e.value.ctx["error"]) == "failed 1"
+
+
+def test_execute_async_operator_in_running_loop():
+    op = get_operator(["-add", "-async_neg", "1", "-async_neg", "2"])
+
+    async def main():
+        # e.g. clios called synchronously from an asynchronous application
+        return op.execute()
+
+    assert asyncio.run(main()) == -3
+
+
+def test_execute_async_error_of_first_failing_input():
+    op = get_operator(["-add", "-async_fail", "2", "-async_fail", "1"])
+    with pytest.raises(OperatorError) as e:
+        asyncio.run(op.execute_async())
+    assert e.value.message == (
+        "An error occurred while executing operator `async_fail`!"
+    )
+    assert str(e.value.ctx["error"]) == "failed 2"
+
+
+def get_chain(depth: int, value: int = 1):
+    op = SimpleOperator("i", 0, value)
+    for index in range(depth):
+        op = Operator("neg", index, operators["neg"], inputs=(op,))
+    return op
+
+
+def test_execute_deep_chain():
+    depth = 10 * sys.getrecursionlimit()
+    op = get_chain(depth)
+    assert op.execute() == (-1) ** depth
+    root = RootOperator(get_chain(depth), callback=identity)
+    assert share_common_operators(root).execute(SerialExecutor()) == (-1) ** depth
+
+
+def test_execute_deep_chain_error():
+    op = Operator("fail", 0, operators["fail"], inputs=(get_chain(5000, value=2),))
+    with pytest.raises(OperatorError) as e:
+        op.execute()
+    assert str(e.value.ctx["error"]) == "failed 2"
@@ -0,0 +1,77 @@
+# type: ignore
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[1]
+
+# the modules which are only imported to print the help, a list or an error
+LAZY_MODULES = ("rich", "griffe", "asyncio", "clios.cli.presenter", "clios.cli.daemon")
+
+
+def get_import_times(code, cwd=ROOT):
+    """
+    Run code with `python -X importtime`, and get the cumulative import time (us)
+    of each imported module
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def get_lazy_modules(times):
+    return sorted(
+        name
+        for name in times
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import clios",
+        "from clios import Clios, Input, OperatorFns, Output, Param, operator",
+        "from clios import Clios, OperatorFns; Clios(OperatorFns())(['--help'])",
+    ],
+    ids=["package", "exports", "help"],
+)
+def test_lazy_imports(code):
+    times = get_import_times(code)
+    assert get_lazy_modules(times) == []
+
+
+def test_lazy_imports_run(tmp_path):
+    code = (
+        "from clios import Clios; from examples.calc.calc import operators; "
+        "Clios(operators)(['-range,0,3', 'output.json'])"
+    )
+    times = get_import_times(code, cwd=tmp_path)
+    assert (tmp_path / "output.json").exists()
+    # the presenter runs the operators, but rich is not needed
+    assert get_lazy_modules(times) == ["clios.cli.presenter"]
+
+
+def test_client_imports():
+    times = get_import_times("import clios.cli.client")
+    # only the standard library, so that the client starts quickly
+    assert not [name for name in times if name.startswith(("click", "pydantic"))]
+    modules = {name for name in times if name.startswith("clios")}
+    assert modules == {"clios", "clios.cli", "clios.cli.client"}
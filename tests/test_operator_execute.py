@@ -10,6 +10,7 @@ from clios.cli.param_parser import StandardParamParser
 from clios.core.operator import OperatorError
 from clios.core.operator_fn import OperatorFn, OperatorFns
 from clios.core.param_info import Input, Output, Param
+from clios.core.plan import ExecutionPlan
 
 intOut = t.Annotated[int, Output(callback=print)]
 
@@ -49,6 +50,10 @@ def op_1oe() -> intOut:
     return "a"
 
 
+def op_1ot() -> t.Annotated[int, Output(callback=print, trusted=True)]:
+    return "a"
+
+
 def op_1k(*, ip: intParam):
     pass
 
@@ -89,6 +94,14 @@ def op_1i1p1o(i: intIn, ip: intParam) -> intOut:
     return 1
 
 
+def op_vIo(*i: IntIn) -> intOut:
+    return sum(i)
+
+
+def op_1IvP(i: IntIn, *ip: IntParam) -> intOut:
+    return i + sum(ip)
+
+
 def op_1i1k1o(i: intIn, *, ip: intParam) -> intOut:
     return 1
 
@@ -123,18 +136,46 @@ execute_error = [
         ["-op_1I", "input"],
         "Data validation failed for the input of operator `op_1I`!",
     ],
+    [
+        ["-op_vIo", "1", "2", "a", "4", "output"],
+        "Data validation failed for the input of operator `op_vIo`!",
+    ],
+    [
+        ["-op_1IvP,1,2,a,4", "1", "output"],
+        "Data validation failed for the argument `ip` of operator `op_1IvP`!",
+    ],
 ]
 
 
+@pytest.mark.parametrize("compile", [False, True])
 @pytest.mark.parametrize("input,expected", execute_error)
-def test_error(input, expected):
+def test_error(input, expected, compile):
     parser = CliParser()
     op = parser.get_operator(operator_fns=operators, input=input)
+    execute = ExecutionPlan.from_operator(op).execute if compile else op.execute
     with pytest.raises(OperatorError) as e:
-        op.execute()
+        execute()
     assert e.value.message == expected
     assert isinstance(e.value.ctx["error"], ValidationError)
     assert str(e.value)
+    if "a" in input[1:] or ",a," in input[0]:
+        # the error is the one of the invalid value
+        assert e.value.ctx["error"].errors()[0]["input"] == "a"
+
+
+@pytest.mark.parametrize("compile", [False, True])
+@pytest.mark.parametrize(
+    "input,expected",
+    [
+        [["-op_vIo", "1", "2", "3", "output"], 6],
+        [["-op_vIo", "1", "output"], 1],
+        [["-op_1IvP,2,3,4", "1", "output"], 10],
+    ],
+)
+def test_variadic(input, expected, compile):
+    op = CliParser().get_operator(operator_fns=operators, input=input).input
+    execute = ExecutionPlan.from_operator(op).execute if compile else op.execute
+    assert execute() == expected
 
 
 def test_output_validation_failed():
@@ -162,3 +203,26 @@ def test_draw_inline(copy_file, request):
     op1 = parser.get_operator(operator_fns=operators, input=[op_string, "1"])
     assert op.draw() == "[ inline_valid.py [ 1 ] ]"
     assert op1.draw() == f"[ {file_path} [ 1 ] ]"
+
+
+def test_trusted_output_is_not_validated():
+    parser = CliParser()
+    op = parser.get_operator(operator_fns=operators, input=["-op_1ot", "output"])
+    assert operators["op_1ot"].output.is_trusted
+    assert not operators["op_1oe"].output.is_trusted
+    assert op.input.execute() == "a"
+
+
+@pytest.mark.parametrize(
+    "name,build_phase_noop,execute_phase_noop",
+    [
+        ("op_1p", False, True),
+        ("op_1P", True, False),
+        ("op_1i", False, True),
+        ("op_1I", True, False),
+    ],
+)
+def test_noop_validators(name, build_phase_noop, execute_phase_noop):
+    (param,) = operators[name].parameters
+    assert param.build_phase_noop is build_phase_noop
+    assert param.execute_phase_noop is execute_phase_noop
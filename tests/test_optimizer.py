@@ -0,0 +1,114 @@
+# type: ignore
+import asyncio
+import random
+import typing as t
+from collections import Counter
+
+import pytest
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.executor import ThreadExecutor
+from clios.core.operator import SharedOperator
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.optimizer import share_common_operators
+from clios.core.param_info import Output, Param
+
+calls = Counter()
+
+
+def identity(value):
+    return value
+
+
+floatOut = t.Annotated[float, Output(callback=identity, num_outputs=0)]
+
+
+def sub(i: float, j: float) -> floatOut:
+    calls["sub"] += 1
+    return i - j
+
+
+def mean(*i: float) -> float:
+    calls["mean"] += 1
+    return sum(i) / len(i)
+
+
+def sqrt(i: float) -> float:
+    calls["sqrt"] += 1
+    return i**0.5
+
+
+def scale(i: float, factor: t.Annotated[float, Param()] = 1) -> float:
+    calls["scale"] += 1
+    return i * factor
+
+
+def rand(i: float) -> float:
+    calls["rand"] += 1
+    return random.random()
+
+
+operators = OperatorFns()
+for func in (sub, mean, sqrt, scale):
+    operators[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+operators["rand"] = OperatorFn.from_def(
+    rand, param_parser=StandardParamParser(), implicit="input", deterministic=False
+)
+
+
+def get_operator(input: str):
+    root = CliParser().get_operator(operator_fns=operators, input=input.split())
+    return root, share_common_operators(root)
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_common_operators_are_executed_once():
+    root, optimized = get_operator("-sub -mean [ 9 9 9 ] -sqrt -mean [ 9 9 9 ]")
+    assert root.execute() == optimized.execute() == 6.0
+    assert calls == {"sub": 2, "mean": 3, "sqrt": 2}
+    mean_op = optimized.input.inputs[0]
+    assert isinstance(mean_op, SharedOperator)
+    assert optimized.input.inputs[1].inputs[0] is mean_op
+    assert optimized.draw() == root.draw()
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "-sub -mean [ 9 9 9 ] -mean [ 9 9 8 ]",
+        "-sub -scale,2 1 -scale,3 1",
+        "-sub -scale 1 -sqrt 1",
+    ],
+)
+def test_different_operators_are_not_shared(input):
+    root, optimized = get_operator(input)
+    assert optimized is root
+
+
+def test_non_deterministic_operators_are_not_shared():
+    root, optimized = get_operator("-sub -rand 1 -rand 1")
+    assert optimized is root
+
+    _, optimized = get_operator("-sub -rand -sqrt 4 -rand -sqrt 4")
+    optimized.execute()
+    assert calls["rand"] == 2
+    assert calls["sqrt"] == 1
+
+
+def test_shared_operator_with_executors():
+    _, optimized = get_operator("-sub -mean [ 9 9 9 ] -sqrt -mean [ 9 9 9 ]")
+    with ThreadExecutor(max_workers=2) as executor:
+        assert optimized.execute(executor) == 6.0
+    assert calls["mean"] == 1
+
+    calls.clear()
+    _, optimized = get_operator("-sub -mean [ 9 9 9 ] -sqrt -mean [ 9 9 9 ]")
+    assert asyncio.run(optimized.execute_async()) == 6.0
+    assert calls["mean"] == 1
@@ -0,0 +1,188 @@
+# type: ignore
+import typing as t
+from collections import Counter
+
+import pytest
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.exceptions import CliosError
+from clios.core.operator import OperatorError
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.optimizer import share_common_operators
+from clios.core.param_info import Input, Output, Param
+from clios.core.plan import ExecutionPlan
+
+calls = Counter()
+
+
+def identity(value):
+    return value
+
+
+floatOut = t.Annotated[float, Output(callback=identity, num_outputs=0)]
+
+
+def check_positive(value: int) -> int:
+    if int(value) <= 0:
+        raise ValueError("must be positive")
+    return value
+
+
+PositiveParam = t.Annotated[
+    int,
+    Param(core_validation_phase="execute", execute_phase_validators=(check_positive,)),
+]
+
+
+def sub(i: float, j: float) -> floatOut:
+    calls["sub"] += 1
+    return i - j
+
+
+def mean(*i: float) -> floatOut:
+    calls["mean"] += 1
+    return sum(i) / len(i)
+
+
+def scale(
+    i: float, factor: PositiveParam, *, offset: t.Annotated[float, Param()] = 0
+) -> floatOut:
+    return i * factor + offset
+
+
+def fail(i: float) -> float:
+    raise CliosError(f"failed {i}")
+
+
+def join(
+    *i: t.Annotated[str, Input()],
+) -> t.Annotated[str, Output(callback=identity, num_outputs=0)]:
+    return "".join(i)
+
+
+operators = OperatorFns()
+for func in (sub, mean, scale, fail):
+    operators[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+operators["join"] = OperatorFn.from_def(
+    join, param_parser=StandardParamParser(), implicit="input", is_delegate=True
+)
+
+
+def get_operator(input: str):
+    return CliParser().get_operator(operator_fns=operators, input=input.split())
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "-sub 3 1",
+        "-mean 1 2 3 4",
+        "-sub -mean [ 1 2 3 ] -scale,2,offset=1 4",
+        "-mean [ -sub 1 2 -scale,3 -mean 4 5 ]",
+        "-sub -mean [ 9 9 9 ] -mean [ 9 9 9 ]",
+        "-join [ -a -b c ]",
+    ],
+)
+def test_plan_output(input):
+    operator = get_operator(input)
+    expected = operator.execute()
+    assert ExecutionPlan.from_operator(operator).execute() == expected
+    shared = share_common_operators(operator)
+    assert ExecutionPlan.from_operator(shared).execute() == expected
+
+
+def test_plan_is_reusable():
+    plan = ExecutionPlan.from_operator(get_operator("-sub -scale,2 1 -mean [ 1 2 3 ]"))
+    assert plan.input_names == ("1", "1", "2", "3")
+    assert plan.execute() == 0
+    assert plan.execute(["2", "1", "2", "3"]) == 2
+    assert plan.execute([1, 1, 2, 6]) == -1
+    assert plan.execute() == 0
+    with pytest.raises(ValueError):
+        plan.execute([1])
+    with pytest.raises(OperatorError) as e:
+        plan.execute(["x", 1, 2, 3])
+    assert e.value.message == "Data validation failed for input x!"
+
+
+def test_plan_shares_common_operators():
+    operator = share_common_operators(get_operator("-sub -mean [ 1 2 ] -mean [ 1 2 ]"))
+    plan = ExecutionPlan.from_operator(operator)
+    calls.clear()
+    assert plan.execute() == 0
+    assert calls == {"mean": 1, "sub": 1}
+    calls.clear()
+    assert plan.execute() == 0
+    assert calls == {"mean": 1, "sub": 1}
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "-sub -fail 1 2",
+        "-sub 1 -scale,0 2",
+        "-mean -scale,1 1 -fail 2 -scale,0 3",
+    ],
+)
+def test_plan_error(input):
+    operator = get_operator(input)
+    with pytest.raises(OperatorError) as expected:
+        operator.execute()
+    with pytest.raises(OperatorError) as e:
+        ExecutionPlan.from_operator(operator).execute()
+    assert e.value.message == expected.value.message
+    assert e.value.ctx["index"] == expected.value.ctx["index"]
+
+
+class Tracked(float):
+    alive = 0
+    peak = 0
+
+    def __new__(cls, value):
+        cls.alive += 1
+        cls.peak = max(cls.peak, cls.alive)
+        return super().__new__(cls, value)
+
+    def __del__(self):
+        type(self).alive -= 1
+
+
+def track(i: t.Any) -> t.Annotated[t.Any, Output(callback=identity)]:
+    return Tracked(i)
+
+
+def total(*i: t.Any) -> t.Annotated[float, Output(callback=identity, num_outputs=0)]:
+    return float(sum(i))
+
+
+operators["track"] = OperatorFn.from_def(
+    track, param_parser=StandardParamParser(), implicit="input"
+)
+operators["total"] = OperatorFn.from_def(
+    total, param_parser=StandardParamParser(), implicit="input"
+)
+
+
+def test_plan_releases_values():
+    # a chain keeps a single intermediate value alive
+    plan = ExecutionPlan.from_operator(
+        get_operator("-total -track -track -track -track 1")
+    )
+    Tracked.alive = Tracked.peak = 0
+    assert plan.execute() == 1
+    assert Tracked.alive == 0
+    assert Tracked.peak <= 2
+
+
+def test_plan_low_memory_order():
+    input = "-total [ -track 1 -total [ -track 2 -track 3 -track 4 ] ]"
+    operator = get_operator(input)
+    Tracked.alive = Tracked.peak = 0
+    assert ExecutionPlan.from_operator(operator).execute() == 10
+    assert Tracked.peak == 4
+    Tracked.alive = Tracked.peak = 0
+    assert ExecutionPlan.from_operator(operator, low_memory=True).execute() == 10
+    assert Tracked.peak == 3
@@ -0,0 +1,147 @@
+# type: ignore
+import asyncio
+import json
+import os
+import typing as t
+
+import pytest
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.executor import ProcessExecutor, SerialExecutor, ThreadExecutor
+from clios.core.operator import SharedOperator, SimpleOperator
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.optimizer import share_common_operators
+from clios.core.param_info import Output
+from clios.core.plan import ExecutionPlan
+from clios.core.profiler import Profiler
+
+
+def identity(value):
+    return value
+
+
+floatOut = t.Annotated[float, Output(callback=identity, num_outputs=0)]
+
+
+def sub(i: float, j: float) -> floatOut:
+    return i - j
+
+
+def mean(*i: float) -> floatOut:
+    return sum(i) / len(i)
+
+
+operators = OperatorFns()
+for func in (sub, mean):
+    operators[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+
+
+def get_phases(profiler, operator):
+    _, phases = profiler.get_totals().get(id(operator), (operator, {}))
+    return set(phases)
+
+
+def get_operator(profiler):
+    input = "-mean [ -sub 3 1 -sub 3 1 2 ]".split()
+    parsed = CliParser().get_operator(operators, input, profiler=profiler)
+    operator = share_common_operators(parsed)
+    profiler.remap(parsed, operator)
+    return operator
+
+
+@pytest.mark.parametrize(
+    "execute",
+    [
+        lambda op, executor: op.execute(executor),
+        lambda op, executor: ExecutionPlan.from_operator(op).execute(executor=executor),
+        lambda op, executor: asyncio.run(op.execute_async(executor)),
+    ],
+)
+def test_profile_phases(execute):
+    profiler = Profiler()
+    operator = get_operator(profiler)
+    assert execute(operator, SerialExecutor(profiler=profiler)) == pytest.approx(2)
+    assert get_phases(profiler, operator) == {"root"}
+    mean_op = operator.input
+    assert get_phases(profiler, mean_op) == {"build", "validate", "callback", "output"}
+    shared, _, value = mean_op.inputs
+    assert isinstance(shared, SharedOperator)
+    # the spans of the parsed duplicate are moved to the shared operator
+    build_spans = [
+        span
+        for span in profiler.spans
+        if span.operator is shared.input and span.phase == "build"
+    ]
+    assert len(build_spans) == 2
+    assert get_phases(profiler, shared.input) == {
+        "build",
+        "validate",
+        "callback",
+        "output",
+    }
+    assert isinstance(value, SimpleOperator)
+    assert get_phases(profiler, value) == {"build"}
+
+
+def test_profile_threads():
+    profiler = Profiler()
+    operator = get_operator(profiler)
+    with ThreadExecutor(max_workers=2, profiler=profiler) as executor:
+        assert operator.execute(executor) == pytest.approx(2)
+    callbacks = [span for span in profiler.spans if span.phase == "callback"]
+    assert len(callbacks) == 2
+    assert all(span.duration >= 0 for span in profiler.spans)
+
+
+def test_no_profiler():
+    input = "-mean [ -sub 3 1 2 ]".split()
+    operator = CliParser().get_operator(operators, input)
+    assert operator.execute(SerialExecutor()) == pytest.approx(2)
+
+
+def test_profile_processes():
+    profiler = Profiler()
+    operator = get_operator(profiler)
+    with ProcessExecutor(max_workers=2, profiler=profiler) as executor:
+        assert operator.execute(executor) == pytest.approx(2)
+    shared = operator.input.inputs[0]
+    spans = [span for span in profiler.spans if span.operator is shared.input]
+    assert {span.phase for span in spans} == {
+        "build",
+        "execute",
+        "validate",
+        "callback",
+        "output",
+    }
+    # the shared operator is executed by a worker process
+    assert {span.pid for span in spans if span.phase == "execute"} != {os.getpid()}
+
+
+def test_write_trace(tmp_path):
+    profiler = Profiler()
+    operator = get_operator(profiler)
+    operator.execute(SerialExecutor(profiler=profiler))
+    path = tmp_path / "trace.json"
+    profiler.write_trace(path)
+    events = json.loads(path.read_text())["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    names = {event["name"] for event in spans}
+    assert {"parse", "tokenize", "build", "mean", "sub", "validate"} <= names
+    (parse,) = (event for event in spans if event["name"] == "parse")
+    (tokenize,) = (event for event in spans if event["name"] == "tokenize")
+    assert parse["ts"] <= tokenize["ts"]
+    assert tokenize["ts"] + tokenize["dur"] <= parse["ts"] + parse["dur"]
+    # the validation spans are nested within the execution of the operator
+    (mean_op,) = (event for event in spans if event["name"] == "mean")
+    (mean_validate,) = (
+        event
+        for event in spans
+        if event["name"] == "validate" and event["args"]["operator"] == "mean"
+    )
+    assert mean_op["ts"] <= mean_validate["ts"]
+    assert mean_validate["ts"] + mean_validate["dur"] <= mean_op["ts"] + mean_op["dur"]
+    assert all(event["pid"] == os.getpid() for event in events)
+    assert all(isinstance(event["tid"], int) for event in spans)
@@ -0,0 +1,117 @@
+# type: ignore
+import typing as t
+
+import pytest
+
+from clios.cli.main_parser import CliParser
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFn, OperatorFns
+from clios.core.param_info import Output
+from clios.core.plan import ExecutionPlan
+from clios.core.spill import PickleSerializer, Spilled, SpillStore
+
+
+def identity(value):
+    return value
+
+
+def make(i: int) -> t.Annotated[list[int], Output(callback=identity)]:
+    return [i] * 1000
+
+
+def total(*i: t.Any) -> t.Annotated[int, Output(callback=identity, num_outputs=0)]:
+    return sum(sum(value) for value in i)
+
+
+def make_fn(i: int) -> t.Annotated[t.Any, Output(callback=identity)]:
+    return lambda: i
+
+
+def call(*i: t.Any) -> t.Annotated[int, Output(callback=identity, num_outputs=0)]:
+    return sum(f() for f in i)
+
+
+operators = OperatorFns()
+for func in (make, total, make_fn, call):
+    operators[func.__name__] = OperatorFn.from_def(
+        func, param_parser=StandardParamParser(), implicit="input"
+    )
+
+
+def get_plan(input: str):
+    operator = CliParser().get_operator(operator_fns=operators, input=input.split())
+    return ExecutionPlan.from_operator(operator)
+
+
+class Recorder(PickleSerializer):
+    def __init__(self):
+        self.dumped = []
+
+    def dump(self, value, path):
+        self.dumped.append(value)
+        super().dump(value, path)
+
+
+def test_spill_intermediate_values(tmp_path):
+    plan = get_plan("-total [ -make 1 -make 2 -make 3 ]")
+    with SpillStore(threshold=0, directory=tmp_path) as spill:
+        recorder = Recorder()
+        spill.register(list, recorder)
+        assert plan.execute(spill=spill) == 6000
+        # the value used by the next instruction is kept in memory
+        assert spill.num_spilled == 2
+        assert recorder.dumped == [[1] * 1000, [2] * 1000]
+        assert spill.spilled_size > 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_below_threshold(tmp_path):
+    plan = get_plan("-total [ -make 1 -make 2 -make 3 ]")
+    with SpillStore(threshold=2**30, directory=tmp_path) as spill:
+        assert plan.execute(spill=spill) == 6000
+    assert spill.num_spilled == 0
+
+
+def test_unpicklable_values_are_kept_in_memory(tmp_path):
+    plan = get_plan("-call [ -make_fn 1 -make_fn 2 -make_fn 3 ]")
+    with SpillStore(threshold=0, directory=tmp_path) as spill:
+        assert plan.execute(spill=spill) == 6
+    assert spill.num_spilled == 0
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+def test_get_serializer():
+    spill = SpillStore(threshold=0)
+    serializer = PickleSerializer()
+    spill.register(Base, serializer)
+    assert spill.get_serializer(Derived, Derived()) is serializer
+    assert spill.get_serializer(t.Any, Derived()) is serializer
+    assert spill.get_serializer(int, 1) is not serializer
+    spill.register(f"{__name__}.Derived", PickleSerializer())
+    assert spill.get_serializer(Derived, Derived()) is not serializer
+
+
+def test_numpy_arrays_are_memory_mapped(tmp_path):
+    np = pytest.importorskip("numpy")
+    spill = SpillStore(threshold=0, directory=tmp_path)
+    values = [np.arange(10), np.array([object()]), np.arange(3)]
+    spill.add(values, 0, np.ndarray)
+    spill.add(values, 1, np.ndarray)
+    spill.add(values, 2, t.Any, keep=(2,))
+    assert isinstance(values[0], Spilled)
+    assert values[0].path.suffix == ".npy"
+    assert isinstance(values[1], Spilled)
+    assert values[1].path.suffix == ".pkl"
+    loaded = spill.load(values[0])
+    assert isinstance(loaded, np.memmap)
+    assert loaded.tolist() == list(range(10))
+    spill.release(0)
+    assert not values[0].path.exists()
+    spill.cleanup()
@@ -0,0 +1,122 @@
+# type: ignore
+import typing as t
+
+import pytest
+from pydantic import BeforeValidator, ValidationError
+from typing_extensions import Doc
+
+from clios.cli.param_parser import StandardParamParser
+from clios.core.operator_fn import OperatorFn
+from clios.core.param_info import Input, Output, Param
+from clios.core.type_adapters import TypeAdapters, strip_metadata, type_adapters
+
+param_parser = StandardParamParser()
+
+
+def double(value):
+    return value * 2
+
+
+def scale(
+    i: float,
+    j: t.Annotated[float, Input(), Doc("the second input")],
+    *,
+    factor: t.Annotated[float, Param(), Doc("the factor")] = 1.0,
+) -> t.Annotated[float, Output()]:
+    return (i + j) * factor
+
+
+def strict_scale(i: float, *, factor: t.Annotated[float, Param(strict=True)]) -> float:
+    return i * factor
+
+
+def doubled(i: t.Annotated[int, Param(build_phase_validators=(double,))]) -> int:
+    return i
+
+
+def test_strip_metadata():
+    assert strip_metadata(float) is float
+    assert strip_metadata(t.Annotated[float, Param(), Doc("a float")]) is float
+    validator = BeforeValidator(double)
+    assert (
+        strip_metadata(t.Annotated[float, Param(), validator])
+        == t.Annotated[float, validator]
+    )
+
+
+def test_shared_across_parameters():
+    operator_fn = OperatorFn.from_def(scale, param_parser, implicit="input")
+    i, j, factor = operator_fn.parameters
+    # the same type, validators, strictness and phase share a type adapter
+    assert i.build_phase_validator is j.build_phase_validator
+    assert i.build_phase_validator is factor.build_phase_validator
+    assert i.execute_phase_validator is factor.execute_phase_validator
+    assert operator_fn.output.validator is i.build_phase_validator
+    assert i.build_phase_batch_validator is factor.build_phase_batch_validator
+
+
+def test_not_shared_across_strictness_and_validators():
+    float_validator = (
+        OperatorFn.from_def(scale, param_parser, "param")
+        .parameters[0]
+        .build_phase_validator
+    )
+    strict = OperatorFn.from_def(strict_scale, param_parser, "param").parameters[1]
+    assert strict.build_phase_validator is not float_validator
+    with pytest.raises(ValidationError):
+        strict.build_phase_validator.validate_python("1.0")
+
+    param = OperatorFn.from_def(doubled, param_parser, "param").parameters[0]
+    assert param.build_phase_validator.validate_python(2) == 4
+    assert param.execute_phase_validator.validate_python(2) == 2
+
+
+def test_stats():
+    adapters = TypeAdapters()
+    assert adapters.get(float) is adapters.get(t.Annotated[float, Param()])
+    adapters.get(int)
+    stats = adapters.stats()
+    assert (stats.hits, stats.misses, stats.uncached) == (1, 2, 0)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+    adapters.clear()
+    assert adapters.stats().hit_rate == 0.0
+
+
+def test_union_order():
+    adapters = TypeAdapters()
+    # equal annotations, validated differently
+    int_first, float_first = adapters.get(int | float), adapters.get(float | int)
+    assert int_first is not float_first
+    assert int_first.validate_python("2") == 2
+    assert isinstance(float_first.validate_python("2"), float)
+    assert adapters.get(list[int | float]) is not adapters.get(list[float | int])
+    assert adapters.get(int | float) is int_first
+
+
+def get_int(value: str) -> int | float:
+    return value
+
+
+def get_float(value: str) -> float | int:
+    return value
+
+
+def test_return_value_union_order():
+    int_first = OperatorFn.from_def(get_int, param_parser, "param")
+    float_first = OperatorFn.from_def(get_float, param_parser, "param")
+    assert int_first.output.validator.validate_python("2") == 2
+    assert isinstance(float_first.output.validator.validate_python("2"), float)
+
+
+def test_unhashable_annotation():
+    adapters = TypeAdapters()
+    annotation = t.Annotated[float, [1]]
+    assert adapters.get(annotation) is not adapters.get(annotation)
+    assert adapters.stats().uncached == 2
+    assert adapters.get(annotation).validate_python("1.5") == 1.5
+
+
+def test_global_stats():
+    before = type_adapters.stats()
+    OperatorFn.from_def(scale, param_parser, implicit="input")
+    assert type_adapters.stats().hits > before.hits
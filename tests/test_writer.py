@@ -0,0 +1,85 @@
+# type: ignore
+import threading
+from pathlib import Path
+
+import pytest
+
+from clios.core.executor import SerialExecutor
+from clios.core.operator import RootOperator, SimpleOperator
+from clios.core.param_info import Output
+from clios.core.profiler import Profiler
+from clios.core.writer import write_outputs
+
+
+def write_text(value, path):
+    with open(path, "w") as f:
+        f.write(value)
+
+
+def test_write_outputs_concurrently(tmp_path):
+    # each writer waits for the other one, which fails if they are serial
+    barrier = threading.Barrier(2, timeout=5)
+
+    def write(value, path):
+        barrier.wait()
+        write_text(value, path)
+
+    paths = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    profiler = Profiler()
+    operator = SimpleOperator("text", 0, "text")
+    write_outputs("text", (write, write), paths, profiler, operator)
+    assert sorted(write.path for write in profiler.writes) == paths
+    assert all(write.size == 4 for write in profiler.writes)
+    spans = [span for span in profiler.spans if span.phase == "write"]
+    assert len({span.tid for span in spans}) == 2
+
+
+def test_write_outputs_error(tmp_path):
+    written = []
+
+    def fail(value, path):
+        raise OSError(path)
+
+    def write(value, path):
+        written.append(path)
+
+    with pytest.raises(OSError, match="first"):
+        write_outputs("text", (fail, write, fail), ("first", "second", "third"))
+    # the other outputs are written anyway
+    assert written == ["second"]
+
+
+def test_write_outputs_mismatch():
+    with pytest.raises(ValueError):
+        write_outputs("text", (write_text,), ("a", "b"))
+
+
+def test_root_operator_writers(tmp_path):
+    paths = (str(tmp_path / "a.txt"), str(tmp_path / "b.txt"))
+    root = RootOperator(
+        input=SimpleOperator("text", 0, "text"),
+        callback=print,
+        args=paths,
+        writers=(write_text, write_text),
+    )
+    profiler = Profiler()
+    assert root.execute(SerialExecutor(profiler=profiler)) is None
+    assert [Path(path).read_text() for path in paths] == ["text", "text"]
+    assert {write.path for write in profiler.writes} == set(paths)
+    # the writes are recorded within the output of the root operator
+    (root_span,) = (span for span in profiler.spans if span.phase == "root")
+    for span in profiler.spans:
+        if span.phase == "write":
+            assert root_span.start <= span.start <= span.end <= root_span.end
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"callback": print, "writers": (write_text,)},
+        {"writers": (write_text,), "num_outputs": 2},
+    ],
+)
+def test_output_writers_invalid(kwargs):
+    with pytest.raises(ValueError):
+        Output(**kwargs)